@@ -0,0 +1,130 @@
+"""Partition trends by timestamp (weekly ranges)
+
+Revision ID: 002_partition_trends
+Revises: 001_initial
+Create Date: 2026-10-18
+
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '002_partition_trends'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Weekly partitions created ahead of now; the maintenance task keeps this topped up
+PREMAKE_WEEKS = 4
+
+TREND_COLUMNS = (
+    "trend_id, topic_name, platform, engagement_metrics, trend_velocity, timestamp, "
+    "relevance_score, related_hashtags, platform_trend_id, created_at, updated_at"
+)
+
+# Must match TrendPartition in src/services/trend_partitions.py (Monday-aligned UTC weeks)
+PARTITION_SPAN = timedelta(weeks=1)
+
+TREND_INDEXES = {
+    'ix_trends_platform_timestamp': ['platform', 'timestamp'],
+    'ix_trends_relevance_score': ['relevance_score'],
+    'ix_trends_timestamp': ['timestamp'],
+}
+
+
+def _move_trends_table(new_name: str) -> None:
+    """Rename trends along with the index-backed names that would collide with a new trends table"""
+    op.execute(f"ALTER TABLE trends RENAME TO {new_name}")
+    op.execute(f"ALTER TABLE {new_name} RENAME CONSTRAINT trends_pkey TO {new_name}_pkey")
+    op.execute(
+        f"ALTER TABLE {new_name} RENAME CONSTRAINT uq_trends_platform_trend_id_timestamp "
+        f"TO uq_{new_name}_platform_trend_id_timestamp"
+    )
+    for index_name in TREND_INDEXES:
+        op.execute(f"ALTER INDEX {index_name} RENAME TO {index_name.replace('trends', new_name, 1)}")
+
+
+def _create_weekly_partitions(start: datetime, end: datetime) -> None:
+    """Create the weekly partitions covering [start, end]"""
+    week = start.astimezone(timezone.utc).date()
+    week -= timedelta(days=week.weekday())
+    while week <= end.astimezone(timezone.utc).date():
+        following = week + PARTITION_SPAN
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS trends_p{week:%Y%m%d} PARTITION OF trends "
+            f"FOR VALUES FROM ('{week.isoformat()} 00:00:00+00') TO ('{following.isoformat()} 00:00:00+00')"
+        )
+        week = following
+
+
+def _create_indexes() -> None:
+    for index_name, columns in TREND_INDEXES.items():
+        op.create_index(index_name, 'trends', columns)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    _move_trends_table('trends_legacy')
+
+    # Primary and unique keys on a partitioned table must include the partition key
+    op.execute("""
+        CREATE TABLE trends (
+            trend_id uuid NOT NULL,
+            topic_name varchar(500) NOT NULL,
+            platform platform NOT NULL,
+            engagement_metrics json NOT NULL,
+            trend_velocity double precision NOT NULL,
+            timestamp timestamptz NOT NULL DEFAULT now(),
+            relevance_score double precision,
+            related_hashtags json,
+            platform_trend_id varchar NOT NULL,
+            created_at timestamptz NOT NULL DEFAULT now(),
+            updated_at timestamptz NOT NULL DEFAULT now(),
+            CONSTRAINT trends_pkey PRIMARY KEY (trend_id, timestamp),
+            CONSTRAINT uq_trends_platform_trend_id_timestamp UNIQUE (platform, platform_trend_id, timestamp),
+            CONSTRAINT check_relevance_score_range CHECK (relevance_score >= 0.0 AND relevance_score <= 1.0)
+        ) PARTITION BY RANGE (timestamp)
+    """)
+    _create_indexes()
+
+    # Catch-all for rows outside the managed weekly ranges
+    op.execute("CREATE TABLE trends_default PARTITION OF trends DEFAULT")
+
+    now = datetime.now(timezone.utc)
+    oldest = bind.execute(sa.text("SELECT min(timestamp) FROM trends_legacy")).scalar() or now
+    _create_weekly_partitions(min(oldest, now), now + PARTITION_SPAN * PREMAKE_WEEKS)
+
+    op.execute(f"INSERT INTO trends ({TREND_COLUMNS}) SELECT {TREND_COLUMNS} FROM trends_legacy")
+    op.drop_table('trends_legacy')
+
+
+def downgrade() -> None:
+    _move_trends_table('trends_partitioned')
+
+    op.create_table(
+        'trends',
+        sa.Column('trend_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('topic_name', sa.String(length=500), nullable=False),
+        sa.Column('platform', postgresql.ENUM(name='platform', create_type=False), nullable=False),
+        sa.Column('engagement_metrics', postgresql.JSON(astext_type=sa.Text()), nullable=False),
+        sa.Column('trend_velocity', sa.Float(), nullable=False),
+        sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('relevance_score', sa.Float(), nullable=True),
+        sa.Column('related_hashtags', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.Column('platform_trend_id', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('trend_id'),
+        sa.CheckConstraint('relevance_score >= 0.0 AND relevance_score <= 1.0', name='check_relevance_score_range')
+    )
+    _create_indexes()
+    op.create_unique_constraint('uq_trends_platform_trend_id_timestamp', 'trends', ['platform', 'platform_trend_id', 'timestamp'])
+
+    op.execute(f"INSERT INTO trends ({TREND_COLUMNS}) SELECT {TREND_COLUMNS} FROM trends_partitioned")
+    # Dropping the parent drops every attached partition
+    op.drop_table('trends_partitioned')
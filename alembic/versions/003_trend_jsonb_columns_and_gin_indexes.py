@@ -0,0 +1,52 @@
+"""Convert trend JSON columns to JSONB and index hashtags and hot metrics
+
+Revision ID: 003_trend_jsonb
+Revises: 002_partition_trends
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003_trend_jsonb'
+down_revision: Union[str, None] = '002_partition_trends'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Metrics with expression indexes; must match INDEXED_METRICS in src/services/trend_storage.py
+INDEXED_METRICS = ('likes', 'views')
+
+
+def upgrade() -> None:
+    # Type changes on the partitioned parent cascade to every partition
+    op.execute(
+        "ALTER TABLE trends "
+        "ALTER COLUMN engagement_metrics TYPE jsonb USING engagement_metrics::jsonb, "
+        "ALTER COLUMN related_hashtags TYPE jsonb USING related_hashtags::jsonb"
+    )
+
+    # jsonb_path_ops is smaller and faster than the default opclass, and
+    # supports the @> containment operator used for hashtag filters
+    op.execute(
+        "CREATE INDEX ix_trends_related_hashtags ON trends "
+        "USING gin (related_hashtags jsonb_path_ops)"
+    )
+    for metric in INDEXED_METRICS:
+        op.execute(
+            f"CREATE INDEX ix_trends_engagement_{metric} ON trends "
+            f"(((engagement_metrics ->> '{metric}')::numeric))"
+        )
+
+
+def downgrade() -> None:
+    for metric in INDEXED_METRICS:
+        op.drop_index(f'ix_trends_engagement_{metric}', table_name='trends')
+    op.drop_index('ix_trends_related_hashtags', table_name='trends')
+
+    op.execute(
+        "ALTER TABLE trends "
+        "ALTER COLUMN engagement_metrics TYPE json USING engagement_metrics::json, "
+        "ALTER COLUMN related_hashtags TYPE json USING related_hashtags::json"
+    )
@@ -0,0 +1,34 @@
+"""Index hashtags case-insensitively
+
+Revision ID: 004_hashtags_lower
+Revises: 003_trend_jsonb
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004_hashtags_lower'
+down_revision: Union[str, None] = '003_trend_jsonb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Must match hashtags_expression() in src/services/trend_storage.py;
+    # hashtags keep their original case and are lowercased for matching only
+    op.execute(
+        "CREATE INDEX ix_trends_related_hashtags_lower ON trends "
+        "USING gin ((lower(related_hashtags::text)::jsonb) jsonb_path_ops)"
+    )
+    op.drop_index('ix_trends_related_hashtags', table_name='trends')
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE INDEX ix_trends_related_hashtags ON trends "
+        "USING gin (related_hashtags jsonb_path_ops)"
+    )
+    op.drop_index('ix_trends_related_hashtags_lower', table_name='trends')
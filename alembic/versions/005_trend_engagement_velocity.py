@@ -0,0 +1,27 @@
+"""Add engagement velocity to trends
+
+Revision ID: 005_engagement_velocity
+Revises: 004_hashtags_lower
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005_engagement_velocity'
+down_revision: Union[str, None] = '004_hashtags_lower'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Engagement gained per hour, kept apart from the posts-per-hour trend_velocity.
+    # Added on the partitioned parent, so every partition gets the column.
+    op.add_column('trends', sa.Column('engagement_velocity', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('trends', 'engagement_velocity')
@@ -0,0 +1,254 @@
+"""Fake MCP server for offline load and soak testing
+
+Serves the social media and OpenClaw tools with their real schemas, but
+answers from generated data with configurable payload size, latency
+distribution, per-platform rate limits and failure rate. Run it over HTTP
+with ``scripts/run_fake_mcp.py`` or in-process via ``create_server()``.
+"""
+
+from mcp.server import Server
+from mcp.types import Tool, TextContent, EmbeddedResource
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import random
+import time
+import uuid
+
+from mcp_servers import openclaw, social_media
+from mcp_servers.payloads import encode_payload
+
+logger = logging.getLogger(__name__)
+
+PLATFORM_TOOLS = {
+    "fetch_twitter_trends": "twitter",
+    "fetch_tiktok_trends": "tiktok",
+    "fetch_instagram_trends": "instagram",
+}
+
+# Vocabulary for generated topics and hashtags
+TOPIC_PREFIXES = ["AI", "Open Source", "Quantum", "Rust", "Crypto", "Climate", "Space", "Robotics", "Gaming", "Fintech"]
+TOPIC_SUBJECTS = ["Agents", "Chips", "Startups", "Layoffs", "Launch", "Regulation", "Benchmarks", "Art", "Tutorials", "Hardware"]
+
+
+@dataclass
+class FakeBehavior:
+    """How the fake server answers; every field can be tuned per load test"""
+    # Payload size
+    max_trends: int = 50  # Upper bound on trends per platform (across pages), whatever ``limit`` asks
+    hashtags_per_trend: int = 3
+    description_chars: int = 0  # Adds a filler ``description`` to grow each trend
+    # Latency: lognormal around ``latency_ms`` with occasional spikes
+    latency_ms: float = 50.0
+    latency_sigma: float = 0.5
+    spike_rate: float = 0.0
+    spike_ms: float = 2000.0
+    # Rate limits per platform, answered like a 429 with retry_after
+    rate_limit_per_window: Optional[int] = None
+    rate_limit_window: float = 60.0
+    # Share of calls that fail with a tool error
+    failure_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+@dataclass
+class _Window:
+    limit: int
+    reset_at: float
+    remaining: int
+
+
+@dataclass
+class _FakeState:
+    behavior: FakeBehavior
+    rng: random.Random
+    windows: Dict[str, _Window] = field(default_factory=dict)
+    agents: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    messages: List[Dict[str, Any]] = field(default_factory=list)
+    calls: Dict[str, int] = field(default_factory=dict)
+
+
+async def _delay(state: _FakeState) -> None:
+    behavior = state.behavior
+    seconds = state.rng.lognormvariate(0, behavior.latency_sigma) * behavior.latency_ms / 1000
+    if state.rng.random() < behavior.spike_rate:
+        seconds += behavior.spike_ms / 1000
+    await asyncio.sleep(seconds)
+
+
+def _take_request(state: _FakeState, platform: str) -> Optional[Dict[str, Any]]:
+    """Spend one request of the platform's window, returning the rate limit answer if none are left"""
+    behavior = state.behavior
+    if behavior.rate_limit_per_window is None:
+        return None
+    now = time.time()
+    window = state.windows.get(platform)
+    if window is None or now >= window.reset_at:
+        window = _Window(behavior.rate_limit_per_window, now + behavior.rate_limit_window, behavior.rate_limit_per_window)
+        state.windows[platform] = window
+    if window.remaining <= 0:
+        return {
+            "status": "rate_limited",
+            "platform": platform,
+            "retry_after": round(window.reset_at - now, 3),
+            "message": "Too Many Requests"
+        }
+    window.remaining -= 1
+    return None
+
+
+def _rate_limit_status(state: _FakeState, platform: str) -> Optional[Dict[str, Any]]:
+    window = state.windows.get(platform)
+    if window is None:
+        return None
+    return {
+        "remaining_requests": window.remaining,
+        "reset_timestamp": window.reset_at,
+        "limit_per_window": window.limit
+    }
+
+
+def generate_trends(rng: random.Random, platform: str, count: int, behavior: FakeBehavior) -> List[Dict[str, Any]]:
+    """Trends in the social media tool output shape"""
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    trends = []
+    for _ in range(count):
+        topic = f"{rng.choice(TOPIC_PREFIXES)} {rng.choice(TOPIC_SUBJECTS)}"
+        tags = {"#" + topic.replace(" ", "")}
+        while len(tags) < behavior.hashtags_per_trend:
+            tags.add("#" + rng.choice(TOPIC_PREFIXES + TOPIC_SUBJECTS).replace(" ", ""))
+        views = rng.randint(10_000, 5_000_000)
+        trend = {
+            "topic_name": topic,
+            "platform": platform,
+            "engagement_metrics": {
+                "likes": int(views * rng.uniform(0.01, 0.1)),
+                "shares": int(views * rng.uniform(0.001, 0.02)),
+                "comments": int(views * rng.uniform(0.001, 0.01)),
+                "views": views
+            },
+            "trend_velocity": round(rng.uniform(5, 1500), 2),
+            "related_hashtags": sorted(tags),
+            "timestamp": (now - timedelta(seconds=rng.randint(0, 3600))).isoformat(),
+            "platform_trend_id": f"{platform}_{uuid.UUID(int=rng.getrandbits(128)).hex[:12]}"
+        }
+        if behavior.description_chars:
+            trend["description"] = ("lorem ipsum " * (behavior.description_chars // 12 + 1))[:behavior.description_chars]
+        trends.append(trend)
+    return trends
+
+
+async def _fetch_platform(state: _FakeState, platform: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    await _delay(state)
+    limited = _take_request(state, platform)
+    if limited is not None:
+        return limited
+    if state.rng.random() < state.behavior.failure_rate:
+        raise RuntimeError(f"Simulated {platform} API failure")
+    limit = min(int(args.get("limit", 10)), state.behavior.max_trends)
+    start, end, next_cursor = social_media.page_bounds(limit, args.get("cursor"), args.get("page_size"))
+    trends = generate_trends(state.rng, platform, end - start, state.behavior)
+    if args.get("since"):
+        trends = [
+            t for t in trends
+            if social_media.is_after(datetime.fromisoformat(t["timestamp"]), args["since"])
+        ]
+    payload = {
+        "status": "ok",
+        "platform": platform,
+        "trends": trends,
+        "next_cursor": next_cursor
+    }
+    rate_limit = _rate_limit_status(state, platform)
+    if rate_limit is not None:
+        payload["rate_limit"] = rate_limit
+    return payload
+
+
+async def _fetch_batch(state: _FakeState, args: Dict[str, Any]) -> Dict[str, Any]:
+    async def one(spec: Dict[str, Any]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(_fetch_platform(state, spec["platform"], spec), spec.get("timeout"))
+        except asyncio.TimeoutError:
+            result = {"status": "error", "error": f"Timed out after {spec.get('timeout')}s"}
+        except Exception as e:
+            result = {"status": "error", "error": str(e)}
+        result.update(platform=spec["platform"], duration_ms=round((time.perf_counter() - start) * 1000))
+        return result
+
+    results = await asyncio.gather(*(one(spec) for spec in args.get("requests") or []))
+    failed = sum(r["status"] == "error" for r in results)
+    return {"status": "partial" if failed else "ok", "results": list(results)}
+
+
+async def _openclaw(state: _FakeState, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    await _delay(state)
+    if state.rng.random() < state.behavior.failure_rate:
+        raise RuntimeError("Simulated OpenClaw failure")
+    if name == "register_agent":
+        state.agents[args["agent_id"]] = {
+            "agent_id": args["agent_id"],
+            "capabilities": args.get("capabilities", []),
+            "endpoints": args.get("endpoints", {}),
+            "status": "available"
+        }
+        return {"status": "registered", "agent_id": args["agent_id"]}
+    if name == "update_agent_status":
+        agent = state.agents.setdefault(args["agent_id"], {"agent_id": args["agent_id"], "capabilities": []})
+        agent["status"] = args["status"]
+        return {"status": "updated", "agent_id": args["agent_id"], "new_status": args["status"]}
+    if name == "discover_agents":
+        wanted = set(args.get("capabilities") or [])
+        agents = [a for a in state.agents.values() if wanted <= set(a["capabilities"])]
+        return {"status": "ok", "agents": agents[:args.get("limit", 10)]}
+    state.messages.append({**args, "message_id": str(uuid.UUID(int=state.rng.getrandbits(128)))})
+    return {"status": "sent", "recipient_id": args["recipient_id"], "message_id": state.messages[-1]["message_id"]}
+
+
+def create_server(behavior: Optional[FakeBehavior] = None, name: str = "fake-mcp") -> Server:
+    """
+    Build a fake server implementing every social media and OpenClaw tool.
+
+    The server's ``fake_state`` attribute exposes registered agents, sent
+    messages, rate limit windows and per-tool call counts for assertions.
+    """
+    behavior = behavior or FakeBehavior()
+    server = Server(name)
+    state = _FakeState(behavior, random.Random(behavior.seed))
+    server.fake_state = state
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return [*await social_media.list_tools(), *await openclaw.list_tools()]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent | EmbeddedResource]:
+        state.calls[name] = state.calls.get(name, 0) + 1
+        if name in PLATFORM_TOOLS:
+            payload = await _fetch_platform(state, PLATFORM_TOOLS[name], arguments)
+        elif name == "fetch_trends_batch":
+            payload = await _fetch_batch(state, arguments)
+        elif name == "get_platform_status":
+            await _delay(state)
+            platform = arguments["platform"]
+            payload = {
+                "platform": platform,
+                "status": "connected",
+                "rate_limit_status": _rate_limit_status(state, platform)
+            }
+        elif name in ("register_agent", "update_agent_status", "discover_agents", "send_agent_message"):
+            payload = await _openclaw(state, name, arguments)
+        else:
+            raise ValueError(f"Unknown tool: {name}")
+        return encode_payload(payload, arguments.get("encoding"))
+
+    return server
+
+
+# Default fake server, for in-process use
+server = create_server()
+
+__all__ = ["FakeBehavior", "create_server", "generate_trends", "server"]
@@ -1,10 +1,12 @@
 """MCP Server for OpenClaw Agent Network Integration"""
 
 from mcp.server import Server
-from mcp.types import Tool, TextContent
+from mcp.types import Tool, TextContent, EmbeddedResource
 from typing import Any
 import logging
 
+from mcp_servers.payloads import AgentAck, AgentList, MessageReceipt, encode_payload, with_encoding
+
 logger = logging.getLogger(__name__)
 
 # Create MCP server instance
@@ -14,7 +16,7 @@ server = Server("openclaw-mcp")
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available tools for OpenClaw integration"""
-    return [
+    return with_encoding([
         Tool(
             name="register_agent",
             description="Register an agent with the OpenClaw network",
@@ -99,27 +101,28 @@ async def list_tools() -> list[Tool]:
                 "required": ["recipient_id", "message"]
             }
         )
-    ]
+    ])
 
 
 @server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Handle tool calls"""
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent | EmbeddedResource]:
+    """Handle tool calls, encoding the payload as the caller asked"""
     logger.info(f"OpenClaw tool called: {name} with arguments: {arguments}")
     
     if name == "register_agent":
-        return await _register_agent(arguments)
+        payload = await _register_agent(arguments)
     elif name == "update_agent_status":
-        return await _update_agent_status(arguments)
+        payload = await _update_agent_status(arguments)
     elif name == "discover_agents":
-        return await _discover_agents(arguments)
+        payload = await _discover_agents(arguments)
     elif name == "send_agent_message":
-        return await _send_agent_message(arguments)
+        payload = await _send_agent_message(arguments)
     else:
         raise ValueError(f"Unknown tool: {name}")
+    return encode_payload(payload, arguments.get("encoding"))
 
 
-async def _register_agent(args: dict[str, Any]) -> list[TextContent]:
+async def _register_agent(args: dict[str, Any]) -> AgentAck:
     """Register agent with OpenClaw"""
     agent_id = args.get("agent_id")
     capabilities = args.get("capabilities", [])
@@ -128,15 +131,10 @@ async def _register_agent(args: dict[str, Any]) -> list[TextContent]:
     # TODO: Implement actual OpenClaw registration
     logger.info(f"Registering agent {agent_id} with capabilities: {capabilities}")
     
-    return [
-        TextContent(
-            type="text",
-            text=f'{{"status": "not_implemented", "agent_id": "{agent_id}", "message": "OpenClaw registration pending"}}'
-        )
-    ]
+    return AgentAck(status="not_implemented", agent_id=agent_id, message="OpenClaw registration pending")
 
 
-async def _update_agent_status(args: dict[str, Any]) -> list[TextContent]:
+async def _update_agent_status(args: dict[str, Any]) -> AgentAck:
     """Update agent status"""
     agent_id = args.get("agent_id")
     status = args.get("status")
@@ -144,15 +142,10 @@ async def _update_agent_status(args: dict[str, Any]) -> list[TextContent]:
     # TODO: Implement actual status update
     logger.info(f"Updating status for agent {agent_id} to {status}")
     
-    return [
-        TextContent(
-            type="text",
-            text=f'{{"status": "not_implemented", "agent_id": "{agent_id}", "new_status": "{status}"}}'
-        )
-    ]
+    return AgentAck(status="not_implemented", agent_id=agent_id, new_status=status)
 
 
-async def _discover_agents(args: dict[str, Any]) -> list[TextContent]:
+async def _discover_agents(args: dict[str, Any]) -> AgentList:
     """Discover agents by capabilities"""
     capabilities = args.get("capabilities", [])
     limit = args.get("limit", 10)
@@ -160,15 +153,10 @@ async def _discover_agents(args: dict[str, Any]) -> list[TextContent]:
     # TODO: Implement actual agent discovery
     logger.info(f"Discovering agents with capabilities: {capabilities}")
     
-    return [
-        TextContent(
-            type="text",
-            text='{"status": "not_implemented", "agents": [], "message": "Agent discovery pending"}'
-        )
-    ]
+    return AgentList(status="not_implemented", message="Agent discovery pending")
 
 
-async def _send_agent_message(args: dict[str, Any]) -> list[TextContent]:
+async def _send_agent_message(args: dict[str, Any]) -> MessageReceipt:
     """Send message to another agent"""
     recipient_id = args.get("recipient_id")
     message = args.get("message")
@@ -177,12 +165,7 @@ async def _send_agent_message(args: dict[str, Any]) -> list[TextContent]:
     # TODO: Implement actual message sending
     logger.info(f"Sending {message_type} message to agent {recipient_id}")
     
-    return [
-        TextContent(
-            type="text",
-            text=f'{{"status": "not_implemented", "recipient_id": "{recipient_id}", "message": "Message sending pending"}}'
-        )
-    ]
+    return MessageReceipt(status="not_implemented", recipient_id=recipient_id, message="Message sending pending")
 
 
 # Export server for use in main application
@@ -0,0 +1,195 @@
+"""Typed tool payloads shared by the MCP servers and their clients
+
+Servers build these models instead of hand-written JSON and encode them
+with ``encode_payload``; clients decode any tool result with
+``decode_contents``. The encoding is negotiated per call: a caller passes
+``"encoding": "msgpack"`` in the tool arguments and gets the payload back
+as a msgpack blob (an embedded resource with ``MSGPACK_MIME``) instead of
+JSON text. Clients decode by content type, so a server that ignores the
+argument still answers in JSON and nothing breaks.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+import base64
+
+import msgpack
+import orjson
+from mcp.types import BlobResourceContents, EmbeddedResource, TextContent, Tool
+from pydantic import AnyUrl, BaseModel, ConfigDict
+
+JSON = "json"
+MSGPACK = "msgpack"
+ENCODINGS = (JSON, MSGPACK)
+
+MSGPACK_MIME = "application/msgpack"
+PAYLOAD_URI = AnyUrl("chimera://payload")
+
+# Input schema property every tool accepts
+ENCODING_PROPERTY = {
+    "type": "string",
+    "enum": list(ENCODINGS),
+    "description": "Response encoding (default: json)",
+    "default": JSON
+}
+
+
+class Payload(BaseModel):
+    """Base of every tool payload; unset optional fields are left out on the wire"""
+    model_config = ConfigDict(extra="allow")
+
+
+class EngagementMetrics(Payload):
+    likes: int = 0
+    shares: int = 0
+    comments: int = 0
+    views: int = 0
+
+
+class TrendPayload(Payload):
+    """One trend in the trend research output shape"""
+    topic_name: str
+    platform: str
+    engagement_metrics: EngagementMetrics = EngagementMetrics()
+    trend_velocity: float = 0.0
+    related_hashtags: List[str] = []
+    timestamp: str
+    platform_trend_id: str
+    description: Optional[str] = None
+
+
+class RateLimitStatus(Payload):
+    """Mirrors ``PlatformConnection.rate_limit_status``"""
+    remaining_requests: int
+    reset_timestamp: Union[float, str]
+    limit_per_window: int
+
+
+class TrendsPage(Payload):
+    """A platform fetch result: trends, or why there are none"""
+    status: str
+    platform: Optional[str] = None
+    trends: Optional[List[TrendPayload]] = None
+    next_cursor: Optional[str] = None
+    rate_limit: Optional[RateLimitStatus] = None
+    retry_after: Optional[float] = None
+    message: Optional[str] = None
+    error: Optional[str] = None
+    duration_ms: Optional[int] = None
+
+
+class TrendsBatch(Payload):
+    """fetch_trends_batch result, one page per requested platform in request order"""
+    status: str
+    results: List[TrendsPage]
+
+
+class PlatformStatus(Payload):
+    platform: str
+    status: str
+    rate_limit_status: Optional[RateLimitStatus] = None
+    message: Optional[str] = None
+
+
+class AgentRecord(Payload):
+    agent_id: str
+    capabilities: List[str] = []
+    endpoints: Dict[str, Any] = {}
+    status: str = "available"
+
+
+class AgentAck(Payload):
+    """register_agent / update_agent_status result"""
+    status: str
+    agent_id: Optional[str] = None
+    new_status: Optional[str] = None
+    message: Optional[str] = None
+
+
+class AgentList(Payload):
+    status: str
+    agents: List[AgentRecord] = []
+    message: Optional[str] = None
+
+
+class MessageReceipt(Payload):
+    status: str
+    recipient_id: Optional[str] = None
+    message_id: Optional[str] = None
+    message: Optional[str] = None
+
+
+def with_encoding(tools: Iterable[Tool]) -> List[Tool]:
+    """Add the ``encoding`` argument to each tool's input schema"""
+    tools = list(tools)
+    for tool in tools:
+        tool.inputSchema.setdefault("properties", {})["encoding"] = ENCODING_PROPERTY
+    return tools
+
+
+def to_data(payload: Union[Payload, Dict[str, Any]]) -> Dict[str, Any]:
+    """Plain dict of a payload, as clients receive it"""
+    if isinstance(payload, BaseModel):
+        return payload.model_dump(mode="json", exclude_none=True)
+    return payload
+
+
+def encode_payload(
+    payload: Union[Payload, Dict[str, Any]],
+    encoding: Optional[str] = None
+) -> List[Union[TextContent, EmbeddedResource]]:
+    """
+    Tool result contents for a payload.
+
+    Raises:
+        ValueError: If the encoding is not one of ENCODINGS
+    """
+    encoding = encoding or JSON
+    if encoding == JSON:
+        if isinstance(payload, BaseModel):
+            text = payload.model_dump_json(exclude_none=True)
+        else:
+            text = orjson.dumps(payload).decode()
+        return [TextContent(type="text", text=text)]
+    if encoding == MSGPACK:
+        blob = base64.b64encode(msgpack.packb(to_data(payload))).decode()
+        return [EmbeddedResource(
+            type="resource",
+            resource=BlobResourceContents(uri=PAYLOAD_URI, mimeType=MSGPACK_MIME, blob=blob)
+        )]
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def decode_contents(contents: Sequence[Any]) -> Dict[str, Any]:
+    """
+    Decode tool result contents from either encoding.
+
+    Non-JSON text comes back as ``{"text": ...}``.
+    """
+    for content in contents:
+        resource = getattr(content, "resource", None)
+        if isinstance(resource, BlobResourceContents) and resource.mimeType == MSGPACK_MIME:
+            return msgpack.unpackb(base64.b64decode(resource.blob))
+    text = "".join(c.text for c in contents if isinstance(c, TextContent))
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return {"text": text}
+
+
+__all__ = [
+    "AgentAck",
+    "AgentList",
+    "AgentRecord",
+    "ENCODINGS",
+    "EngagementMetrics",
+    "MessageReceipt",
+    "PlatformStatus",
+    "RateLimitStatus",
+    "TrendPayload",
+    "TrendsBatch",
+    "TrendsPage",
+    "decode_contents",
+    "encode_payload",
+    "to_data",
+    "with_encoding",
+]
@@ -1,12 +1,36 @@
 """MCP Server for Social Media APIs (Twitter, TikTok, Instagram)"""
 
 from mcp.server import Server
-from mcp.types import Tool, TextContent
-from typing import Any
+from mcp.types import Tool, TextContent, EmbeddedResource
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+import asyncio
+import base64
+import binascii
+import json
 import logging
+import os
+import time
+
+from mcp_servers.payloads import (
+    PlatformStatus,
+    TrendPayload,
+    TrendsBatch,
+    TrendsPage,
+    encode_payload,
+    with_encoding,
+)
 
 logger = logging.getLogger(__name__)
 
+# Topics served in sample mode, so agents and tests can exercise the full
+# discovery path without live API access
+SAMPLE_TOPICS = {
+    "twitter": ["AI Agents", "Open Source LLMs", "Rust 2.0", "Quantum Computing", "Tech Layoffs"],
+    "tiktok": ["AI Art Challenge", "Desk Setup Tour", "Coding ASMR", "Gadget Unboxing", "Study With Me"],
+    "instagram": ["#AIArt", "#TechStartups", "#SmartHome", "#WFHSetup", "#FutureOfWork"],
+}
+
 # Create MCP server instance
 server = Server("social-media-mcp")
 
@@ -14,7 +38,7 @@ server = Server("social-media-mcp")
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available tools for social media APIs"""
-    return [
+    return with_encoding([
         Tool(
             name="fetch_twitter_trends",
             description="Fetch trending topics from Twitter/X",
@@ -30,6 +54,18 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Location WOEID (default: worldwide)",
                         "default": "1"
+                    },
+                    "page_size": {
+                        "type": "integer",
+                        "description": "Trends per page; omit to get all trends up to limit in one response"
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from the previous page"
+                    },
+                    "since": {
+                        "type": "string",
+                        "description": "ISO 8601 time; only trends updated after it are returned, oldest first (delta sync)"
                     }
                 }
             }
@@ -49,6 +85,18 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Region code (default: US)",
                         "default": "US"
+                    },
+                    "page_size": {
+                        "type": "integer",
+                        "description": "Trends per page; omit to get all trends up to limit in one response"
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from the previous page"
+                    },
+                    "since": {
+                        "type": "string",
+                        "description": "ISO 8601 time; only trends updated after it are returned, oldest first (delta sync)"
                     }
                 }
             }
@@ -63,10 +111,68 @@ async def list_tools() -> list[Tool]:
                         "type": "integer",
                         "description": "Maximum number of trends to return",
                         "default": 10
+                    },
+                    "page_size": {
+                        "type": "integer",
+                        "description": "Trends per page; omit to get all trends up to limit in one response"
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from the previous page"
+                    },
+                    "since": {
+                        "type": "string",
+                        "description": "ISO 8601 time; only trends updated after it are returned, oldest first (delta sync)"
                     }
                 }
             }
         ),
+        Tool(
+            name="fetch_trends_batch",
+            description="Fetch trends from several platforms concurrently in one call",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "requests": {
+                        "type": "array",
+                        "description": "One spec per platform query; results come back in the same order",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "platform": {
+                                    "type": "string",
+                                    "enum": ["twitter", "tiktok", "instagram"],
+                                    "description": "Platform name"
+                                },
+                                "limit": {
+                                    "type": "integer",
+                                    "description": "Maximum number of trends to return",
+                                    "default": 10
+                                },
+                                "location": {
+                                    "type": "string",
+                                    "description": "Twitter location WOEID"
+                                },
+                                "region": {
+                                    "type": "string",
+                                    "description": "TikTok region code"
+                                },
+                                "timeout": {
+                                    "type": "number",
+                                    "description": "Seconds before this platform's query is abandoned"
+                                },
+                                "since": {
+                                    "type": "string",
+                                    "description": "ISO 8601 time; only trends updated after it are returned, oldest first"
+                                }
+                            },
+                            "required": ["platform"]
+                        }
+                    }
+                },
+                "required": ["requests"]
+            }
+        ),
         Tool(
             name="get_platform_status",
             description="Get connection status for a social media platform",
@@ -82,44 +188,45 @@ async def list_tools() -> list[Tool]:
                 "required": ["platform"]
             }
         )
-    ]
+    ])
 
 
 @server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Handle tool calls"""
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent | EmbeddedResource]:
+    """Handle tool calls, encoding the payload as the caller asked"""
     logger.info(f"Tool called: {name} with arguments: {arguments}")
     
     if name == "fetch_twitter_trends":
-        return await _fetch_twitter_trends(arguments)
+        payload = await _fetch_twitter_trends(arguments)
     elif name == "fetch_tiktok_trends":
-        return await _fetch_tiktok_trends(arguments)
+        payload = await _fetch_tiktok_trends(arguments)
     elif name == "fetch_instagram_trends":
-        return await _fetch_instagram_trends(arguments)
+        payload = await _fetch_instagram_trends(arguments)
+    elif name == "fetch_trends_batch":
+        payload = await _fetch_trends_batch(arguments)
     elif name == "get_platform_status":
-        return await _get_platform_status(arguments)
+        payload = await _get_platform_status(arguments)
     else:
         raise ValueError(f"Unknown tool: {name}")
+    return encode_payload(payload, arguments.get("encoding"))
 
 
-async def _fetch_twitter_trends(args: dict[str, Any]) -> list[TextContent]:
+async def _fetch_twitter_trends(args: dict[str, Any]) -> TrendsPage:
     """Fetch Twitter trends"""
     limit = args.get("limit", 10)
     location = args.get("location", "1")
     
     # TODO: Implement actual Twitter API call
-    # For now, return mock data structure
     logger.info(f"Fetching Twitter trends (limit={limit}, location={location})")
     
-    return [
-        TextContent(
-            type="text",
-            text='{"status": "not_implemented", "message": "Twitter API integration pending"}'
-        )
-    ]
+    if sample_mode():
+        return _sample_trends("twitter", limit, args.get("cursor"), args.get("page_size"), args.get("since"))
+    if not os.getenv("TWITTER_API_KEY"):
+        return _missing_credential("twitter", "TWITTER_API_KEY")
+    return TrendsPage(status="not_implemented", platform="twitter", message="Twitter API integration pending")
 
 
-async def _fetch_tiktok_trends(args: dict[str, Any]) -> list[TextContent]:
+async def _fetch_tiktok_trends(args: dict[str, Any]) -> TrendsPage:
     """Fetch TikTok trends"""
     limit = args.get("limit", 10)
     region = args.get("region", "US")
@@ -127,30 +234,148 @@ async def _fetch_tiktok_trends(args: dict[str, Any]) -> list[TextContent]:
     # TODO: Implement actual TikTok API call
     logger.info(f"Fetching TikTok trends (limit={limit}, region={region})")
     
-    return [
-        TextContent(
-            type="text",
-            text='{"status": "not_implemented", "message": "TikTok API integration pending"}'
-        )
-    ]
+    if sample_mode():
+        return _sample_trends("tiktok", limit, args.get("cursor"), args.get("page_size"), args.get("since"))
+    if not os.getenv("TIKTOK_API_KEY"):
+        return _missing_credential("tiktok", "TIKTOK_API_KEY")
+    return TrendsPage(status="not_implemented", platform="tiktok", message="TikTok API integration pending")
 
 
-async def _fetch_instagram_trends(args: dict[str, Any]) -> list[TextContent]:
+async def _fetch_instagram_trends(args: dict[str, Any]) -> TrendsPage:
     """Fetch Instagram trends"""
     limit = args.get("limit", 10)
     
     # TODO: Implement actual Instagram API call
     logger.info(f"Fetching Instagram trends (limit={limit})")
     
-    return [
-        TextContent(
-            type="text",
-            text='{"status": "not_implemented", "message": "Instagram API integration pending"}'
-        )
-    ]
+    if sample_mode():
+        return _sample_trends("instagram", limit, args.get("cursor"), args.get("page_size"), args.get("since"))
+    if not os.getenv("INSTAGRAM_API_KEY"):
+        return _missing_credential("instagram", "INSTAGRAM_API_KEY")
+    return TrendsPage(status="not_implemented", platform="instagram", message="Instagram API integration pending")
+
+
+def sample_mode() -> bool:
+    """
+    Whether SOCIAL_MEDIA_SAMPLE_MODE is set, serving sample trends for
+    every platform. Off by default, so a missing credential in production
+    is an error rather than sample data fed into discovery.
+    """
+    return os.getenv("SOCIAL_MEDIA_SAMPLE_MODE", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _missing_credential(platform: str, variable: str) -> TrendsPage:
+    logger.error(f"{variable} is not set; enable SOCIAL_MEDIA_SAMPLE_MODE for sample trends")
+    return TrendsPage(status="error", platform=platform, error=f"{variable} is not set")
+
+
+def encode_cursor(offset: int) -> str:
+    """Opaque pagination cursor for the trend at ``offset``"""
+    return base64.urlsafe_b64encode(json.dumps({"offset": offset}).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    """Offset encoded in a cursor (0 without one)"""
+    if not cursor:
+        return 0
+    try:
+        return int(json.loads(base64.urlsafe_b64decode(cursor.encode()))["offset"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def is_after(timestamp: datetime, since: Optional[str]) -> bool:
+    """Whether ``timestamp`` is later than a ``since`` marker (always, without one)"""
+    if not since:
+        return True
+    try:
+        marker = datetime.fromisoformat(since.replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"Invalid since: {since}")
+    if marker.tzinfo is None:
+        marker = marker.replace(tzinfo=timezone.utc)
+    return timestamp > marker
+
 
+def page_bounds(limit: int, cursor: Optional[str], page_size: Optional[int]) -> tuple[int, int, Optional[str]]:
+    """(start, end, next_cursor) of the requested page within ``limit`` trends"""
+    start = min(decode_cursor(cursor), limit)
+    end = limit if not page_size else min(limit, start + page_size)
+    return start, end, encode_cursor(end) if end < limit else None
 
-async def _get_platform_status(args: dict[str, Any]) -> list[TextContent]:
+
+def _sample_trends(
+    platform: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    since: Optional[str] = None
+) -> TrendsPage:
+    """
+    Deterministic sample trends in the trend research output shape.
+    
+    With ``page_size``, returns one page and a ``next_cursor`` while more
+    trends remain. With ``since``, only trends whose timestamp is later
+    are returned, oldest first, so a delta capped at ``limit`` can be
+    continued from its newest trend.
+    """
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    topics = SAMPLE_TOPICS[platform]
+    updated = [i for i in range(len(topics)) if is_after(now - timedelta(minutes=5 * i), since)]
+    if since:
+        updated.reverse()
+    start, end, next_cursor = page_bounds(min(limit, len(updated)), cursor, page_size)
+    trends = []
+    for i in updated[start:end]:
+        topic = topics[i]
+        tag = topic if topic.startswith("#") else "#" + topic.replace(" ", "")
+        trends.append(TrendPayload(
+            topic_name=topic.lstrip("#"),
+            platform=platform,
+            engagement_metrics={
+                "likes": 20000 - i * 3000,
+                "shares": 4000 - i * 500,
+                "comments": 1000 - i * 120,
+                "views": 250000 - i * 30000
+            },
+            trend_velocity=300.0 - i * 45,
+            related_hashtags=[tag],
+            timestamp=(now - timedelta(minutes=5 * i)).isoformat(),
+            platform_trend_id=f"{platform}_sample_{i}"
+        ))
+    
+    return TrendsPage(status="sample", platform=platform, trends=trends, next_cursor=next_cursor)
+
+
+async def _fetch_one(spec: dict[str, Any]) -> TrendsPage:
+    """Run one batch spec; errors are returned inline"""
+    platform = spec.get("platform")
+    start = time.perf_counter()
+    try:
+        handler = PLATFORM_HANDLERS.get(platform)
+        if handler is None:
+            raise ValueError(f"Unsupported platform: {platform}")
+        result = await asyncio.wait_for(handler(spec), timeout=spec.get("timeout"))
+    except asyncio.TimeoutError:
+        result = TrendsPage(status="error", error=f"Timed out after {spec.get('timeout')}s")
+    except Exception as e:
+        result = TrendsPage(status="error", error=str(e) or type(e).__name__)
+    result.platform = platform
+    result.duration_ms = round((time.perf_counter() - start) * 1000)
+    return result
+
+
+async def _fetch_trends_batch(args: dict[str, Any]) -> TrendsBatch:
+    """Fetch several platforms' trends concurrently, in request order"""
+    specs = args.get("requests") or []
+    logger.info(f"Fetching trend batch for {[s.get('platform') for s in specs]}")
+    
+    results = await asyncio.gather(*(_fetch_one(spec) for spec in specs))
+    failed = sum(r.status == "error" for r in results)
+    return TrendsBatch(status="partial" if failed else "ok", results=results)
+
+
+async def _get_platform_status(args: dict[str, Any]) -> PlatformStatus:
     """Get platform connection status"""
     platform = args.get("platform")
     
@@ -160,12 +385,15 @@ async def _get_platform_status(args: dict[str, Any]) -> list[TextContent]:
     # TODO: Implement actual status check
     logger.info(f"Checking status for platform: {platform}")
     
-    return [
-        TextContent(
-            type="text",
-            text=f'{{"platform": "{platform}", "status": "disconnected", "message": "Status check not implemented"}}'
-        )
-    ]
+    return PlatformStatus(platform=platform, status="disconnected", message="Status check not implemented")
+
+
+# Per-platform handlers used by fetch_trends_batch
+PLATFORM_HANDLERS = {
+    "twitter": _fetch_twitter_trends,
+    "tiktok": _fetch_tiktok_trends,
+    "instagram": _fetch_instagram_trends,
+}
 
 
 # Export server for use in main application
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark trend list serialization: pydantic response_model vs FastJSONResponse.
+
+Serves the same 100-trend page from two in-process FastAPI apps. The
+baseline validates TrendResponse models and lets FastAPI re-validate and
+encode the TrendListResponse, as GET /api/v1/trends did before. The fast
+path builds the payload dict directly and renders it with orjson. Requests
+go through httpx's ASGI transport, so numbers exclude network and database
+time and isolate serialization overhead.
+
+    python scripts/bench_json_responses.py --requests 5000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from fastapi import FastAPI
+
+from src.api.responses import FastJSONResponse
+from src.api.v1.routes.trends import (
+    TrendListResponse,
+    TrendResponse,
+    _build_list_response,
+)
+from src.models.trend import Platform, Trend
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def make_trends(count: int):
+    now = datetime.now(timezone.utc)
+    platforms = list(Platform)
+    return [
+        Trend(
+            trend_id=uuid.uuid4(),
+            topic_name=f"Topic {i}",
+            platform=platforms[i % len(platforms)],
+            engagement_metrics={"likes": i * 37, "shares": i * 3, "comments": i, "views": i * 1000},
+            trend_velocity=float(i),
+            timestamp=now - timedelta(minutes=i),
+            relevance_score=(i % 100) / 100,
+            related_hashtags=[f"#topic{i}", f"#tag{i % 7}"],
+            platform_trend_id=f"trend_{i}",
+        )
+        for i in range(count)
+    ]
+
+
+def build_apps(trends):
+    baseline = FastAPI()
+    fast = FastAPI()
+    platforms = [p.value for p in Platform]
+
+    @baseline.get("/trends", response_model=TrendListResponse)
+    async def baseline_trends():
+        return TrendListResponse(
+            trends=[TrendResponse.model_validate(t) for t in trends],
+            total=len(trends),
+            platforms=platforms,
+            timestamp=datetime.utcnow(),
+        ).model_dump(mode="json")
+
+    @fast.get("/trends", response_model=TrendListResponse)
+    async def fast_trends():
+        return FastJSONResponse(_build_list_response(trends, None, platforms))
+
+    return {"pydantic response_model": baseline, "FastJSONResponse": fast}
+
+
+async def run_load(app: FastAPI, requests: int, concurrency: int):
+    """Issue ``requests`` GETs with ``concurrency`` workers, returning (rps, latencies_ms)"""
+    latencies = []
+    remaining = iter(range(requests))
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up route resolution and model schemas
+        for _ in range(20):
+            (await client.get("/trends")).raise_for_status()
+
+        async def worker():
+            for _ in remaining:
+                start = time.perf_counter()
+                response = await client.get("/trends")
+                latencies.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return requests / elapsed, latencies
+
+
+async def main(args):
+    trends = make_trends(args.trends)
+    print(f"{args.trends} trends per response, {args.requests} requests, concurrency {args.concurrency}\n")
+    print(f"{'path':<26} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9}")
+
+    results = {}
+    for name, app in build_apps(trends).items():
+        rps, latencies = await run_load(app, args.requests, args.concurrency)
+        results[name] = rps
+        print(
+            f"{name:<26} {rps:>9.0f} {statistics.median(latencies):>9.2f} "
+            f"{_percentile(latencies, 99):>9.2f}"
+        )
+
+    baseline, fast = results.values()
+    print(f"\nspeedup: {fast / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trends", type=int, default=100, help="Trends per response")
+    parser.add_argument("--requests", type=int, default=3000, help="Requests per path")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients")
+    asyncio.run(main(parser.parse_args()))
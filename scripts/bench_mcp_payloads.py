@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark MCP tool payload encodings: hand-built JSON vs typed JSON vs msgpack.
+
+Encodes the same page of generated trends three ways and reports encode
+and decode time plus the size each takes inside a JSON-RPC tool result
+(text payloads are escaped into a JSON string, msgpack is base64 encoded).
+The baseline is the previous path: json.dumps on the server, json.loads on
+the client. Then runs fetch calls end to end through InProcessMCPClient
+against the fake server (no simulated latency) with each negotiated
+encoding, so numbers include MCP framing but no network.
+
+    python scripts/bench_mcp_payloads.py --trends 500 --rounds 200
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from mcp.types import CallToolResult, TextContent
+
+from mcp_servers.fake import FakeBehavior, create_server, generate_trends
+from mcp_servers.payloads import TrendsPage, decode_contents, encode_payload
+from src.services.mcp_client import InProcessMCPClient
+
+
+def _per_call_us(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def bench_codecs(trends, rounds: int):
+    page = {"status": "ok", "platform": "twitter", "trends": trends}
+    typed = TrendsPage.model_validate(page)
+    paths = {
+        "hand-built json": (
+            lambda: [TextContent(type="text", text=json.dumps(page))],
+            lambda contents: json.loads("".join(c.text for c in contents))
+        ),
+        "typed json": (lambda: encode_payload(typed, "json"), decode_contents),
+        "typed msgpack": (lambda: encode_payload(typed, "msgpack"), decode_contents),
+    }
+
+    print(f"{'encoding':<18} {'encode us':>10} {'decode us':>10} {'wire bytes':>11}")
+    for name, (encode, decode) in paths.items():
+        contents = encode()
+        wire = len(CallToolResult(content=contents).model_dump_json(by_alias=True, exclude_none=True))
+        encode_us = _per_call_us(encode, rounds)
+        decode_us = _per_call_us(lambda: decode(contents), rounds)
+        print(f"{name:<18} {encode_us:>10.1f} {decode_us:>10.1f} {wire:>11}")
+
+
+async def bench_round_trips(trends: int, calls: int):
+    print(f"\n{'encoding':<18} {'calls/s':>10}")
+    for encoding in ("json", "msgpack"):
+        server = create_server(FakeBehavior(max_trends=trends, latency_ms=0, latency_sigma=0, seed=1))
+        client = InProcessMCPClient(server, encoding=encoding)
+        args = {"limit": trends}
+        await client.call_tool("fetch_twitter_trends", args)
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            await client.call_tool("fetch_twitter_trends", args)
+        elapsed = time.perf_counter() - start
+        await client.disconnect()
+        print(f"{encoding:<18} {calls / elapsed:>10.0f}")
+
+
+def main(args):
+    trends = generate_trends(random.Random(1), "twitter", args.trends, FakeBehavior())
+    print(f"{args.trends} trends per payload, {args.rounds} rounds\n")
+    bench_codecs(trends, args.rounds)
+    asyncio.run(bench_round_trips(args.trends, args.calls))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trends", type=int, default=100, help="Trends per payload")
+    parser.add_argument("--rounds", type=int, default=500, help="Encode/decode rounds per encoding")
+    parser.add_argument("--calls", type=int, default=200, help="End-to-end tool calls per encoding")
+    main(parser.parse_args())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark niche relevance scoring: per-trend loop vs BatchRelevanceScorer.
+
+Scores generated trends against a niche with lexical_relevance called per
+trend (the agent's previous path) and with one BatchRelevanceScorer call
+over the whole batch, checking both give the same scores. Reports trends
+scored per second at each batch size.
+
+    python scripts/bench_relevance.py --sizes 10000 100000 --niche "AI agents"
+"""
+
+import argparse
+import random
+import time
+
+from mcp_servers.fake import FakeBehavior, generate_trends
+from skills.trend_research import lexical_relevance
+from src.services.relevance import BatchRelevanceScorer
+
+
+def _best_of(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(args):
+    behavior = FakeBehavior(hashtags_per_trend=args.hashtags)
+    print(f"niche {args.niche!r}, engagement weight {args.engagement_weight}, best of {args.repeats}\n")
+    print(f"{'trends':>8} {'loop/s':>12} {'batch/s':>12} {'speedup':>8}")
+    for size in args.sizes:
+        trends = generate_trends(random.Random(size), "twitter", size, behavior)
+        scorer = BatchRelevanceScorer(args.niche, engagement_weight=args.engagement_weight)
+        if not args.engagement_weight:
+            assert scorer.score(trends).tolist() == [lexical_relevance(t, args.niche) for t in trends]
+
+        loop = _best_of(lambda: [lexical_relevance(t, args.niche) for t in trends], args.repeats)
+        batch = _best_of(lambda: scorer.score(trends), args.repeats)
+        print(f"{size:>8} {size / loop:>12.0f} {size / batch:>12.0f} {loop / batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000], help="Trends per batch")
+    parser.add_argument("--niche", default="AI agents", help="Niche to score against")
+    parser.add_argument("--hashtags", type=int, default=3, help="Hashtags per trend")
+    parser.add_argument("--engagement-weight", type=float, default=0.0, help="Engagement share of the score")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per size; the best is reported")
+    main(parser.parse_args())
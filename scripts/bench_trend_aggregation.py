@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark cross-platform trend aggregation: MinHash/LSH vs exact pairwise Jaccard.
+
+Generates synthetic trends where each topic appears on one to three
+platforms with platform-style variations (camel-cased hashtag names, an
+extra word, reordered or dropped hashtags), then aggregates them with
+aggregate_trends and reports wall time and pairwise precision/recall
+against the generated topics. The exact baseline compares every pair on a
+sample and is extrapolated to the full batch, since it grows with n^2.
+
+    python scripts/bench_trend_aggregation.py --trends 50000
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from src.services.trend_aggregation import MinHashLSH, aggregate_trends, trend_tokens
+
+PLATFORMS = ["twitter", "tiktok", "instagram"]
+FILLER = ["news", "today", "update", "live", "viral", "trend"]
+
+
+def generate(rng: random.Random, count: int, vocabulary: int):
+    words = [f"w{i}x" for i in range(vocabulary)]
+    trends, topics = [], []
+    topic = 0
+    while len(trends) < count:
+        name = rng.sample(words, rng.randint(2, 4))
+        tags = rng.sample(words, rng.randint(1, 3))
+        for platform in rng.sample(PLATFORMS, rng.randint(1, 3)):
+            variant = list(name)
+            style = rng.random()
+            if style < 0.3:
+                topic_name = "#" + "".join(w.capitalize() for w in variant)
+            else:
+                if style < 0.5:
+                    variant.append(rng.choice(FILLER))
+                topic_name = " ".join(variant)
+            hashtags = ["#" + t for t in rng.sample(tags, rng.randint(len(tags) - 1, len(tags)))]
+            trends.append({
+                "topic_name": topic_name,
+                "platform": platform,
+                "related_hashtags": hashtags,
+                "platform_trend_id": f"{platform}_{len(trends)}",
+                "timestamp": f"2026-10-18T{rng.randint(0, 23):02d}:00:00Z",
+                "engagement_metrics": {"likes": rng.randint(0, 100_000), "shares": rng.randint(0, 5_000)},
+            })
+            topics.append(topic)
+        topic += 1
+    return trends[:count], np.array(topics[:count])
+
+
+def _pairs(labels: np.ndarray) -> int:
+    _, counts = np.unique(labels, return_counts=True)
+    return int((counts * (counts - 1) // 2).sum())
+
+
+def pair_scores(predicted: np.ndarray, truth: np.ndarray):
+    """Precision and recall over same-cluster pairs"""
+    _, joint = np.unique(np.stack([predicted, truth], axis=1), axis=0, return_inverse=True)
+    agreed = _pairs(joint.ravel())
+    return agreed / max(_pairs(predicted), 1), agreed / max(_pairs(truth), 1)
+
+
+def exact_seconds(token_sets, threshold: float, sample: int) -> float:
+    """Seconds per exact Jaccard comparison, timed on every pair of a sample"""
+    sets = [set(tokens) for tokens in token_sets[:sample]]
+    start = time.perf_counter()
+    for i, a in enumerate(sets):
+        for b in sets[i + 1:]:
+            _ = len(a & b) >= threshold * len(a | b)
+    return (time.perf_counter() - start) / (len(sets) * (len(sets) - 1) / 2)
+
+
+def main(args):
+    trends, truth = generate(random.Random(1), args.trends, args.vocabulary)
+    lsh = MinHashLSH(num_perm=args.num_perm, bands=args.bands, threshold=args.threshold)
+    print(f"{len(trends)} trends, {len(set(truth.tolist()))} topics, "
+          f"{lsh.num_perm} permutations in {lsh.bands} bands\n")
+
+    start = time.perf_counter()
+    clusters = aggregate_trends(trends, lsh)
+    elapsed = time.perf_counter() - start
+
+    token_sets = [trend_tokens(t) for t in trends]
+    labels = lsh.cluster(token_sets)
+    precision, recall = pair_scores(labels, truth)
+    cross = sum(c.cross_platform for c in clusters)
+    print(f"minhash/lsh     {elapsed:>8.2f} s  {len(clusters)} clusters ({cross} cross-platform)")
+    print(f"                precision {precision:.3f}  recall {recall:.3f}")
+
+    per_pair = exact_seconds(token_sets, args.threshold, args.sample)
+    pairs = len(trends) * (len(trends) - 1) / 2
+    print(f"exact pairwise  {per_pair * pairs:>8.0f} s  (extrapolated from {args.sample} trends)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trends", type=int, default=50_000, help="Trends to aggregate")
+    parser.add_argument("--vocabulary", type=int, default=5_000, help="Distinct words topics are drawn from")
+    parser.add_argument("--num-perm", type=int, default=128, help="MinHash permutations")
+    parser.add_argument("--bands", type=int, default=32, help="LSH bands")
+    parser.add_argument("--threshold", type=float, default=0.5, help="Jaccard similarity that merges trends")
+    parser.add_argument("--sample", type=int, default=2_000, help="Trends compared pairwise for the exact baseline")
+    main(parser.parse_args())
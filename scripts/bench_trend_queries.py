@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark historical trend retrieval (SC-004: 30-day range within 2 seconds).
+
+Seeds the trends table with synthetic rows using generate_series, then times
+the keyset-paginated query used by GET /api/v1/trends for the first page,
+a deep page and a filtered 30-day window. Hashtag containment and
+likes/views filters are timed twice: with the JSONB GIN/expression indexes,
+and with index scans disabled to show the sequential-scan baseline.
+
+Requires a migrated PostgreSQL database (``alembic upgrade head``):
+
+    python scripts/bench_trend_queries.py --rows 3000000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from src.config.settings import settings
+from src.models.trend import Platform
+from src.services.database import Database
+from src.services.trend_storage import retrieve_trends, build_trend_query
+
+SEED_SQL = """
+INSERT INTO trends (
+    trend_id, topic_name, platform, engagement_metrics, trend_velocity,
+    timestamp, relevance_score, related_hashtags, platform_trend_id
+)
+SELECT
+    md5(g::text || :run)::uuid,
+    'Topic ' || (g % 5000),
+    (ARRAY['TWITTER', 'TIKTOK', 'INSTAGRAM'])[1 + g % 3]::platform,
+    jsonb_build_object('likes', g % 100000, 'shares', g % 5000, 'comments', g % 900, 'views', g % 1000000),
+    (g % 1000)::float,
+    now() - (g * (CAST(:span_seconds AS float) / :rows)) * interval '1 second',
+    (g % 1000) / 1000.0,
+    jsonb_build_array('#topic' || (g % 5000), '#tag' || (g % 97)),
+    'trend_' || g || '_' || :run
+FROM generate_series(1, :rows) AS g
+"""
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+# Planner settings that force the sequential-scan baseline
+NO_INDEX_SETTINGS = ("SET LOCAL enable_indexscan = off", "SET LOCAL enable_bitmapscan = off")
+
+
+async def _time_query(db: Database, iterations: int, session_settings=(), **kwargs):
+    """Time retrieve_trends, returning (samples_ms, rows_in_last_page)"""
+    samples = []
+    rows = 0
+    factory = db.get_session_factory()
+    for _ in range(iterations):
+        async with factory() as session:
+            for statement in session_settings:
+                await session.execute(text(statement))
+            start = time.perf_counter()
+            trends, _ = await retrieve_trends(session, **kwargs)
+            samples.append((time.perf_counter() - start) * 1000)
+            rows = len(trends)
+    return samples, rows
+
+
+def _report(label: str, samples, rows: int) -> None:
+    print(
+        f"{label:<40} rows={rows:<4} "
+        f"p50={statistics.median(samples):8.2f}ms "
+        f"p95={_percentile(samples, 95):8.2f}ms "
+        f"max={max(samples):8.2f}ms"
+    )
+
+
+async def main(args) -> None:
+    db = Database(args.database_url, pool_size=4, max_overflow=0)
+    engine = db.get_engine()
+
+    if args.rows:
+        print(f"Seeding {args.rows:,} trends over {args.days} days...")
+        start = time.perf_counter()
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(SEED_SQL),
+                {"rows": args.rows, "span_seconds": args.days * 86400, "run": str(time.time())}
+            )
+            await conn.execute(text("ANALYZE trends"))
+        print(f"Seeded in {time.perf_counter() - start:.1f}s")
+
+    now = datetime.now(timezone.utc)
+    window = {"start_date": now - timedelta(days=30), "end_date": now}
+
+    samples, rows = await _time_query(db, args.iterations, limit=args.limit)
+    _report("first page (no filters)", samples, rows)
+
+    samples, rows = await _time_query(
+        db, args.iterations, platforms=[Platform.TWITTER], min_relevance=0.7,
+        limit=args.limit, **window
+    )
+    _report("30-day window, twitter, relevance>=0.7", samples, rows)
+
+    # Walk forward to a deep page, then time resuming from its cursor
+    cursor = None
+    async with db.get_session_factory()() as session:
+        for _ in range(args.deep_pages):
+            _, cursor = await retrieve_trends(session, cursor=cursor, limit=args.limit, **window)
+            if cursor is None:
+                break
+    if cursor is not None:
+        samples, rows = await _time_query(
+            db, args.iterations, cursor=cursor, limit=args.limit, **window
+        )
+        _report(f"30-day window, page {args.deep_pages + 1}", samples, rows)
+
+    jsonb_filters = {
+        "hashtags": dict(hashtags=["#topic42"]),
+        "likes >= 99,000": dict(min_likes=99_000),
+        "hashtag + views >= 990,000": dict(hashtags=["#tag7"], min_views=990_000),
+    }
+    for label, filters in jsonb_filters.items():
+        samples, rows = await _time_query(db, args.iterations, limit=args.limit, **filters)
+        _report(f"{label} (indexed)", samples, rows)
+        samples, rows = await _time_query(
+            db, max(1, args.iterations // 10), session_settings=NO_INDEX_SETTINGS,
+            limit=args.limit, **filters
+        )
+        _report(f"{label} (seq scan)", samples, rows)
+
+    if args.explain:
+        query = build_trend_query(
+            platforms=[Platform.TWITTER], min_relevance=0.7, limit=args.limit, **window
+        )
+        compiled = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+        async with engine.connect() as conn:
+            plan = await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {compiled}"))
+            print("\n".join(row[0] for row in plan))
+
+    await db.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument("--rows", type=int, default=2_000_000, help="Rows to seed (0 to skip)")
+    parser.add_argument("--days", type=int, default=90, help="Time span of seeded rows")
+    parser.add_argument("--limit", type=int, default=50, help="Page size")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--deep-pages", type=int, default=200, help="Pages to skip before the deep-page timing")
+    parser.add_argument("--explain", action="store_true", help="Print the query plan")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Serve the fake MCP server over streamable HTTP for offline load tests.
+
+Implements every social media and OpenClaw tool with generated payloads,
+simulated latency, per-platform rate limits and failures. Point
+MCP_TWITTER_URL (etc.) or a load test at http://HOST:PORT/mcp.
+
+    python scripts/run_fake_mcp.py --port 8001 --latency-ms 120 --rate-limit 75 --failure-rate 0.01
+"""
+
+import argparse
+import contextlib
+import logging
+
+import uvicorn
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from mcp_servers.fake import FakeBehavior, create_server
+
+
+def build_app(behavior: FakeBehavior) -> Starlette:
+    session_manager = StreamableHTTPSessionManager(app=create_server(behavior), stateless=False)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        async with session_manager.run():
+            yield
+
+    return Starlette(routes=[Mount("/mcp", app=session_manager.handle_request)], lifespan=lifespan)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--max-trends", type=int, default=50, help="Trends per platform call, at most")
+    parser.add_argument("--hashtags", type=int, default=3, help="Hashtags per trend")
+    parser.add_argument("--description-chars", type=int, default=0, help="Filler text per trend")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Median tool latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Lognormal spread of latency")
+    parser.add_argument("--spike-rate", type=float, default=0.0, help="Share of calls with a latency spike")
+    parser.add_argument("--spike-ms", type=float, default=2000.0, help="Extra latency of a spike")
+    parser.add_argument("--rate-limit", type=int, default=None, help="Requests per platform per window")
+    parser.add_argument("--rate-limit-window", type=float, default=60.0, help="Rate limit window in seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of calls that fail")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    behavior = FakeBehavior(
+        max_trends=args.max_trends,
+        hashtags_per_trend=args.hashtags,
+        description_chars=args.description_chars,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        spike_rate=args.spike_rate,
+        spike_ms=args.spike_ms,
+        rate_limit_per_window=args.rate_limit,
+        rate_limit_window=args.rate_limit_window,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+    uvicorn.run(build_app(behavior), host=args.host, port=args.port, log_level="warning")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Soak test trend research agents against the fake MCP server.
+
+Runs concurrent TrendResearchAgents in a loop for a fixed duration and
+reports research latency, trend throughput and per-platform errors. By
+default the fake server runs in-process; pass --url to drive one started
+with scripts/run_fake_mcp.py (or any server with the same tools).
+
+    python scripts/soak_trend_pipeline.py --agents 20 --duration 60 --rate-limit 200 --failure-rate 0.02
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from collections import Counter
+
+from mcp_servers.fake import FakeBehavior, create_server
+from skills.trend_research import TrendResearchAgent, TrendResearchInput
+from src.services.mcp_client import InProcessMCPClient, PooledMCPClient, http_session_factory
+
+
+class QuietSenseLogger:
+    """Keeps MCP Sense logging out of the measurement"""
+
+    def log_activity(self, *args, **kwargs):
+        pass
+
+    def log_trend_discovery(self, *args, **kwargs):
+        pass
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_agent(agent, request, deadline, latencies, errors, totals):
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        output = await agent.research(request)
+        latencies.append((time.perf_counter() - start) * 1000)
+        totals["trends"] += output.metadata["total_found"]
+        for platform, error in output.metadata["errors"].items():
+            errors[(platform, error.split(":")[0])] += 1
+
+
+async def main(args):
+    if args.url:
+        client = PooledMCPClient("soak", http_session_factory(args.url))
+    else:
+        client = InProcessMCPClient(create_server(FakeBehavior(
+            latency_ms=args.latency_ms,
+            spike_rate=args.spike_rate,
+            rate_limit_per_window=args.rate_limit,
+            rate_limit_window=args.rate_limit_window,
+            failure_rate=args.failure_rate,
+            seed=args.seed,
+        )))
+
+    request = TrendResearchInput(platforms=args.platforms.split(","), limit=args.limit, min_relevance=0.0)
+    agents = [
+        TrendResearchAgent(agent_id=f"soak-{i}", mcp_client=client, sense_logger=QuietSenseLogger())
+        for i in range(args.agents)
+    ]
+    latencies, errors, totals = [], Counter(), Counter()
+
+    print(f"{args.agents} agents x {args.duration}s, platforms {request.platforms}, limit {args.limit}\n")
+    started = time.monotonic()
+    await asyncio.gather(*(
+        run_agent(agent, request, started + args.duration, latencies, errors, totals)
+        for agent in agents
+    ))
+    elapsed = time.monotonic() - started
+    await client.disconnect()
+
+    print(f"research runs   {len(latencies):>10} ({len(latencies) / elapsed:.1f}/s)")
+    print(f"trends found    {totals['trends']:>10} ({totals['trends'] / elapsed:.0f}/s)")
+    if latencies:
+        print(
+            f"latency ms      p50 {statistics.median(latencies):.1f}  "
+            f"p95 {_percentile(latencies, 95):.1f}  p99 {_percentile(latencies, 99):.1f}  "
+            f"max {max(latencies):.1f}"
+        )
+    if errors:
+        print("\nplatform errors")
+        for (platform, error), count in errors.most_common():
+            print(f"  {platform:<10} {error:<40} {count:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="Streamable HTTP URL of a running MCP server (default: in-process fake)")
+    parser.add_argument("--agents", type=int, default=10, help="Concurrent agents")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    parser.add_argument("--platforms", default="twitter,tiktok,instagram")
+    parser.add_argument("--limit", type=int, default=20, help="Trends requested per platform")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="In-process fake: median latency")
+    parser.add_argument("--spike-rate", type=float, default=0.0, help="In-process fake: share of latency spikes")
+    parser.add_argument("--rate-limit", type=int, default=None, help="In-process fake: requests per platform per window")
+    parser.add_argument("--rate-limit-window", type=float, default=60.0, help="In-process fake: window seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="In-process fake: share of failing calls")
+    parser.add_argument("--seed", type=int, default=None)
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,403 @@
+"""Trend Research skill: discover, score and filter trends across platforms"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional
+import asyncio
+import logging
+import re
+import time
+import uuid
+
+from src.config.settings import settings
+from src.services.mcp_client import managed_tool_client
+from src.services.platform_scheduler import PlatformScheduler, platform_scheduler
+from src.services.relevance import get_scorer
+from src.services.trend_aggregation import aggregate_trends
+from src.services.trend_discovery import (
+    PLATFORM_TOOLS,
+    DiscoveryResult,
+    ToolClient,
+    TrendDiscoveryService,
+)
+from src.utils.mcp_sense_logger import MCPSenseLogger, get_mcp_sense_logger
+
+logger = logging.getLogger("chimera.trend_research")
+
+CAPABILITIES = ["trend_research", "trend_analysis"]
+
+
+@dataclass
+class TrendResearchInput:
+    """Skill input contract (see README.md)"""
+    platforms: List[str]
+    niche: Optional[str] = None
+    min_relevance: float = 0.7
+    limit: int = 50
+
+
+@dataclass
+class TrendResearchOutput:
+    """Skill output contract (see README.md)"""
+    trends: List[Dict[str, Any]] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def _utcnow_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _run_sync(coro: Awaitable[Any]) -> Any:
+    """Run a coroutine from synchronous code"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    coro.close()
+    raise RuntimeError("Called from a running event loop; use the async variant instead")
+
+
+def lexical_relevance(trend: Dict[str, Any], niche: str) -> float:
+    """
+    Share of niche terms that appear in the trend's topic or hashtags.
+
+    Per-trend reference for BatchRelevanceScorer, which the agent uses.
+    """
+    terms = set(re.findall(r"\w+", niche.lower()))
+    if not terms:
+        return 0.0
+    text = " ".join([trend.get("topic_name") or "", *(trend.get("related_hashtags") or [])])
+    words = set(re.findall(r"\w+", text.lower()))
+    return round(len(terms & words) / len(terms), 4)
+
+
+class TrendResearchAgent:
+    """
+    Discovers trends through the social media MCP server (FR-007),
+    registered with the global MCP client manager unless ``mcp_client``
+    is given.
+
+    Platforms are queried concurrently by TrendDiscoveryService, each under
+    its own deadline, and each platform's results are used as soon as they
+    arrive. With ``batch`` they all go in one fetch_trends_batch round trip
+    instead, which saves calls but waits for the slowest platform. A platform that fails or is rate limited
+    is skipped, falling back to its last successful results when rate limited.
+    Agents share one rate-limit budget per platform through the global
+    ``platform_scheduler`` unless given another scheduler (or None).
+    """
+
+    def __init__(
+        self,
+        agent_id: Optional[str] = None,
+        platforms: Optional[List[str]] = None,
+        niche: Optional[str] = None,
+        mcp_client: Optional[ToolClient] = None,
+        sense_logger: Optional[MCPSenseLogger] = None,
+        platform_timeout: float = settings.trend_platform_timeout,
+        batch: bool = settings.trend_discovery_batch,
+        scheduler: Optional[PlatformScheduler] = platform_scheduler
+    ):
+        if not agent_id:
+            raise ValueError("agent_id is required")
+
+        self.agent_id = agent_id
+        self.platforms = list(platforms or PLATFORM_TOOLS)
+        self.niche = niche or settings.agent_niche
+        self.batch = batch
+
+        # By default the social media server is called through the shared MCP
+        # client manager (pooled sessions, coalescing, circuit breaker)
+        self._mcp_client = mcp_client or managed_tool_client()
+        self._sense_logger = sense_logger or get_mcp_sense_logger()
+        self._discovery = TrendDiscoveryService(
+            self._mcp_client,
+            platform_timeout=platform_timeout,
+            sense_logger=self._sense_logger,
+            scheduler=scheduler
+        )
+
+        self._sense_logs: deque = deque(maxlen=500)
+        self._recent_errors: deque = deque(maxlen=20)
+        self._last_results: Dict[str, List[Dict[str, Any]]] = {}
+        self._current_activity = "idle"
+
+    def _log(self, event: str, details: Dict[str, Any], trace_id: Optional[str] = None) -> None:
+        """Log an activity to MCP Sense and keep it for get_mcp_sense_logs (FR-010)"""
+        self._sense_logs.append({
+            "event": event,
+            "agent_id": self.agent_id,
+            "timestamp": _utcnow_iso(),
+            "trace_id": trace_id,
+            "details": details
+        })
+        self._sense_logger.log_activity(event, "trend_research_agent", details, trace_id)
+
+    def _score(self, trends: List[Dict[str, Any]], niche: str) -> None:
+        get_scorer(niche).score_into(trends)
+
+    async def run_discovery(
+        self,
+        platforms: List[str],
+        limit: int = settings.trend_discovery_limit,
+        handle_rate_limit: bool = True,
+        niche: Optional[str] = None,
+        trace_id: Optional[str] = None
+    ) -> DiscoveryResult:
+        """
+        Query platforms concurrently, scoring trends as each platform completes.
+
+        Args:
+            platforms: Platform names
+            limit: Trends requested per platform
+            handle_rate_limit: Serve a rate-limited platform's last results
+            niche: Niche to score against (defaults to the agent niche)
+            trace_id: MCP Sense trace identifier
+
+        Returns:
+            Per-platform trends, errors and query durations
+        """
+        trace_id = trace_id or str(uuid.uuid4())
+        self._current_activity = "trend_discovery"
+        start = time.perf_counter()
+        try:
+            discovery = DiscoveryResult()
+            async for result in self._discovery.stream(platforms, limit, trace_id, self.batch):
+                if result.ok:
+                    self._score(result.trends, niche or self.niche)
+                    self._last_results[result.platform] = result.trends
+                else:
+                    self._recent_errors.append({
+                        "platform": result.platform,
+                        "error": result.error,
+                        "timestamp": _utcnow_iso()
+                    })
+                    if result.error == "rate_limited" and handle_rate_limit:
+                        result.trends = self._last_results.get(result.platform, [])
+                discovery.results[result.platform] = result
+            discovery.duration_ms = round((time.perf_counter() - start) * 1000)
+        finally:
+            self._current_activity = "idle"
+
+        self._log(
+            "trend_discovery",
+            {
+                "platforms": list(discovery.results),
+                "trends_found": len(discovery.trends),
+                "query_duration_ms": discovery.platform_durations_ms,
+                "errors": discovery.errors
+            },
+            trace_id
+        )
+        return discovery
+
+    async def stream_trends(
+        self,
+        platforms: Optional[List[str]] = None,
+        limit: int = settings.trend_discovery_limit,
+        page_size: int = settings.trend_page_size,
+        niche: Optional[str] = None,
+        trace_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield scored trends page by page as platforms deliver them.
+
+        Scoring (and whatever consumes the iterator, e.g.
+        TrendIngestionService.ingest) starts on the first page, and only a
+        couple of pages per platform are buffered, so large ``limit`` values
+        don't grow memory. Failed or rate-limited platforms stop contributing and
+        are recorded in recent errors.
+        """
+        trace_id = trace_id or str(uuid.uuid4())
+        niche = niche or self.niche
+        counts: Dict[str, int] = {}
+        errors: Dict[str, str] = {}
+        self._current_activity = "trend_discovery"
+        try:
+            async for page in self._discovery.stream_pages(platforms or self.platforms, limit, page_size, trace_id):
+                if not page.ok:
+                    errors[page.platform] = page.error
+                    self._recent_errors.append({
+                        "platform": page.platform,
+                        "error": page.error,
+                        "timestamp": _utcnow_iso()
+                    })
+                    continue
+                self._score(page.trends, niche)
+                counts[page.platform] = counts.get(page.platform, 0) + len(page.trends)
+                for trend in page.trends:
+                    yield trend
+        finally:
+            self._current_activity = "idle"
+            self._log(
+                "trend_discovery",
+                {"platforms": list(counts), "trends_found": sum(counts.values()), "errors": errors, "paged": True},
+                trace_id
+            )
+
+    async def discover_trends_async(
+        self,
+        platform: Optional[str] = None,
+        platforms: Optional[List[str]] = None,
+        limit: int = settings.trend_discovery_limit,
+        handle_rate_limit: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Discover trends from one platform or several, concurrently"""
+        targets = [platform] if platform else (platforms or self.platforms)
+        discovery = await self.run_discovery(targets, limit, handle_rate_limit)
+        return discovery.trends
+
+    def discover_trends(
+        self,
+        platform: Optional[str] = None,
+        platforms: Optional[List[str]] = None,
+        limit: int = settings.trend_discovery_limit,
+        handle_rate_limit: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Discover trends from one platform or several.
+
+        Unsupported or failing platforms contribute no trends instead of
+        raising. Use discover_trends_async inside an event loop.
+
+        Returns:
+            Trend dicts in the skill output shape
+        """
+        return _run_sync(self.discover_trends_async(platform, platforms, limit, handle_rate_limit))
+
+    def filter_by_relevance(
+        self,
+        trends: List[Dict[str, Any]],
+        min_score: float = 0.7
+    ) -> List[Dict[str, Any]]:
+        """
+        Keep trends scoring at least ``min_score`` against the agent niche (FR-003).
+
+        Trends without a relevance score are scored first, as one batch.
+        """
+        return get_scorer(self.niche).filter(trends, min_score)
+
+    def aggregate(self, trends: List[Dict[str, Any]], trace_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Merge near-duplicate trends across platforms (US-2).
+
+        Trends whose topic and hashtag words overlap (MinHash/LSH, see
+        ``trend_dedup_*`` settings) become one cluster with combined
+        engagement and velocity, and a platform sequence showing which
+        platform trended first. Clusters are ordered by combined engagement.
+        """
+        start = time.perf_counter()
+        clusters = aggregate_trends(trends)
+        self._log(
+            "trend_aggregation",
+            {
+                "trends_aggregated": len(trends),
+                "clusters": len(clusters),
+                "cross_platform": sum(c.cross_platform for c in clusters),
+                "duration_ms": round((time.perf_counter() - start) * 1000)
+            },
+            trace_id
+        )
+        return [c.to_dict() for c in clusters]
+
+    async def aggregate_cross_platform_trends(
+        self,
+        platforms: Optional[List[str]] = None,
+        limit: int = settings.trend_discovery_limit,
+        niche: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Discover trends on every platform and aggregate them into cross-platform clusters"""
+        trace_id = str(uuid.uuid4())
+        discovery = await self.run_discovery(platforms or self.platforms, limit, niche=niche, trace_id=trace_id)
+        return self.aggregate(discovery.trends, trace_id)
+
+    async def research(self, input_data: TrendResearchInput) -> TrendResearchOutput:
+        """
+        Run the skill contract: discover, score, filter and report.
+
+        ``query_duration_ms`` is the wall time of the concurrent fan-out;
+        ``platform_query_duration_ms`` breaks it down per platform.
+        """
+        niche = input_data.niche or self.niche
+        discovery = await self.run_discovery(input_data.platforms, input_data.limit, niche=niche)
+        found = discovery.trends
+        relevant = sorted(
+            self.filter_by_relevance(found, input_data.min_relevance),
+            key=lambda t: t["relevance_score"],
+            reverse=True
+        )[:input_data.limit]
+        self._log(
+            "relevance_filtering",
+            {"trends_scored": len(found), "trends_kept": len(relevant), "niche": niche}
+        )
+        return TrendResearchOutput(
+            trends=relevant,
+            metadata={
+                "total_found": len(found),
+                "filtered": len(relevant),
+                "platforms_queried": list(input_data.platforms),
+                "timestamp": _utcnow_iso(),
+                "query_duration_ms": discovery.duration_ms,
+                "platform_query_duration_ms": discovery.platform_durations_ms,
+                "errors": discovery.errors
+            }
+        )
+
+    def register_with_openclaw(self) -> Dict[str, Any]:
+        """Build this agent's OpenClaw registration record"""
+        registration = {
+            "agent_id": self.agent_id,
+            "capabilities": CAPABILITIES,
+            "platforms": self.platforms,
+            "niche": self.niche,
+            "status": "available",
+            "endpoints": {
+                "trend_api": "/api/v1/trends",
+                "heartbeat": f"/api/v1/agents/{self.agent_id}/heartbeat"
+            },
+            "registered_at": _utcnow_iso()
+        }
+        self._log("openclaw_registration", {"capabilities": CAPABILITIES})
+        return registration
+
+    def send_status_heartbeat(self) -> Dict[str, Any]:
+        """Build an OpenClaw status heartbeat"""
+        busy = self._current_activity != "idle"
+        heartbeat = {
+            "agent_id": self.agent_id,
+            "timestamp": _utcnow_iso(),
+            "status": {
+                "current_activity": self._current_activity,
+                "queue_size": 0,
+                "availability": "busy" if busy else "available",
+                "recent_errors": list(self._recent_errors)
+            },
+            "open_for_collaboration": not busy
+        }
+        self._log("status_heartbeat", {"availability": heartbeat["status"]["availability"]})
+        return heartbeat
+
+    def get_mcp_sense_logs(self) -> List[Dict[str, Any]]:
+        """Activities this agent logged to MCP Sense, oldest first"""
+        return list(self._sense_logs)
+
+
+async def research_trends(
+    input_data: TrendResearchInput,
+    agent: Optional[TrendResearchAgent] = None
+) -> TrendResearchOutput:
+    """Execute the Trend Research skill"""
+    agent = agent or TrendResearchAgent(
+        agent_id=f"trend-research-{uuid.uuid4().hex[:8]}",
+        platforms=input_data.platforms,
+        niche=input_data.niche
+    )
+    return await agent.research(input_data)
+
+
+__all__ = [
+    "TrendResearchAgent",
+    "TrendResearchInput",
+    "TrendResearchOutput",
+    "research_trends",
+]
@@ -4,12 +4,22 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+import asyncio
 import logging
 import os
 
 from src.config.settings import settings
 from src.config.security import get_security_settings, secrets_manager
+from src.api.middleware import RateLimitMiddleware
+from src.services.database import database
+from src.services.mcp_client import managed_tool_client, mcp_client_manager
+from src.services.platform_scheduler import platform_scheduler
+from src.services.redis_client import redis_client
+from src.services.trend_discovery import TrendDiscoveryService
+from src.services.trend_partitions import TrendPartitionManager
+from src.services.trend_sync import TrendSyncService
+from src.services.trend_velocity import velocity_engine
 
 logger = logging.getLogger(__name__)
 
@@ -26,10 +36,43 @@ async def lifespan(app: FastAPI):
         for warning in validation["warnings"]:
             logger.warning(f"Security warning: {warning}")
     
+    # Shared connection pools for all routes
+    database.connect()
+    redis_client.connect()
+    
+    # Resume trend velocities and platform rate-limit budgets where the last worker left off
+    await velocity_engine.restore()
+    await platform_scheduler.load()
+    
+    # MCP servers connect in parallel; unreachable ones start degraded
+    mcp_client_manager.register_default_servers()
+    await mcp_client_manager.connect_all()
+    
+    # Keep upcoming trend partitions created and expired ones retired
+    partition_task = None
+    if settings.trend_partition_maintenance_enabled:
+        partition_task = asyncio.create_task(TrendPartitionManager().run_forever())
+    
+    # Poll platforms for trends changed since their last sync
+    sync_task = None
+    if settings.trend_sync_enabled:
+        sync_task = asyncio.create_task(
+            TrendSyncService(TrendDiscoveryService(managed_tool_client())).run_forever()
+        )
+    
     yield
     
     # Shutdown
     logger.info("Shutting down Project Chimera API...")
+    for task in (sync_task, partition_task):
+        if task:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    await mcp_client_manager.disconnect_all()
+    await velocity_engine.checkpoint()
+    await redis_client.disconnect()
+    await database.disconnect()
 
 
 def create_app() -> FastAPI:
@@ -47,6 +90,15 @@ def create_app() -> FastAPI:
     # Security settings
     security_settings = get_security_settings()
     
+    # Rate limiting middleware (the limiter itself honours rate_limit_enabled). Added
+    # before CORS so CORS wraps it: 429s get CORS headers and preflights spend no tokens
+    app.add_middleware(
+        RateLimitMiddleware,
+        exempt_paths=security_settings.rate_limit_exempt_paths,
+        trust_forwarded_for=security_settings.rate_limit_trust_forwarded_for,
+        trusted_proxy_hops=security_settings.rate_limit_trusted_proxy_hops
+    )
+    
     # CORS middleware
     if security_settings.enable_cors:
         app.add_middleware(
@@ -0,0 +1,100 @@
+"""ASGI middleware for the API"""
+
+from typing import Iterable, Optional
+import json
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.services.rate_limiter import RateLimiter, api_rate_limiter
+
+
+class RateLimitMiddleware:
+    """
+    Enforces token-bucket rate limits before requests reach the routers.
+
+    Rejected requests get a 429 with ``Retry-After``; allowed responses carry
+    ``X-RateLimit-Limit`` and ``X-RateLimit-Remaining`` for the tightest
+    bucket the request drew from.
+
+    With ``trust_forwarded_for``, clients are identified by the
+    X-Forwarded-For entry appended by the outermost of
+    ``trusted_proxy_hops`` proxies, counted from the right. Entries left
+    of it are client-supplied and ignored.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: RateLimiter = api_rate_limiter,
+        exempt_paths: Iterable[str] = (),
+        trust_forwarded_for: bool = False,
+        trusted_proxy_hops: int = 1
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.exempt_paths = tuple(exempt_paths)
+        self.trust_forwarded_for = trust_forwarded_for
+        self.trusted_proxy_hops = trusted_proxy_hops
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not self.limiter.enabled
+            or scope["path"].startswith(self.exempt_paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        decision = await self.limiter.check(self._client_id(scope), self._route(scope))
+        headers = [
+            (b"x-ratelimit-limit", str(decision.limit).encode()),
+            (b"x-ratelimit-remaining", str(decision.remaining).encode()),
+        ]
+
+        if not decision.allowed:
+            body = json.dumps({"detail": "Rate limit exceeded"}).encode()
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": headers + [
+                    (b"retry-after", str(decision.retry_after_seconds).encode()),
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    def _client_id(self, scope: Scope) -> str:
+        if self.trust_forwarded_for:
+            # Repeated headers are one list, in order
+            entries = [
+                entry.strip()
+                for name, value in scope.get("headers", [])
+                if name == b"x-forwarded-for"
+                for entry in value.decode("latin-1").split(",")
+                if entry.strip()
+            ]
+            if entries:
+                return entries[-min(self.trusted_proxy_hops, len(entries))]
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    def _route(self, scope: Scope) -> Optional[str]:
+        """Path template of the matching route, only when it has its own limit"""
+        if not self.limiter.route_limits:
+            return None
+        app = scope.get("app")
+        for route in getattr(app, "routes", ()):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return getattr(route, "path", None)
+        return None
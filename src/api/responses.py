@@ -0,0 +1,20 @@
+"""Response classes for the API"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Endpoints returning this class directly bypass FastAPI's response_model
+    validation, so it is meant for payloads the route builds itself.
+    orjson encodes datetimes, UUIDs and enums natively; OPT_UTC_Z renders
+    UTC datetimes the same way pydantic does.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
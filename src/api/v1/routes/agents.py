@@ -5,7 +5,9 @@ from typing import List, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
-router = APIRouter()
+from src.api.responses import FastJSONResponse
+
+router = APIRouter(default_response_class=FastJSONResponse)
 
 
 class AgentResponse(BaseModel):
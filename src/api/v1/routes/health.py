@@ -4,14 +4,24 @@ from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from datetime import datetime
-from sqlalchemy import text, create_engine
+from typing import Any, Dict, Optional, Tuple
 from src.config.settings import settings
+from src.services.database import Database, database, get_database
+from src.services.mcp_client import ServerStatus, mcp_client_manager
+from src.services.resilience import CircuitState
+from src.services.response_cache import trend_response_cache
+import asyncio
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Last database probe result as (monotonic timestamp, status)
+_db_status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_db_status_lock = asyncio.Lock()
+
 
 class HealthResponse(BaseModel):
     """Health check response schema"""
@@ -21,53 +31,85 @@ class HealthResponse(BaseModel):
     services: dict
 
 
-async def check_database():
-    """Check database connectivity"""
+async def _probe_database(db: Database) -> Dict[str, Any]:
+    """Run a single connectivity probe against the shared pool"""
     try:
-        from sqlalchemy import create_engine
-        engine = create_engine(settings.database_url)
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        await asyncio.wait_for(db.ping(), timeout=settings.health_check_timeout)
         return {"status": "healthy", "message": "Database connection OK"}
+    except asyncio.TimeoutError:
+        logger.error("Database health check timed out")
+        return {"status": "unhealthy", "message": "Database health check timed out"}
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
         return {"status": "unhealthy", "message": str(e)}
 
 
+async def check_database(db: Database = database) -> Dict[str, Any]:
+    """
+    Check database connectivity.
+    
+    Probe results are cached for ``health_check_cache_ttl`` seconds so that
+    frequent liveness/readiness probes do not each hit the database.
+    Concurrent callers share a single in-flight probe.
+    """
+    global _db_status_cache
+    
+    cached = _db_status_cache
+    if cached and time.monotonic() - cached[0] < settings.health_check_cache_ttl:
+        return cached[1]
+    
+    async with _db_status_lock:
+        cached = _db_status_cache
+        if cached and time.monotonic() - cached[0] < settings.health_check_cache_ttl:
+            return cached[1]
+        result = await _probe_database(db)
+        _db_status_cache = (time.monotonic(), result)
+        return result
+
+
 @router.get("/", response_model=HealthResponse)
-async def health_check():
+async def health_check(db: Database = Depends(get_database)):
     """
     Comprehensive health check endpoint.
     
     Returns:
         Health status of the API and all services
     """
-    db_status = await check_database()
+    db_status = await check_database(db)
+    mcp_status = mcp_client_manager.get_status()
+    mcp_degraded = any(
+        s["status"] == ServerStatus.DEGRADED or s["circuit"]["state"] != CircuitState.CLOSED
+        for s in mcp_status.values()
+    )
     
     return HealthResponse(
-        status="healthy" if db_status["status"] == "healthy" else "degraded",
+        status="healthy" if db_status["status"] == "healthy" and not mcp_degraded else "degraded",
         timestamp=datetime.utcnow(),
         version="0.1.0",
         services={
             "database": db_status,
-            "api": {"status": "healthy"}
+            "api": {"status": "healthy"},
+            "response_cache": {
+                "status": "enabled" if trend_response_cache.enabled else "disabled",
+                "endpoints": trend_response_cache.get_stats()
+            },
+            "mcp_servers": mcp_status,
+            "mcp_calls": mcp_client_manager.get_stats()
         }
     )
 
 
 @router.get("/ready")
-async def readiness_check():
+async def readiness_check(db: Database = Depends(get_database)):
     """
     Readiness check for Kubernetes/Docker health probes.
     
     Returns:
         200 if ready, 503 if not ready
     """
-    db_status = await check_database()
+    db_status = await check_database(db)
     
     if db_status["status"] != "healthy":
-        from fastapi import status
-        from fastapi.responses import JSONResponse
         return JSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={"status": "not_ready", "reason": "Database unavailable"}
@@ -3,13 +3,20 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+import uuid
 
+from src.api.responses import FastJSONResponse
 from src.models.trend import Trend, Platform
 from src.models.platform_connection import PlatformConnection
 from src.config.security import secrets_manager
+from src.config.settings import settings
+from src.services.database import get_db_session, get_db_session_factory
+from src.services.response_cache import trend_response_cache
+from src.services.trend_storage import TrendCursor, retrieve_trends, get_trend_by_id
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 
 class TrendResponse(BaseModel):
@@ -19,6 +26,7 @@ class TrendResponse(BaseModel):
     platform: str
     engagement_metrics: dict
     trend_velocity: float
+    engagement_velocity: Optional[float] = None
     relevance_score: Optional[float] = None
     related_hashtags: Optional[List[str]] = None
     timestamp: datetime
@@ -26,6 +34,18 @@ class TrendResponse(BaseModel):
     
     class Config:
         from_attributes = True
+    
+    @field_validator("trend_id", mode="before")
+    @classmethod
+    def stringify_trend_id(cls, v):
+        """Accept UUIDs from the ORM"""
+        return str(v) if isinstance(v, uuid.UUID) else v
+    
+    @field_validator("platform", mode="before")
+    @classmethod
+    def platform_value(cls, v):
+        """Accept Platform enum members from the ORM"""
+        return v.value if isinstance(v, Platform) else v
 
 
 class TrendListResponse(BaseModel):
@@ -34,6 +54,7 @@ class TrendListResponse(BaseModel):
     total: int
     platforms: List[str]
     timestamp: datetime
+    next_cursor: Optional[str] = None
 
 
 class TrendQueryParams(BaseModel):
@@ -68,33 +89,133 @@ class TrendQueryParams(BaseModel):
     )
 
 
+def _parse_platform(platform: str) -> Platform:
+    """Parse a platform name, raising 400 if it is not supported"""
+    try:
+        return Platform(platform.strip().lower())
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid platform: {platform}. Must be one of: twitter, tiktok, instagram"
+        )
+
+
+def _parse_cursor(cursor: Optional[str]) -> Optional[TrendCursor]:
+    """Decode a pagination cursor, raising 400 if it is malformed"""
+    if not cursor:
+        return None
+    try:
+        return TrendCursor.decode(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _trend_payload(trend: Trend) -> dict:
+    """
+    Build a TrendResponse-shaped dict straight from the ORM row.
+    
+    Rows come from our own schema, so pydantic validation is skipped;
+    FastJSONResponse encodes the UUID, enum and datetime values.
+    """
+    return {
+        "trend_id": trend.trend_id,
+        "topic_name": trend.topic_name,
+        "platform": trend.platform,
+        "engagement_metrics": trend.engagement_metrics,
+        "trend_velocity": trend.trend_velocity,
+        "engagement_velocity": trend.engagement_velocity,
+        "relevance_score": trend.relevance_score,
+        "related_hashtags": trend.related_hashtags,
+        "timestamp": trend.timestamp,
+        "platform_trend_id": trend.platform_trend_id,
+    }
+
+
+def _build_list_response(
+    trends: List[Trend],
+    next_cursor: Optional[TrendCursor],
+    platforms: List[str]
+) -> dict:
+    """Build a cacheable TrendListResponse payload"""
+    return {
+        "trends": [_trend_payload(t) for t in trends],
+        "total": len(trends),
+        "platforms": platforms,
+        "timestamp": datetime.utcnow(),
+        "next_cursor": next_cursor.encode() if next_cursor else None,
+    }
+
+
 @router.get("/", response_model=TrendListResponse)
 async def get_trends(
     platforms: Optional[str] = Query(None, description="Comma-separated platforms"),
-    niche: Optional[str] = Query(None),
+    niche: Optional[str] = Query(None, include_in_schema=False),
     min_relevance: Optional[float] = Query(0.7, ge=0.0, le=1.0),
     limit: Optional[int] = Query(50, ge=1, le=100),
     start_date: Optional[datetime] = Query(None),
-    end_date: Optional[datetime] = Query(None)
+    end_date: Optional[datetime] = Query(None),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    hashtags: Optional[str] = Query(None, description="Comma-separated hashtags; trends must carry all of them"),
+    min_likes: Optional[int] = Query(None, ge=0, description="Minimum likes"),
+    min_views: Optional[int] = Query(None, ge=0, description="Minimum views"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_db_session_factory)
 ):
     """
     Get trending topics from social media platforms.
     
-    This endpoint retrieves trends based on the specified filters.
-    Currently returns mock data - implementation pending.
+    Results are ordered newest first and paginated with a keyset cursor:
+    pass the returned ``next_cursor`` to fetch the following page.
+    ``total`` is the number of trends in this page.
+    
+    Relevance scores are computed against the agent niche at discovery
+    time and can't be re-applied per query, so ``niche`` is rejected
+    with 400 rather than ignored. ``hashtags`` match case-insensitively.
+    
+    Responses are cached per normalized parameter set and invalidated
+    when new trends are ingested for a covered platform.
     """
-    # TODO: Implement actual trend fetching via skills/trend_research
-    # For now, return empty list with proper structure
-    return TrendListResponse(
-        trends=[],
-        total=0,
-        platforms=platforms.split(",") if platforms else [],
-        timestamp=datetime.utcnow()
+    if niche is not None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"niche filtering is not supported; relevance_score is scored against '{settings.agent_niche}'"
+        )
+    platform_filter = [_parse_platform(p) for p in platforms.split(",")] if platforms else []
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must be before end_date")
+    trend_cursor = _parse_cursor(cursor)
+    
+    async def load() -> dict:
+        async with session_factory() as session:
+            trends, next_cursor = await retrieve_trends(
+                session,
+                platforms=platform_filter,
+                min_relevance=min_relevance,
+                start_date=start_date,
+                end_date=end_date,
+                cursor=trend_cursor,
+                limit=limit,
+                hashtags=[t for t in hashtags.split(",") if t.strip()] if hashtags else None,
+                min_likes=min_likes,
+                min_views=min_views
+            )
+        return _build_list_response(trends, next_cursor, [p.value for p in platform_filter])
+    
+    payload = await trend_response_cache.get_or_compute(
+        "trends",
+        {
+            "platforms": platforms, "min_relevance": min_relevance,
+            "limit": limit, "start_date": start_date, "end_date": end_date, "cursor": cursor,
+            "hashtags": hashtags, "min_likes": min_likes, "min_views": min_views
+        },
+        [p.value for p in platform_filter],
+        settings.response_cache_ttl_trends,
+        load
     )
+    return FastJSONResponse(payload)
 
 
 @router.get("/{trend_id}", response_model=TrendResponse)
-async def get_trend(trend_id: str):
+async def get_trend(trend_id: str, session: AsyncSession = Depends(get_db_session)):
     """
     Get a specific trend by ID.
     
@@ -104,14 +225,23 @@ async def get_trend(trend_id: str):
     Returns:
         Trend details
     """
-    # TODO: Implement database lookup
-    raise HTTPException(status_code=404, detail="Trend not found")
+    try:
+        trend_uuid = uuid.UUID(trend_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Trend not found")
+    
+    trend = await get_trend_by_id(session, trend_uuid)
+    if trend is None:
+        raise HTTPException(status_code=404, detail="Trend not found")
+    return FastJSONResponse(_trend_payload(trend))
 
 
 @router.get("/platforms/{platform}/trends", response_model=TrendListResponse)
 async def get_platform_trends(
     platform: str,
-    limit: Optional[int] = Query(50, ge=1, le=100)
+    limit: Optional[int] = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_db_session_factory)
 ):
     """
     Get trends for a specific platform.
@@ -119,26 +249,32 @@ async def get_platform_trends(
     Args:
         platform: Platform name (twitter, tiktok, instagram)
         limit: Maximum number of results
+        cursor: Cursor from a previous page
     
     Returns:
         List of trends for the platform
     """
-    # Validate platform
-    try:
-        Platform(platform.upper())
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid platform: {platform}. Must be one of: twitter, tiktok, instagram"
-        )
+    platform_enum = _parse_platform(platform)
+    trend_cursor = _parse_cursor(cursor)
+    
+    async def load() -> dict:
+        async with session_factory() as session:
+            trends, next_cursor = await retrieve_trends(
+                session,
+                platforms=[platform_enum],
+                cursor=trend_cursor,
+                limit=limit
+            )
+        return _build_list_response(trends, next_cursor, [platform_enum.value])
     
-    # TODO: Implement platform-specific trend fetching
-    return TrendListResponse(
-        trends=[],
-        total=0,
-        platforms=[platform],
-        timestamp=datetime.utcnow()
+    payload = await trend_response_cache.get_or_compute(
+        "platform_trends",
+        {"platform": platform_enum.value, "limit": limit, "cursor": cursor},
+        [platform_enum.value],
+        settings.response_cache_ttl_platform_trends,
+        load
     )
+    return FastJSONResponse(payload)
 
 
 @router.get("/platforms/status", response_model=List[dict])
@@ -1,7 +1,7 @@
 """Security configuration and secrets management for Project Chimera"""
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import os
 from functools import lru_cache
@@ -50,6 +50,27 @@ class SecuritySettings(BaseSettings):
         default=60,
         description="Requests per minute limit"
     )
+    rate_limit_burst: Optional[int] = Field(
+        default=None,
+        description="Token bucket capacity per client (defaults to the per-minute limit)"
+    )
+    rate_limit_route_limits: Dict[str, int] = Field(
+        default={},
+        description="Per-client requests per minute for specific routes, keyed by route path"
+    )
+    rate_limit_exempt_paths: List[str] = Field(
+        default=["/health", "/api/v1/health", "/api/docs", "/api/redoc", "/api/openapi.json"],
+        description="Path prefixes that are never rate limited"
+    )
+    rate_limit_trust_forwarded_for: bool = Field(
+        default=False,
+        description="Identify clients by X-Forwarded-For (only behind a trusted proxy)"
+    )
+    rate_limit_trusted_proxy_hops: int = Field(
+        default=1,
+        ge=1,
+        description="Trusted proxies appending to X-Forwarded-For; the client is that many entries from the right"
+    )
     
     # Security headers
     enable_security_headers: bool = Field(
@@ -1,7 +1,10 @@
 """Trend model - represents trending topics from social media platforms"""
 
-from sqlalchemy import Column, String, Float, DateTime, JSON, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Column, String, Float, DateTime, JSON, Enum as SQLEnum,
+    Index, UniqueConstraint, CheckConstraint
+)
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 import uuid
 from enum import Enum
@@ -16,6 +19,10 @@ class Platform(str, Enum):
     INSTAGRAM = "instagram"
 
 
+# JSONB on PostgreSQL (indexable), plain JSON elsewhere (e.g. SQLite in tests)
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
 class Trend(Base):
     """Trend entity - represents a trending topic"""
     
@@ -24,14 +31,26 @@ class Trend(Base):
     trend_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     topic_name = Column(String(500), nullable=False)
     platform = Column(SQLEnum(Platform), nullable=False)
-    engagement_metrics = Column(JSON, nullable=False)  # {likes, shares, comments, views?}
+    engagement_metrics = Column(JSONDocument, nullable=False)  # {likes, shares, comments, views?}
     trend_velocity = Column(Float, nullable=False)  # Rate of growth (posts per hour)
+    engagement_velocity = Column(Float)  # Engagement gained per hour, computed at ingestion
     timestamp = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     relevance_score = Column(Float)  # 0.0-1.0, calculated
-    related_hashtags = Column(JSON)  # Array of strings
+    related_hashtags = Column(JSONDocument)  # Array of strings
     platform_trend_id = Column(String, nullable=False)  # Platform-specific identifier
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     
+    # Mirrors the Alembic migrations. Since 002 the table is range-partitioned by
+    # timestamp and its database primary key is (trend_id, timestamp). The
+    # PostgreSQL-only JSONB GIN/expression indexes are created by 003.
+    __table_args__ = (
+        UniqueConstraint('platform', 'platform_trend_id', 'timestamp', name='uq_trends_platform_trend_id_timestamp'),
+        CheckConstraint('relevance_score >= 0.0 AND relevance_score <= 1.0', name='check_relevance_score_range'),
+        Index('ix_trends_platform_timestamp', 'platform', 'timestamp'),
+        Index('ix_trends_relevance_score', 'relevance_score'),
+        Index('ix_trends_timestamp', 'timestamp'),
+    )
+    
     def __repr__(self):
         return f"<Trend(trend_id={self.trend_id}, topic_name={self.topic_name}, platform={self.platform.value})>"
@@ -0,0 +1,117 @@
+"""Async PostgreSQL engine and session management"""
+
+from typing import AsyncIterator, Optional
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.config.settings import settings
+
+logger = logging.getLogger("chimera.database")
+
+
+def to_async_url(database_url: str) -> str:
+    """Rewrite a plain PostgreSQL URL to use the asyncpg driver"""
+    url = make_url(database_url)
+    if url.drivername in ("postgresql", "postgresql+psycopg2", "postgres"):
+        url = url.set(drivername="postgresql+asyncpg")
+    return url.render_as_string(hide_password=False)
+
+
+class Database:
+    """Pooled async database engine wrapper"""
+
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True
+    ):
+        self.database_url = to_async_url(database_url)
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        self.engine: Optional[AsyncEngine] = None
+        self.session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+    def connect(self) -> None:
+        """Create the engine and session factory (connections are opened lazily)"""
+        if self.engine is not None:
+            return
+        self.engine = create_async_engine(
+            self.database_url,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_timeout=self.pool_timeout,
+            pool_recycle=self.pool_recycle,
+            pool_pre_ping=self.pool_pre_ping,
+        )
+        self.session_factory = async_sessionmaker(self.engine, expire_on_commit=False)
+        logger.info(
+            f"Database engine created (pool_size={self.pool_size}, "
+            f"max_overflow={self.max_overflow})"
+        )
+
+    async def disconnect(self) -> None:
+        """Dispose of the engine and close all pooled connections"""
+        if self.engine is not None:
+            await self.engine.dispose()
+            self.engine = None
+            self.session_factory = None
+            logger.info("Database engine disposed")
+
+    def get_engine(self) -> AsyncEngine:
+        """Get engine instance, creating it on first use"""
+        if self.engine is None:
+            self.connect()
+        return self.engine
+
+    def get_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Get session factory, creating the engine on first use"""
+        if self.session_factory is None:
+            self.connect()
+        return self.session_factory
+
+    async def ping(self) -> None:
+        """Run a trivial query on a pooled connection"""
+        async with self.get_engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+
+# Global database instance, engine is created in the app lifespan
+database = Database(
+    settings.database_url,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_timeout=settings.database_pool_timeout,
+    pool_recycle=settings.database_pool_recycle,
+    pool_pre_ping=settings.database_pool_pre_ping,
+)
+
+
+def get_database() -> Database:
+    """FastAPI dependency returning the shared database wrapper"""
+    return database
+
+
+def get_db_session_factory() -> async_sessionmaker[AsyncSession]:
+    """FastAPI dependency returning the session factory, for work that may outlive the request"""
+    return database.get_session_factory()
+
+
+async def get_db_session() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency yielding a session bound to the shared pool"""
+    async with database.get_session_factory()() as session:
+        yield session
@@ -0,0 +1,237 @@
+"""Embedding-based niche relevance on a local HNSW index, with exemplars and trend vectors kept in Weaviate (SC-002)"""
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
+import logging
+import threading
+import time
+import uuid
+import zlib
+
+import numpy as np
+
+from src.config.settings import settings
+from src.services.hnsw import HNSWIndex
+from src.services.relevance import BatchRelevanceScorer, split_words
+from src.services.weaviate_client import WeaviateClient, weaviate_client
+
+logger = logging.getLogger("chimera.embedding_relevance")
+
+EXEMPLAR_CLASS = "NicheExemplar"
+TREND_CLASS = "TrendTopic"
+
+# Background Weaviate work (schema, imports, exemplar pulls), so scoring never waits on it
+_store_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chimera-weaviate")
+# Trend imports queued on the executor at once; batches beyond this are skipped
+_import_slots = threading.BoundedSemaphore(settings.weaviate_max_pending_imports)
+
+
+class Embedder(Protocol):
+    """Turns texts into fixed-size vectors"""
+    dim: int
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        ...
+
+
+class HashingEmbedder:
+    """
+    Deterministic feature-hashing embedder; needs no model or download.
+
+    Each word contributes itself and its character n-grams (so "robot" and
+    "robotics" land close), hashed with CRC32 into ``dim`` signed buckets.
+    Vectors are L2-normalized. CRC32 is stable across processes, so vectors
+    stored in Weaviate stay comparable after restarts.
+    """
+
+    def __init__(
+        self,
+        dim: int = settings.relevance_embedding_dim,
+        ngram: int = 3,
+        ngram_weight: float = 0.5
+    ):
+        self.dim = dim
+        self.ngram = ngram
+        self.ngram_weight = ngram_weight
+        self._features = lru_cache(maxsize=100_000)(self._word_features)
+
+    def _word_features(self, word: str) -> Tuple[Tuple[int, float], ...]:
+        padded = f"<{word}>"
+        grams = [padded[i:i + self.ngram] for i in range(max(1, len(padded) - self.ngram + 1))]
+        features = [(word, 1.0)] + [(g, self.ngram_weight) for g in grams]
+        hashed = []
+        for feature, weight in features:
+            h = zlib.crc32(feature.encode())
+            hashed.append((h % self.dim, weight if h & 0x80000000 else -weight))
+        return tuple(hashed)
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        rows: List[int] = []
+        cols: List[int] = []
+        values: List[float] = []
+        for row, text in enumerate(texts):
+            for word in split_words(text):
+                for col, value in self._features(word):
+                    rows.append(row)
+                    cols.append(col)
+                    values.append(value)
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        np.add.at(matrix, (rows, cols), values)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1, norms)
+
+
+def trend_text(trend: Dict[str, Any]) -> str:
+    return " ".join([trend.get("topic_name") or "", *(trend.get("related_hashtags") or [])])
+
+
+class EmbeddingRelevanceScorer(BatchRelevanceScorer):
+    """
+    Scores trends by embedding similarity to niche exemplars.
+
+    The niche and its exemplar topics (``relevance_niche_exemplars``) are
+    embedded once and indexed locally, in an HNSWIndex. A trend's niche
+    score is the mean cosine similarity to its ``neighbors`` nearest
+    exemplars, mapped linearly from ``floor``..``ceiling`` to 0.0..1.0.
+
+    Nearest exemplars are deliberately never queried from Weaviate: scoring
+    runs synchronously on the event loop, and a network round trip per batch
+    would block it. The local index answers every query, whether or not
+    Weaviate is up. Weaviate is the shared exemplar store and a sink for
+    trend vectors, kept in step on a background thread: the exemplars are
+    imported once, and every ``sync_interval`` seconds (``retry_interval``
+    after an error) the niche's stored exemplars, which may have been added
+    elsewhere, are pulled into the local index. Scored trend vectors are
+    batch-imported for later similarity search; at most
+    ``weaviate_max_pending_imports`` batches wait at once.
+    """
+
+    def __init__(
+        self,
+        niche: str,
+        engagement_weight: float = settings.relevance_engagement_weight,
+        exemplars: Optional[List[str]] = None,
+        embedder: Optional[Embedder] = None,
+        store: Optional[WeaviateClient] = weaviate_client,
+        neighbors: int = settings.relevance_neighbors,
+        floor: float = settings.relevance_similarity_floor,
+        ceiling: float = settings.relevance_similarity_ceiling,
+        sync_interval: float = settings.relevance_exemplar_sync_interval,
+        retry_interval: float = settings.relevance_exemplar_retry_interval
+    ):
+        super().__init__(niche, engagement_weight)
+        if exemplars is None:
+            exemplars = settings.relevance_niche_exemplars.get(niche.lower(), [])
+        self.exemplars = list(dict.fromkeys([niche, *exemplars]))
+        self.embedder = embedder or HashingEmbedder()
+        self.store = store
+        self.max_neighbors = max(1, neighbors)
+        self.floor = floor
+        self.ceiling = ceiling
+        self.sync_interval = sync_interval
+        self.retry_interval = retry_interval
+        self.stats: Dict[str, int] = defaultdict(int)
+
+        self.index = HNSWIndex(self.embedder.dim, seed=0)
+        self._exemplar_vectors = self.embedder.embed(self.exemplars)
+        self.index.add(self.exemplars, self._exemplar_vectors)
+        self._store_ready = False
+        self._exemplars_imported = False
+        self._next_sync_at = 0.0
+        # Exemplars pulled from Weaviate, merged into the index by the scoring thread
+        self._pulled: List[Tuple[str, List[float]]] = []
+        self._sync = None
+        self._schedule_sync()
+
+    @property
+    def neighbors(self) -> int:
+        return min(self.max_neighbors, len(self.exemplars))
+
+    def _store_failed(self, e: Exception) -> None:
+        logger.warning(f"Weaviate unavailable, retrying the exemplar sync in {self.retry_interval}s: {e}")
+        self._store_ready = False
+        self._next_sync_at = time.monotonic() + self.retry_interval
+        self.stats["store_errors"] += 1
+
+    def _sync_exemplars(self) -> None:
+        """Import this niche's exemplars once, then pull its stored ones (runs in the background)"""
+        try:
+            if not self._exemplars_imported:
+                self.store.ensure_class(EXEMPLAR_CLASS, {"niche": "text", "text": "text"})
+                self.store.ensure_class(
+                    TREND_CLASS,
+                    {"platform_trend_id": "text", "platform": "text", "topic_name": "text"}
+                )
+                self.store.batch_import(EXEMPLAR_CLASS, [
+                    (str(uuid.uuid5(uuid.NAMESPACE_URL, f"{self.niche}:{text}")), {"niche": self.niche, "text": text}, vector)
+                    for text, vector in zip(self.exemplars, self._exemplar_vectors.tolist())
+                ])
+                self._exemplars_imported = True
+            where = {"path": ["niche"], "operator": "Equal", "valueText": self.niche}
+            stored = self.store.fetch_objects(EXEMPLAR_CLASS, ["text"], where)
+            self._pulled = [(obj["text"], obj["vector"]) for obj in stored if obj.get("text") and obj.get("vector")]
+            self._store_ready = True
+            self._next_sync_at = time.monotonic() + self.sync_interval
+            self.stats["exemplar_syncs"] += 1
+        except Exception as e:
+            self._store_failed(e)
+
+    def _schedule_sync(self) -> None:
+        if self.store is None or (self._sync is not None and not self._sync.done()):
+            return
+        if time.monotonic() >= self._next_sync_at:
+            self._sync = _store_executor.submit(self._sync_exemplars)
+
+    def _merge_pulled(self) -> None:
+        pulled, self._pulled = self._pulled, []
+        new = [(text, vector) for text, vector in pulled if text not in self.index]
+        if new:
+            texts = [text for text, _ in new]
+            self.index.add(texts, np.array([vector for _, vector in new], dtype=np.float32))
+            self.exemplars.extend(texts)
+            self.stats["exemplars_pulled"] += len(texts)
+
+    def nearest_similarities(self, vectors: np.ndarray) -> np.ndarray:
+        """Cosine similarity to the nearest exemplars from the local index, (trends, neighbors), -inf padded"""
+        self._merge_pulled()
+        self._schedule_sync()
+        self.stats["local_queries"] += 1
+        return self.index.search(vectors, self.neighbors)[1]
+
+    def niche_scores(self, trends: Sequence[Dict[str, Any]]) -> np.ndarray:
+        if not trends:
+            return np.zeros(0)
+        vectors = self.embedder.embed([trend_text(t) for t in trends])
+        sims = self.nearest_similarities(vectors)
+        found = np.isfinite(sims)
+        mean = np.where(found, sims, 0.0).sum(axis=1) / np.maximum(found.sum(axis=1), 1)
+        if self._store_ready:
+            if _import_slots.acquire(blocking=False):
+                _store_executor.submit(self._import_trends, list(trends), vectors)
+            else:
+                self.stats["imports_skipped"] += 1
+        return np.clip((mean - self.floor) / (self.ceiling - self.floor), 0.0, 1.0)
+
+    def _import_trends(self, trends: List[Dict[str, Any]], vectors: np.ndarray) -> None:
+        objects = [
+            (
+                # Trend ids are only unique per platform
+                str(uuid.uuid5(uuid.NAMESPACE_URL, f"{t.get('platform')}:{t['platform_trend_id']}")),
+                {"platform_trend_id": t["platform_trend_id"], "platform": t.get("platform"), "topic_name": t.get("topic_name")},
+                vector
+            )
+            for t, vector in zip(trends, vectors.tolist())
+            if t.get("platform_trend_id")
+        ]
+        try:
+            self.stats["trends_imported"] += self.store.batch_import(TREND_CLASS, objects)
+        except Exception as e:
+            self._store_failed(e)
+        finally:
+            _import_slots.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Query, exemplar sync and import counters"""
+        return {"store_ready": self._store_ready, "exemplars": len(self.exemplars), **self.stats}
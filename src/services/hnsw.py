@@ -0,0 +1,156 @@
+"""In-process HNSW approximate nearest neighbor index over cosine similarity"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+import heapq
+import math
+import random
+
+import numpy as np
+
+
+class HNSWIndex:
+    """
+    Hierarchical navigable small world graph (Malkov & Yashunin) in NumPy.
+
+    Vectors are L2-normalized on insert, so similarity is a dot product.
+    Each node links to up to ``m`` neighbors per layer (``2 * m`` on the
+    bottom layer); searches descend greedily from the top layer and run a
+    best-first search of width ``ef_search`` on the bottom one. Adding an
+    id that is already indexed is a no-op. Not thread-safe.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        m: int = 16,
+        ef_construction: int = 100,
+        ef_search: int = 50,
+        seed: Optional[int] = None
+    ):
+        self.dim = dim
+        self.m = m
+        self.m0 = 2 * m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.ids: List[Hashable] = []
+        self._labels: Dict[Hashable, int] = {}
+        self._vectors = np.empty((16, dim), dtype=np.float32)
+        self._layers: List[Dict[int, List[int]]] = []
+        self._entry: Optional[int] = None
+        self._max_level = -1
+        self._level_mult = 1 / math.log(m)
+        self._rng = random.Random(seed)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._labels
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def add(self, ids: Iterable[Hashable], vectors: np.ndarray) -> int:
+        """Insert vectors under ``ids``, returning how many were new"""
+        added = 0
+        for item, vector in zip(ids, self._normalize(vectors)):
+            if item not in self._labels:
+                self._insert(item, vector)
+                added += 1
+        return added
+
+    def _insert(self, item: Hashable, vector: np.ndarray) -> None:
+        node = len(self.ids)
+        if node == len(self._vectors):
+            self._vectors = np.concatenate([self._vectors, np.empty_like(self._vectors)])
+        self._vectors[node] = vector
+        self.ids.append(item)
+        self._labels[item] = node
+
+        level = int(-math.log(1.0 - self._rng.random()) * self._level_mult)
+        while len(self._layers) <= level:
+            self._layers.append({})
+        for layer in range(level + 1):
+            self._layers[layer][node] = []
+        if self._entry is None:
+            self._entry, self._max_level = node, level
+            return
+
+        entries = [self._entry]
+        for layer in range(self._max_level, level, -1):
+            entries = [self._search_layer(vector, entries, 1, layer)[0][1]]
+        for layer in range(min(level, self._max_level), -1, -1):
+            found = self._search_layer(vector, entries, self.ef_construction, layer)
+            neighbors = [n for _, n in found[:self.m]]
+            self._layers[layer][node] = neighbors
+            limit = self.m0 if layer == 0 else self.m
+            for neighbor in neighbors:
+                links = self._layers[layer][neighbor]
+                links.append(node)
+                if len(links) > limit:
+                    # Keep the neighbor's closest links
+                    sims = self._vectors[links] @ self._vectors[neighbor]
+                    self._layers[layer][neighbor] = [links[i] for i in np.argsort(-sims)[:limit]]
+            entries = [n for _, n in found]
+        if level > self._max_level:
+            self._entry, self._max_level = node, level
+
+    def _search_layer(
+        self,
+        query: np.ndarray,
+        entries: Sequence[int],
+        ef: int,
+        layer: int
+    ) -> List[Tuple[float, int]]:
+        """Best-first search of one layer; (similarity, node) pairs, most similar first"""
+        graph = self._layers[layer]
+        visited = set(entries)
+        sims = (self._vectors[list(entries)] @ query).tolist()
+        candidates = [(-s, n) for s, n in zip(sims, entries)]
+        heapq.heapify(candidates)
+        results = [(s, n) for s, n in zip(sims, entries)]
+        heapq.heapify(results)
+        while len(results) > ef:
+            heapq.heappop(results)
+
+        while candidates:
+            neg_sim, node = heapq.heappop(candidates)
+            if len(results) >= ef and -neg_sim < results[0][0]:
+                break
+            neighbors = [n for n in graph[node] if n not in visited]
+            if not neighbors:
+                continue
+            visited.update(neighbors)
+            for sim, neighbor in zip((self._vectors[neighbors] @ query).tolist(), neighbors):
+                if len(results) < ef or sim > results[0][0]:
+                    heapq.heappush(candidates, (-sim, neighbor))
+                    heapq.heappush(results, (sim, neighbor))
+                    if len(results) > ef:
+                        heapq.heappop(results)
+        return sorted(results, reverse=True)
+
+    def search(self, queries: np.ndarray, k: int = 1) -> Tuple[List[List[Hashable]], np.ndarray]:
+        """
+        Approximate ``k`` nearest neighbors of each query.
+
+        Returns:
+            Per-query neighbor ids, and a (queries, k) similarity matrix
+            padded with -inf where fewer than ``k`` vectors are indexed
+        """
+        queries = self._normalize(np.atleast_2d(queries))
+        sims = np.full((len(queries), k), -np.inf)
+        ids: List[List[Hashable]] = []
+        if self._entry is None:
+            return [[] for _ in queries], sims
+
+        for row, query in enumerate(queries):
+            entries = [self._entry]
+            for layer in range(self._max_level, 0, -1):
+                entries = [self._search_layer(query, entries, 1, layer)[0][1]]
+            found = self._search_layer(query, entries, max(self.ef_search, k), 0)[:k]
+            ids.append([self.ids[n] for _, n in found])
+            sims[row, :len(found)] = [s for s, _ in found]
+        return ids, sims
@@ -0,0 +1,210 @@
+"""Two-level (in-process LRU, then Redis) cache for MCP tool results"""
+
+from collections import OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+import logging
+import time
+
+import orjson
+
+from src.config.settings import settings
+from src.services.redis_client import AsyncRedisClient, redis_client
+from src.services.single_flight import call_key
+
+logger = logging.getLogger("chimera.mcp_cache")
+
+
+class LRUByteCache:
+    """
+    In-process LRU of encoded values with per-entry expiry and a byte budget.
+
+    Entries are charged the size of their key and encoded value. Inserting
+    past ``max_bytes`` evicts least recently used entries first.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        size = len(key) + len(value)
+        if size > self.max_bytes:
+            return
+        self.delete(key)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            old_key, (_, old_value) = self._entries.popitem(last=False)
+            self.bytes -= len(old_key) + len(old_value)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= len(key) + len(entry[1])
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Drop every entry whose key starts with ``prefix``"""
+        keys = [k for k in self._entries if k.startswith(prefix)]
+        for key in keys:
+            self.delete(key)
+        return len(keys)
+
+
+class MCPResultCache:
+    """
+    Caches MCP tool results per tool TTL.
+
+    Lookups try the in-process LRU, then Redis; a Redis hit is copied into
+    the LRU. Only tools with a TTL in ``ttls`` are cached. Calling a write
+    tool listed in ``invalidations`` drops the cached results of the read
+    tools it affects: locally by deleting their LRU entries, and in Redis by
+    bumping a per-tool generation that every Redis entry is checked against.
+    Other processes keep serving their own LRU copies until those expire,
+    so local TTLs should stay short. When Redis fails the cache keeps
+    working in-process and retries Redis after ``redis_retry_interval``.
+    """
+
+    def __init__(
+        self,
+        client: AsyncRedisClient = redis_client,
+        ttls: Optional[Dict[str, int]] = None,
+        invalidations: Optional[Dict[str, List[str]]] = None,
+        max_bytes: int = settings.mcp_cache_max_bytes,
+        namespace: str = "chimera:mcp",
+        enabled: bool = settings.mcp_cache_enabled,
+        redis_retry_interval: float = 5.0
+    ):
+        self.client = client
+        self.ttls = settings.mcp_cache_ttls if ttls is None else ttls
+        self.invalidations = settings.mcp_cache_invalidations if invalidations is None else invalidations
+        self.local = LRUByteCache(max_bytes)
+        self.namespace = namespace
+        self.enabled = enabled
+        self.redis_retry_interval = redis_retry_interval
+        self.stats: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._redis_retry_at = 0.0
+
+    def _tool_prefix(self, server: str, tool: str) -> str:
+        return f"{self.namespace}:{server}:{tool}:"
+
+    def make_key(self, server: str, tool: str, arguments: Dict[str, Any]) -> str:
+        return self._tool_prefix(server, tool) + call_key(arguments)
+
+    def _generation_key(self, server: str, tool: str) -> str:
+        return f"{self.namespace}:generation:{server}:{tool}"
+
+    def _redis_available(self) -> bool:
+        return time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, tool: str, e: Exception) -> None:
+        logger.warning(f"MCP cache using in-process entries only for {self.redis_retry_interval}s: {e}")
+        self._redis_retry_at = time.monotonic() + self.redis_retry_interval
+        self.stats[tool]["errors"] += 1
+
+    async def get_or_call(
+        self,
+        server: str,
+        tool: str,
+        arguments: Dict[str, Any],
+        call: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Return a cached result or make the call, caching or invalidating as configured.
+
+        Args:
+            server: Registered server name
+            tool: Tool name
+            arguments: Tool arguments
+            call: Coroutine factory making the actual tool call
+
+        Returns:
+            The decoded tool result
+        """
+        if not self.enabled:
+            return await call()
+        ttl = self.ttls.get(tool)
+        if not ttl:
+            result = await call()
+            if tool in self.invalidations:
+                await self.invalidate(server, self.invalidations[tool])
+            return result
+
+        stats = self.stats[tool]
+        key = self.make_key(server, tool, arguments)
+        raw = self.local.get(key)
+        if raw is not None:
+            stats["local_hits"] += 1
+            return orjson.loads(raw)
+
+        generation = 0
+        if self._redis_available():
+            try:
+                raw, generation = await self.client.mget([key, self._generation_key(server, tool)])
+                generation = int(generation or 0)
+            except Exception as e:
+                self._redis_failed(tool, e)
+                raw = None
+            if raw is not None:
+                entry = orjson.loads(raw)
+                if entry["generation"] == generation:
+                    stats["redis_hits"] += 1
+                    self.local.set(key, orjson.dumps(entry["result"]), ttl)
+                    return entry["result"]
+
+        stats["misses"] += 1
+        result = await call()
+        encoded = orjson.dumps(result)
+        self.local.set(key, encoded, ttl)
+        if self._redis_available():
+            try:
+                entry = b'{"generation":%d,"result":%s}' % (generation, encoded)
+                await self.client.set(key, entry.decode(), ttl)
+            except Exception as e:
+                self._redis_failed(tool, e)
+        return result
+
+    async def invalidate(self, server: str, tools: Iterable[str]) -> None:
+        """Drop every cached result of these tools on ``server``"""
+        tools = list(tools)
+        for tool in tools:
+            dropped = self.local.delete_prefix(self._tool_prefix(server, tool))
+            self.stats[tool]["invalidations"] += 1
+            self.stats[tool]["invalidated_entries"] += dropped
+        if tools and self._redis_available():
+            try:
+                await self.client.incr_many(self._generation_key(server, t) for t in tools)
+            except Exception as e:
+                self._redis_failed(tools[0], e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-tool counters with hit ratio, plus LRU size and evictions"""
+        tools = {}
+        for tool, counters in self.stats.items():
+            hits = counters["local_hits"] + counters["redis_hits"]
+            lookups = hits + counters["misses"]
+            tools[tool] = {**counters, "hit_ratio": round(hits / lookups, 4) if lookups else 0.0}
+        return {
+            "enabled": self.enabled,
+            "entries": len(self.local),
+            "bytes": self.local.bytes,
+            "max_bytes": self.local.max_bytes,
+            "evictions": self.local.evictions,
+            "tools": tools
+        }
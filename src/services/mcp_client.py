@@ -1,74 +1,658 @@
 """MCP client infrastructure for connecting to MCP servers"""
 
-from typing import Dict, Optional, Any
+from typing import Any, AsyncContextManager, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+import asyncio
+import json
 import logging
+import time
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.server import Server
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.types import CallToolResult, TextContent
+from pydantic import AnyUrl
+
+from mcp_servers.payloads import JSON, decode_contents
+from src.config.settings import settings
+from src.services.mcp_cache import MCPResultCache
+from src.services.resilience import CircuitBreaker, LatencyWindow, hedged
+from src.services.single_flight import SingleFlight, call_key
+from src.utils.error_handler import MCPServerError
 
 logger = logging.getLogger("chimera.mcp_client")
 
+# Names the bundled servers are registered under (see register_default_servers)
+SOCIAL_MEDIA_SERVER = "social_media"
+OPENCLAW_SERVER = "openclaw"
+
+# Opens one initialized MCP session, kept open for the life of the context
+SessionFactory = Callable[[], AsyncContextManager[ClientSession]]
+
+
+def parse_tool_result(result: CallToolResult, server_name: str) -> Dict[str, Any]:
+    """
+    Decode an MCP tool result, JSON text or msgpack blob.
+    
+    Raises:
+        MCPServerError: If the tool reported an error
+    """
+    if result.isError:
+        # The server answered; the tool itself failed
+        text = "".join(c.text for c in result.content if isinstance(c, TextContent))
+        raise MCPServerError(text or "Tool call failed", server_name, {"tool_error": True})
+    return decode_contents(result.content)
+
+
+async def iter_tool_pages(
+    call: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    arguments: Dict[str, Any],
+    page_size: Optional[int] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield the pages of a cursor-paginated tool, following ``next_cursor``.
+    
+    Each page is requested only once the previous one has been consumed,
+    so the caller holds one page at a time.
+    
+    Args:
+        call: Makes one tool call with the given arguments
+        arguments: Tool arguments for the first page
+        page_size: Items per page (omitted: the tool's default)
+    """
+    arguments = dict(arguments)
+    if page_size:
+        arguments["page_size"] = page_size
+    while True:
+        page = await call(arguments)
+        yield page
+        cursor = page.get("next_cursor")
+        if not cursor:
+            return
+        arguments = {**arguments, "cursor": cursor}
+
+
+def in_process_session_factory(server: Server) -> SessionFactory:
+    """Sessions over in-memory streams to a server running in this process"""
+    return lambda: create_connected_server_and_client_session(server)
+
+
+def http_session_factory(url: str, timeout: float = 30.0) -> SessionFactory:
+    """Sessions over the streamable HTTP transport"""
+    @asynccontextmanager
+    async def open_session():
+        async with streamablehttp_client(url, timeout=timeout) as (read, write, _):
+            async with ClientSession(read, write, read_timeout_seconds=timedelta(seconds=timeout)) as session:
+                await session.initialize()
+                yield session
+    return open_session
+
 
 class MCPClient(ABC):
     """Abstract base class for MCP clients"""
     
     @abstractmethod
-    def connect(self) -> None:
+    async def connect(self) -> None:
         """Connect to MCP server"""
         pass
     
     @abstractmethod
-    def disconnect(self) -> None:
+    async def disconnect(self) -> None:
         """Disconnect from MCP server"""
         pass
     
     @abstractmethod
-    def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call MCP tool"""
         pass
     
     @abstractmethod
-    def get_resource(self, resource_name: str) -> Dict[str, Any]:
+    async def get_resource(self, resource_name: str) -> Dict[str, Any]:
         """Get MCP resource"""
         pass
 
 
+class _PooledSession:
+    """
+    One long-lived MCP session.
+    
+    The session context is entered and exited by a dedicated task, because
+    the transports' anyio task groups must be closed by the task that opened
+    them, while calls on the session come from many request tasks.
+    """
+    
+    def __init__(self, factory: SessionFactory):
+        self.factory = factory
+        self.session: Optional[ClientSession] = None
+        self.in_flight = 0
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+    
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+    
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+        await self._ready.wait()
+        if self._error is not None:
+            raise self._error
+    
+    async def _run(self) -> None:
+        try:
+            async with self.factory() as session:
+                self.session = session
+                self._ready.set()
+                await self._closing.wait()
+        except Exception as e:
+            self._error = e
+            if self.session is not None:
+                logger.warning(f"MCP session closed unexpectedly: {e}")
+        finally:
+            self.session = None
+            self._ready.set()
+    
+    async def stop(self) -> None:
+        self._closing.set()
+        if self._task is not None:
+            await self._task
+
+
+class PooledMCPClient(MCPClient):
+    """
+    Asyncio MCP client multiplexing calls over a small pool of sessions.
+    
+    MCP is JSON-RPC with request ids, so one session carries many
+    concurrent requests. Sessions are opened lazily, up to ``pool_size``,
+    whenever every open session already has calls in flight. Dead sessions
+    are dropped and replaced on the next call. ``max_concurrency`` caps the
+    calls in flight to this server. ``encoding`` is the tool result encoding
+    asked of the server on every call (see mcp_servers.payloads).
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        session_factory: SessionFactory,
+        pool_size: int = settings.mcp_pool_size,
+        max_concurrency: int = settings.mcp_max_concurrency,
+        encoding: str = settings.mcp_payload_encoding
+    ):
+        self.name = name
+        self.session_factory = session_factory
+        self.pool_size = pool_size
+        self.max_concurrency = max_concurrency
+        self.encoding = encoding
+        self._sessions: List[_PooledSession] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._open_lock: Optional[asyncio.Lock] = None
+    
+    def _bind_loop(self) -> None:
+        """Reset loop-bound state when used from a new event loop (e.g. asyncio.run per call)"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Sessions of a closed loop were cancelled with it
+            self._sessions = []
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._open_lock = asyncio.Lock()
+            self._loop = loop
+    
+    async def _open_session(self) -> _PooledSession:
+        pooled = _PooledSession(self.session_factory)
+        try:
+            await pooled.start()
+        except Exception as e:
+            raise MCPServerError(f"Failed to open session to {self.name}: {e}", self.name) from e
+        self._sessions.append(pooled)
+        logger.info(f"Opened MCP session {len(self._sessions)}/{self.pool_size} to {self.name}")
+        return pooled
+    
+    async def _acquire_session(self) -> _PooledSession:
+        self._sessions = [s for s in self._sessions if s.alive]
+        if len(self._sessions) < self.pool_size and all(s.in_flight for s in self._sessions):
+            async with self._open_lock:
+                self._sessions = [s for s in self._sessions if s.alive]
+                if len(self._sessions) < self.pool_size and all(s.in_flight for s in self._sessions):
+                    try:
+                        return await self._open_session()
+                    except MCPServerError:
+                        if not self._sessions:
+                            raise
+        return min(self._sessions, key=lambda s: s.in_flight)
+    
+    async def connect(self) -> None:
+        """Open the first session, failing fast if the server is unreachable"""
+        self._bind_loop()
+        if not any(s.alive for s in self._sessions):
+            await self._open_session()
+    
+    async def disconnect(self) -> None:
+        """Close every pooled session"""
+        if self._loop is not None and self._loop is asyncio.get_running_loop():
+            await asyncio.gather(*(s.stop() for s in self._sessions), return_exceptions=True)
+        self._sessions = []
+    
+    async def _request(self, method: str, *args: Any) -> Any:
+        self._bind_loop()
+        async with self._semaphore:
+            pooled = await self._acquire_session()
+            pooled.in_flight += 1
+            try:
+                return await getattr(pooled.session, method)(*args)
+            except MCPServerError:
+                raise
+            except Exception as e:
+                raise MCPServerError(f"{method} failed on {self.name}: {e}", self.name) from e
+            finally:
+                pooled.in_flight -= 1
+    
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call a tool and decode its result.
+        
+        Raises:
+            MCPServerError: If the session fails or the tool reports an error
+        """
+        if self.encoding != JSON:
+            arguments = {**arguments, "encoding": self.encoding}
+        result = await self._request("call_tool", tool_name, arguments)
+        return parse_tool_result(result, self.name)
+    
+    async def get_resource(self, resource_name: str) -> Dict[str, Any]:
+        """Read a resource, decoding JSON text contents"""
+        result = await self._request("read_resource", AnyUrl(resource_name))
+        text = "".join(getattr(c, "text", "") for c in result.contents)
+        try:
+            return json.loads(text)
+        except ValueError:
+            return {"text": text}
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Open sessions and calls in flight"""
+        alive = [s for s in self._sessions if s.alive]
+        return {
+            "sessions": len(alive),
+            "pool_size": self.pool_size,
+            "in_flight": sum(s.in_flight for s in alive),
+            "max_concurrency": self.max_concurrency,
+            "encoding": self.encoding
+        }
+
+
+class InProcessMCPClient(PooledMCPClient):
+    """Pooled client for an MCP server running in this process"""
+    
+    def __init__(self, server: Server, name: Optional[str] = None, **kwargs: Any):
+        super().__init__(name or server.name, in_process_session_factory(server), **kwargs)
+        self.server = server
+
+
+class ManagedToolClient:
+    """
+    ToolClient for one server registered with an MCPClientManager.
+    
+    Calls go through the manager, so they share its pooled sessions,
+    coalescing, result cache, circuit breaker and connection status.
+    """
+    
+    def __init__(self, manager: "MCPClientManager", server_name: str):
+        self.manager = manager
+        self.server_name = server_name
+    
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.manager.call_tool(self.server_name, tool_name, arguments)
+
+
+class ServerStatus:
+    """Connection states of a registered MCP server"""
+    PENDING = "pending"
+    CONNECTED = "connected"
+    DEGRADED = "degraded"
+    DISCONNECTED = "disconnected"
+
+
+@dataclass
+class ServerState:
+    """Connection state of one registered server"""
+    url: str
+    status: str = ServerStatus.PENDING
+    connect_ms: Optional[int] = None
+    error: Optional[str] = None
+    last_attempt: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "url": self.url,
+            "connect_ms": self.connect_ms,
+            "error": self.error
+        }
+
+
 class MCPClientManager:
-    """Manages connections to multiple MCP servers"""
+    """
+    Manages connections to multiple MCP servers.
     
-    def __init__(self):
+    Servers are connected in parallel, each under its own deadline. A server
+    that fails to connect is marked degraded instead of aborting startup:
+    calls to it fail fast with MCPServerError until ``reconnect_interval``
+    has passed, when the next call retries the connection. In lazy mode
+    nothing is connected up front and each server connects on first use.
+    
+    With ``coalesce``, concurrent calls to one of ``coalesce_tools`` with
+    the same server and arguments share one upstream request and its
+    result, so agents asking for the same trends at once spend one
+    platform request between them. Only idempotent reads belong there:
+    two identical writes (e.g. send_agent_message) must both be sent.
+    Results of tools with a cache TTL are served from ``result_cache``.
+    
+    Each server has a circuit breaker: after ``breaker_threshold``
+    consecutive failures or timeouts (``call_timeout``) its calls fail fast
+    for ``breaker_recovery`` seconds, then a probe call decides whether it
+    closes again. Tool errors reported by a healthy server don't count.
+    Calls to ``hedged_tools``, which must be idempotent reads, send a
+    duplicate once the call has run longer than the tool's recent
+    ``hedge_percentile`` latency, and take whichever answers first.
+    """
+    
+    def __init__(
+        self,
+        connect_timeout: float = settings.mcp_connect_timeout,
+        lazy: bool = settings.mcp_lazy_connect,
+        reconnect_interval: float = settings.mcp_reconnect_interval,
+        coalesce: bool = settings.mcp_coalesce_calls,
+        coalesce_tools: Optional[Iterable[str]] = None,
+        result_cache: Optional[MCPResultCache] = None,
+        call_timeout: float = settings.mcp_call_timeout,
+        breaker_threshold: int = settings.mcp_breaker_failure_threshold,
+        breaker_recovery: float = settings.mcp_breaker_recovery_timeout,
+        hedged_tools: Optional[Iterable[str]] = None,
+        hedge_percentile: float = settings.mcp_hedge_percentile,
+        hedge_min_samples: int = settings.mcp_hedge_min_samples
+    ):
         self.clients: Dict[str, MCPClient] = {}
         self.server_urls: Dict[str, str] = {}
+        self.states: Dict[str, ServerState] = {}
+        self.connect_timeout = connect_timeout
+        self.lazy = lazy
+        self.reconnect_interval = reconnect_interval
+        self.coalesce = coalesce
+        self.coalesce_tools = set(settings.mcp_coalesce_tools if coalesce_tools is None else coalesce_tools)
+        self.single_flight = SingleFlight()
+        self.result_cache = result_cache or MCPResultCache()
+        self.call_timeout = call_timeout
+        self.breaker_threshold = breaker_threshold
+        self.breaker_recovery = breaker_recovery
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.hedged_tools = set(settings.mcp_hedged_tools if hedged_tools is None else hedged_tools)
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.latencies: Dict[Tuple[str, str], LatencyWindow] = defaultdict(LatencyWindow)
+        self.hedge_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._connect_locks: Dict[str, asyncio.Lock] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
-    def register_server(self, name: str, url: str, client: MCPClient) -> None:
-        """Register an MCP server"""
+    def register_server(self, name: str, url: str, client: Optional[MCPClient] = None) -> None:
+        """
+        Register an MCP server.
+        
+        Without an explicit client, a pooled streamable HTTP client is
+        created for ``url``.
+        """
         self.server_urls[name] = url
-        self.clients[name] = client
+        self.clients[name] = client or PooledMCPClient(name, http_session_factory(url))
+        self.states[name] = ServerState(url)
+        self.breakers[name] = CircuitBreaker(name, self.breaker_threshold, self.breaker_recovery)
         logger.info(f"Registered MCP server: {name} at {url}")
     
+    def register_default_servers(self) -> None:
+        """
+        Register the bundled social media and OpenClaw servers, unless
+        already registered.
+        
+        Each is reached at its configured URL (``mcp_social_media_url``,
+        ``mcp_openclaw_url``), or run in this process when that is empty.
+        """
+        from mcp_servers.openclaw import server as openclaw_server
+        from mcp_servers.social_media import server as social_media_server
+        
+        for name, url, server in (
+            (SOCIAL_MEDIA_SERVER, settings.mcp_social_media_url, social_media_server),
+            (OPENCLAW_SERVER, settings.mcp_openclaw_url, openclaw_server),
+        ):
+            if name in self.clients:
+                continue
+            if url:
+                self.register_server(name, url)
+            else:
+                self.register_server(name, f"in-process://{server.name}", InProcessMCPClient(server, name=name))
+    
+    def tool_client(self, server_name: str) -> ManagedToolClient:
+        """ToolClient calling a registered server through this manager"""
+        self.get_client(server_name)
+        return ManagedToolClient(self, server_name)
+    
     def get_client(self, server_name: str) -> MCPClient:
         """Get MCP client for a server"""
         if server_name not in self.clients:
             raise ValueError(f"MCP server '{server_name}' not registered")
         return self.clients[server_name]
     
-    def connect_all(self) -> None:
-        """Connect to all registered servers"""
-        for name, client in self.clients.items():
-            try:
-                client.connect()
-                logger.info(f"Connected to MCP server: {name}")
-            except Exception as e:
-                logger.error(f"Failed to connect to MCP server {name}: {e}")
-                raise
+    async def _connect_server(self, name: str) -> ServerState:
+        """Connect one server within the deadline, recording the outcome; never raises"""
+        state = self.states[name]
+        state.last_attempt = time.monotonic()
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.clients[name].connect(), timeout=self.connect_timeout)
+            state.status = ServerStatus.CONNECTED
+            state.error = None
+        except asyncio.TimeoutError:
+            state.status = ServerStatus.DEGRADED
+            state.error = f"Connect timed out after {self.connect_timeout}s"
+        except Exception as e:
+            state.status = ServerStatus.DEGRADED
+            state.error = str(e) or type(e).__name__
+        state.connect_ms = round((time.perf_counter() - start) * 1000)
+        
+        if state.status == ServerStatus.CONNECTED:
+            logger.info(f"Connected to MCP server {name} in {state.connect_ms} ms")
+        else:
+            logger.error(f"MCP server {name} degraded after {state.connect_ms} ms: {state.error}")
+        return state
+    
+    async def ensure_connected(self, server_name: str) -> None:
+        """
+        Connect a pending server, or retry a degraded one once
+        ``reconnect_interval`` has passed.
+        
+        Raises:
+            MCPServerError: If the server is degraded
+        """
+        state = self.states[server_name]
+        if state.status == ServerStatus.CONNECTED:
+            return
+        async with self._connect_lock(server_name):
+            if state.status == ServerStatus.CONNECTED:
+                return
+            retry_due = time.monotonic() - state.last_attempt >= self.reconnect_interval
+            if state.status != ServerStatus.DEGRADED or retry_due:
+                await self._connect_server(server_name)
+            if state.status == ServerStatus.DEGRADED:
+                raise MCPServerError(
+                    f"MCP server {server_name} is degraded: {state.error}",
+                    server_name,
+                    {"status": state.status}
+                )
+    
+    def _connect_lock(self, server_name: str) -> asyncio.Lock:
+        """Per-server connect lock of the running event loop"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._connect_locks = {}
+            self._loop = loop
+        if server_name not in self._connect_locks:
+            self._connect_locks[server_name] = asyncio.Lock()
+        return self._connect_locks[server_name]
+    
+    def hedge_delay(self, server_name: str, tool_name: str) -> Optional[float]:
+        """Seconds after which a hedged tool call gets a duplicate, or None to not hedge"""
+        window = self.latencies[(server_name, tool_name)]
+        if tool_name not in self.hedged_tools or len(window) < self.hedge_min_samples:
+            return None
+        return window.percentile(self.hedge_percentile)
+    
+    async def _send(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        client = self.clients[server_name]
+        delay = self.hedge_delay(server_name, tool_name)
+        if delay is None:
+            return await client.call_tool(tool_name, arguments)
+        stats = self.hedge_stats[f"{server_name}.{tool_name}"]
+        return await hedged(
+            lambda: client.call_tool(tool_name, arguments),
+            delay,
+            on_hedge=lambda: stats.__setitem__("hedged", stats["hedged"] + 1),
+            on_hedge_win=lambda: stats.__setitem__("hedge_wins", stats["hedge_wins"] + 1)
+        )
     
-    def disconnect_all(self) -> None:
+    async def _call_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        breaker = self.breakers[server_name]
+        breaker.before_call()
+        start = time.perf_counter()
+        try:
+            await self.ensure_connected(server_name)
+            result = await asyncio.wait_for(
+                self._send(server_name, tool_name, arguments),
+                timeout=self.call_timeout
+            )
+        except asyncio.TimeoutError as e:
+            breaker.record_failure()
+            raise MCPServerError(
+                f"{tool_name} on {server_name} timed out after {self.call_timeout}s",
+                server_name,
+                {"timeout": self.call_timeout}
+            ) from e
+        except MCPServerError as e:
+            if e.details.get("tool_error"):
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+            raise
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        self.latencies[(server_name, tool_name)].add(time.perf_counter() - start)
+        return result
+    
+    async def _call_coalesced(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.coalesce or tool_name not in self.coalesce_tools:
+            return await self._call_tool(server_name, tool_name, arguments)
+        return await self.single_flight.run(
+            call_key(server_name, tool_name, arguments),
+            lambda: self._call_tool(server_name, tool_name, arguments),
+            label=f"{server_name}.{tool_name}"
+        )
+    
+    async def call_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool on a registered server, connecting it first if needed"""
+        self.get_client(server_name)
+        return await self.result_cache.get_or_call(
+            server_name,
+            tool_name,
+            arguments,
+            lambda: self._call_coalesced(server_name, tool_name, arguments)
+        )
+    
+    def iter_pages(
+        self,
+        server_name: str,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        page_size: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate the pages of a cursor-paginated tool; each page goes through call_tool"""
+        return iter_tool_pages(lambda args: self.call_tool(server_name, tool_name, args), arguments, page_size)
+    
+    async def connect_all(self, lazy: Optional[bool] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Connect to all registered servers in parallel.
+        
+        Failures and timeouts mark a server degraded rather than raising.
+        With ``lazy`` (defaults to the manager setting) servers are left
+        pending and connect on first use.
+        
+        Returns:
+            Per-server status, as from get_status
+        """
+        lazy = self.lazy if lazy is None else lazy
+        if lazy:
+            logger.info(f"Lazy MCP connect: {len(self.clients)} servers will connect on first use")
+            return self.get_status()
+        
+        start = time.perf_counter()
+        await asyncio.gather(*(self._connect_server(name) for name in self.clients))
+        elapsed_ms = round((time.perf_counter() - start) * 1000)
+        degraded = [n for n, s in self.states.items() if s.status == ServerStatus.DEGRADED]
+        logger.info(
+            f"Connected {len(self.clients) - len(degraded)}/{len(self.clients)} MCP servers "
+            f"in {elapsed_ms} ms" + (f" (degraded: {', '.join(degraded)})" if degraded else "")
+        )
+        return self.get_status()
+    
+    async def disconnect_all(self) -> None:
         """Disconnect from all servers"""
         for name, client in self.clients.items():
             try:
-                client.disconnect()
+                await client.disconnect()
                 logger.info(f"Disconnected from MCP server: {name}")
             except Exception as e:
                 logger.error(f"Error disconnecting from MCP server {name}: {e}")
+            self.states[name].status = ServerStatus.DISCONNECTED
+    
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """Status, URL, last connect time (ms), error and circuit breaker per server"""
+        return {
+            name: {**state.to_dict(), "circuit": self.breakers[name].to_dict()}
+            for name, state in self.states.items()
+        }
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Coalescing counters per ``server.tool`` and result cache metrics"""
+        return {
+            "coalescing": {
+                "enabled": self.coalesce,
+                "in_flight": self.single_flight.in_flight,
+                "tools": self.single_flight.get_stats()
+            },
+            "cache": self.result_cache.get_stats(),
+            "hedging": {
+                f"{server}.{tool}": {
+                    **self.hedge_stats[f"{server}.{tool}"],
+                    "hedge_delay_ms": round(self.hedge_delay(server, tool) * 1000, 1)
+                }
+                for server, tool in list(self.latencies)
+                if self.hedge_delay(server, tool) is not None
+            }
+        }
 
 
-# Global MCP client manager
+# Global MCP client manager; the API lifespan registers the default servers and connects them
 mcp_client_manager = MCPClientManager()
+
+
+def managed_tool_client(server_name: str = SOCIAL_MEDIA_SERVER) -> ManagedToolClient:
+    """ToolClient for a default server through the global manager, registering the defaults if needed"""
+    mcp_client_manager.register_default_servers()
+    return mcp_client_manager.tool_client(server_name)
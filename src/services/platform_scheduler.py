@@ -0,0 +1,395 @@
+"""Rate-limit-aware per-platform request scheduling (FR-009, SC-005)"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+import uuid
+
+import orjson
+from sqlalchemy import text
+
+from src.config.settings import settings
+from src.models.trend import Platform
+from src.services.database import Database, database
+from src.utils.error_handler import RateLimitError
+
+logger = logging.getLogger("chimera.platform_scheduler")
+
+LOAD_STATUS_SQL = text("""
+SELECT platform_name, rate_limit_status
+FROM platform_connections
+""")
+
+SAVE_STATUS_SQL = text("""
+INSERT INTO platform_connections (connection_id, platform_name, connection_status, rate_limit_status)
+VALUES (:connection_id, :platform, 'CONNECTED', CAST(:status AS json))
+ON CONFLICT ON CONSTRAINT uq_platform_connection_platform_name DO UPDATE SET
+    rate_limit_status = EXCLUDED.rate_limit_status,
+    updated_at = now()
+""")
+
+
+def _epoch(value: Any) -> Optional[float]:
+    """Epoch seconds from an epoch number, ISO 8601 string or datetime"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+@dataclass
+class RateLimitState:
+    """
+    One platform's request budget for the current window.
+
+    Mirrors ``PlatformConnection.rate_limit_status``
+    ({remaining_requests, reset_timestamp, limit_per_window}).
+    """
+    limit_per_window: int
+    window_seconds: float
+    remaining_requests: int
+    reset_timestamp: float
+
+    def refill(self, now: float) -> None:
+        """Start a new window once the reset time has passed"""
+        if now >= self.reset_timestamp:
+            self.remaining_requests = self.limit_per_window
+            self.reset_timestamp = now + self.window_seconds
+
+    def to_status(self) -> Dict[str, Any]:
+        """Serialize in the PlatformConnection.rate_limit_status shape"""
+        reset = datetime.fromtimestamp(self.reset_timestamp, timezone.utc)
+        return {
+            "remaining_requests": self.remaining_requests,
+            "reset_timestamp": reset.isoformat().replace("+00:00", "Z"),
+            "limit_per_window": self.limit_per_window
+        }
+
+
+@dataclass(order=True)
+class _Job:
+    sort_key: tuple
+    call: Callable[[], Awaitable[Any]] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    deadline: Optional[float] = field(compare=False, default=None)
+    attempts: int = field(compare=False, default=0)
+
+
+class PlatformScheduler:
+    """
+    Spends each platform's rate-limit budget on the most valuable requests.
+
+    Calls are queued per platform and started, highest priority first,
+    while the platform has requests left in its window. When the budget
+    runs out the queue waits until the window resets (plus a little jitter,
+    so several processes don't resume in lockstep). A call that still hits
+    the platform's rate limit (raises RateLimitError) is not dropped: the
+    window is closed until its ``retry_after`` (or an exponential backoff
+    with full jitter when the platform gave none) and the call is requeued
+    ahead of newer calls of the same priority. A queued call whose caller
+    deadline falls before the platform resets fails fast with
+    RateLimitError instead of waiting in vain.
+
+    With a ``db``, ``load`` seeds the budgets from
+    ``PlatformConnection.rate_limit_status`` and every change to a budget
+    (a call started, a rate limit hit, a reported status) is written back
+    in the background, so restarts and other processes see the same budget.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        window_seconds: float = settings.platform_rate_limit_window,
+        backoff_base: float = settings.platform_backoff_base,
+        backoff_max: float = settings.platform_backoff_max,
+        jitter: float = settings.platform_backoff_jitter,
+        max_attempts: int = settings.platform_max_attempts,
+        clock: Callable[[], float] = time.time,
+        db: Optional[Database] = None
+    ):
+        self.limits = settings.platform_rate_limits if limits is None else limits
+        self.window_seconds = window_seconds
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.max_attempts = max_attempts
+        self.clock = clock
+        self.db = db
+        self.states: Dict[str, RateLimitState] = {}
+        self.stats: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._seq = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queues: Dict[str, List[_Job]] = {}
+        self._wakeups: Dict[str, asyncio.Event] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self._running: set = set()
+        self._unsaved: set = set()
+        self._save_task: Optional[asyncio.Task] = None
+
+    def _bind_loop(self) -> None:
+        """Reset loop-bound state when used from a new event loop; budgets are kept"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._queues = defaultdict(list)
+            self._wakeups = defaultdict(asyncio.Event)
+            self._workers = {}
+            self._running = set()
+            self._loop = loop
+
+    def state_for(self, platform: str) -> RateLimitState:
+        state = self.states.get(platform)
+        if state is None:
+            limit = self.limits.get(platform, settings.platform_default_rate_limit)
+            state = RateLimitState(limit, self.window_seconds, limit, self.clock() + self.window_seconds)
+            self.states[platform] = state
+        state.refill(self.clock())
+        return state
+
+    def update_from_status(self, platform: str, status: Dict[str, Any]) -> None:
+        """
+        Adopt a platform-reported budget, e.g. a stored
+        ``PlatformConnection.rate_limit_status`` or fresh rate limit headers.
+        """
+        state = self.state_for(platform)
+        if status.get("limit_per_window") is not None:
+            state.limit_per_window = int(status["limit_per_window"])
+        if status.get("remaining_requests") is not None:
+            state.remaining_requests = int(status["remaining_requests"])
+        reset = _epoch(status.get("reset_timestamp"))
+        if reset is not None:
+            state.reset_timestamp = reset
+        if platform in self._wakeups:
+            self._wakeups[platform].set()
+        self._changed(platform)
+
+    def record_rate_limit(self, platform: str, retry_after: Optional[float] = None, attempt: int = 1) -> None:
+        """Close the platform's window until ``retry_after`` or an exponential backoff"""
+        state = self.state_for(platform)
+        if retry_after is None:
+            retry_after = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+        state.remaining_requests = 0
+        state.reset_timestamp = self.clock() + retry_after
+        self.stats[platform]["rate_limited"] += 1
+        logger.warning(f"{platform} rate limited, resuming in {retry_after:.1f}s")
+        self._changed(platform)
+
+    def try_acquire(self, platform: str) -> bool:
+        """Take one request from the budget now, if any is left and nothing is queued ahead"""
+        self._bind_loop()
+        state = self.state_for(platform)
+        if state.remaining_requests <= 0 or self._queues.get(platform):
+            return False
+        state.remaining_requests -= 1
+        self.stats[platform]["executed"] += 1
+        self._changed(platform)
+        return True
+
+    def release(self, platform: str) -> None:
+        """Return a request taken with ``try_acquire`` that was never sent"""
+        state = self.state_for(platform)
+        state.remaining_requests = min(state.remaining_requests + 1, state.limit_per_window)
+        self.stats[platform]["executed"] -= 1
+        self._changed(platform)
+
+    def reset_in(self, platform: str) -> float:
+        """Seconds until the platform has budget again (0 if it has some now)"""
+        state = self.state_for(platform)
+        if state.remaining_requests > 0:
+            return 0.0
+        return max(0.0, state.reset_timestamp - self.clock())
+
+    async def submit(
+        self,
+        platform: str,
+        call: Callable[[], Awaitable[Any]],
+        priority: float = 0,
+        deadline: Optional[float] = None
+    ) -> Any:
+        """
+        Run ``call`` when the platform's budget allows.
+
+        Args:
+            platform: Platform whose budget the call spends
+            call: Coroutine factory making one platform request
+            priority: Higher runs first
+            deadline: Epoch seconds (per ``clock``) after which the caller gives up
+
+        Returns:
+            The call's result
+
+        Raises:
+            RateLimitError: If the platform won't reset before ``deadline``,
+                or the call stayed rate limited for ``max_attempts`` attempts
+        """
+        self._bind_loop()
+        future = asyncio.get_running_loop().create_future()
+        job = _Job((-priority, next(self._seq)), call, future, deadline)
+        heapq.heappush(self._queues[platform], job)
+        self.stats[platform]["submitted"] += 1
+        self._wake(platform)
+        return await future
+
+    def _wake(self, platform: str) -> None:
+        self._wakeups[platform].set()
+        worker = self._workers.get(platform)
+        if worker is None or worker.done():
+            self._workers[platform] = asyncio.create_task(self._drain(platform))
+
+    async def _drain(self, platform: str) -> None:
+        """Start queued calls as budget allows; exits when the queue is empty"""
+        queue = self._queues[platform]
+        wakeup = self._wakeups[platform]
+        while True:
+            while queue and queue[0].future.done():
+                heapq.heappop(queue)
+            if not queue:
+                return
+
+            delay = self.reset_in(platform)
+            if delay > 0:
+                self._expire(platform, queue, self.clock() + delay)
+                wakeup.clear()
+                try:
+                    # Woken early if the budget is updated from outside
+                    await asyncio.wait_for(wakeup.wait(), delay + random.uniform(0, self.jitter))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            job = heapq.heappop(queue)
+            self.state_for(platform).remaining_requests -= 1
+            self.stats[platform]["executed"] += 1
+            self._changed(platform)
+            task = asyncio.create_task(self._execute(platform, job))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    def _expire(self, platform: str, queue: List[_Job], resume_at: float) -> None:
+        """Fail queued calls whose deadline passes before the platform resumes"""
+        for job in queue:
+            if job.deadline is not None and job.deadline < resume_at and not job.future.done():
+                self.stats[platform]["expired"] += 1
+                job.future.set_exception(RateLimitError(
+                    f"{platform} rate limit resets after the caller's deadline",
+                    platform=platform,
+                    retry_after=round(resume_at - self.clock())
+                ))
+
+    async def _execute(self, platform: str, job: _Job) -> None:
+        job.attempts += 1
+        try:
+            result = await job.call()
+        except RateLimitError as e:
+            self.record_rate_limit(platform, e.details.get("retry_after"), job.attempts)
+            if job.future.done():
+                return
+            if job.attempts >= self.max_attempts:
+                self.stats[platform]["failed"] += 1
+                job.future.set_exception(e)
+                return
+            self.stats[platform]["requeued"] += 1
+            heapq.heappush(self._queues[platform], job)
+            self._wake(platform)
+            return
+        except Exception as e:
+            if not job.future.done():
+                job.future.set_exception(e)
+            return
+
+        if isinstance(result, dict) and isinstance(result.get("rate_limit"), dict):
+            self.update_from_status(platform, result["rate_limit"])
+        if not job.future.done():
+            job.future.set_result(result)
+
+    async def load(self) -> int:
+        """
+        Seed budgets from each platform's stored rate_limit_status.
+
+        Returns:
+            Platforms loaded (0 without a ``db`` or when it is unavailable)
+        """
+        if self.db is None:
+            return 0
+        try:
+            async with self.db.get_engine().connect() as conn:
+                rows = (await conn.execute(LOAD_STATUS_SQL)).all()
+        except Exception as e:
+            logger.warning(f"Could not load platform rate limits, using configured budgets: {e}")
+            return 0
+        loaded = 0
+        for row in rows:
+            status = row.rate_limit_status
+            if isinstance(status, (str, bytes)):
+                status = orjson.loads(status)
+            if status:
+                self.update_from_status(Platform[row.platform_name].value, status)
+                loaded += 1
+        self._unsaved.clear()
+        return loaded
+
+    def _changed(self, platform: str) -> None:
+        """Queue the platform's budget to be written back to platform_connections"""
+        if self.db is None or platform not in Platform._value2member_map_:
+            return
+        self._unsaved.add(platform)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._save_task is None or self._save_task.done():
+            self._save_task = loop.create_task(self._save_loop())
+
+    async def _save_loop(self) -> None:
+        # Changes made while a write is in flight are picked up by the next one
+        while self._unsaved:
+            if not await self.save():
+                return
+
+    async def save(self) -> bool:
+        """Write changed budgets to platform_connections; failed writes are retried on the next change"""
+        platforms, self._unsaved = self._unsaved, set()
+        params = [
+            {
+                "connection_id": uuid.uuid4(),
+                "platform": Platform(p).name,
+                "status": orjson.dumps(self.states[p].to_status()).decode()
+            }
+            for p in sorted(platforms) if p in self.states
+        ]
+        if not params:
+            return True
+        try:
+            async with self.db.get_engine().begin() as conn:
+                await conn.execute(SAVE_STATUS_SQL, params)
+        except Exception as e:
+            self._unsaved |= platforms
+            logger.warning(f"Could not save platform rate limits: {e}")
+            return False
+        return True
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Budget, queue depth and counters per platform"""
+        return {
+            platform: {
+                **state.to_status(),
+                "queued": sum(not j.future.done() for j in self._queues.get(platform, [])),
+                **self.stats[platform]
+            }
+            for platform, state in self.states.items()
+        }
+
+
+# Global scheduler, sharing each platform's budget through platform_connections
+platform_scheduler = PlatformScheduler(db=database)
@@ -0,0 +1,221 @@
+"""Token-bucket rate limiting shared across API workers"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+import math
+import time
+
+from src.config.security import SecuritySettings, get_security_settings
+from src.services.redis_client import AsyncRedisClient, redis_client
+
+logger = logging.getLogger("chimera.rate_limiter")
+
+# Refills and checks every bucket in KEYS, then consumes one token from each
+# only if all of them have one, so a request never drains one bucket while
+# being rejected by another. ARGV holds (capacity, tokens per ms) per key.
+# Redis server time is used so workers with skewed clocks agree.
+TOKEN_BUCKET_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+local levels = {}
+local allowed = 1
+local retry_after = 0
+for i = 1, #KEYS do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local rate = tonumber(ARGV[2 * i])
+    local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    levels[i] = tokens
+    if tokens < 1 then
+        allowed = 0
+        retry_after = math.max(retry_after, math.ceil((1 - tokens) / rate))
+    end
+end
+local tightest = 1
+for i = 1, #KEYS do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local rate = tonumber(ARGV[2 * i])
+    if allowed == 1 then
+        levels[i] = levels[i] - 1
+    end
+    redis.call('HSET', KEYS[i], 'tokens', tostring(levels[i]), 'ts', now)
+    redis.call('PEXPIRE', KEYS[i], math.ceil(capacity / rate) + 1000)
+    if levels[i] < levels[tightest] then
+        tightest = i
+    end
+end
+return {allowed, retry_after, math.floor(levels[tightest]), tightest - 1}
+"""
+
+
+@dataclass(frozen=True)
+class TokenBucket:
+    """A bucket holding up to ``capacity`` tokens, refilled continuously"""
+    key: str
+    capacity: int
+    refill_per_second: float
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of one rate limit check"""
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float = 0.0
+
+    @property
+    def retry_after_seconds(self) -> int:
+        """Retry-After header value, rounded up to whole seconds"""
+        return max(1, math.ceil(self.retry_after))
+
+
+class LocalTokenBuckets:
+    """
+    In-process token buckets used while Redis is unreachable.
+
+    Limits only hold per worker, so the effective cluster-wide limit is
+    multiplied by the number of workers until Redis comes back.
+    """
+
+    def __init__(self, max_keys: int = 10_000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def acquire(self, buckets: Sequence[TokenBucket]) -> RateLimitDecision:
+        now = time.monotonic()
+        levels = []
+        for bucket in buckets:
+            tokens, ts = self._buckets.get(bucket.key, (bucket.capacity, now))
+            levels.append(min(bucket.capacity, tokens + (now - ts) * bucket.refill_per_second))
+
+        allowed = all(level >= 1 for level in levels)
+        retry_after = max(
+            ((1 - level) / bucket.refill_per_second for bucket, level in zip(buckets, levels) if level < 1),
+            default=0.0
+        )
+        if allowed:
+            levels = [level - 1 for level in levels]
+
+        for bucket, level in zip(buckets, levels):
+            self._buckets[bucket.key] = (level, now)
+            self._buckets.move_to_end(bucket.key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+        tightest = min(range(len(buckets)), key=lambda i: levels[i])
+        return RateLimitDecision(
+            allowed=allowed,
+            limit=buckets[tightest].capacity,
+            remaining=max(0, int(levels[tightest])),
+            retry_after=retry_after
+        )
+
+
+class RateLimiter:
+    """
+    Per-client and per-route token buckets stored in Redis.
+
+    Every request draws from the client's bucket and, for routes listed in
+    ``route_limits``, from a bucket for that client and route. Both keys
+    share a hash tag so the Lua script stays on one slot under Redis
+    Cluster. When Redis fails the limiter switches to in-process buckets
+    and retries Redis after ``redis_retry_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        client: AsyncRedisClient = redis_client,
+        requests_per_minute: int = 60,
+        burst: Optional[int] = None,
+        route_limits: Optional[Dict[str, int]] = None,
+        enabled: bool = True,
+        namespace: str = "chimera:ratelimit",
+        redis_retry_interval: float = 5.0
+    ):
+        self.client = client
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst or requests_per_minute
+        self.route_limits = route_limits or {}
+        self.enabled = enabled
+        self.namespace = namespace
+        self.redis_retry_interval = redis_retry_interval
+        self.local = LocalTokenBuckets()
+        self._script = None
+        self._redis_retry_at = 0.0
+
+    @classmethod
+    def from_settings(cls, security: SecuritySettings, client: AsyncRedisClient = redis_client) -> "RateLimiter":
+        return cls(
+            client=client,
+            requests_per_minute=security.rate_limit_requests_per_minute,
+            burst=security.rate_limit_burst,
+            route_limits=security.rate_limit_route_limits,
+            enabled=security.rate_limit_enabled
+        )
+
+    def buckets_for(self, client_id: str, route: Optional[str] = None) -> List[TokenBucket]:
+        """Buckets a request from ``client_id`` to ``route`` draws from"""
+        buckets = [TokenBucket(
+            f"{self.namespace}:{{{client_id}}}",
+            self.burst,
+            self.requests_per_minute / 60
+        )]
+        if route in self.route_limits:
+            per_minute = self.route_limits[route]
+            buckets.append(TokenBucket(
+                f"{self.namespace}:{{{client_id}}}:{route}",
+                per_minute,
+                per_minute / 60
+            ))
+        return buckets
+
+    async def check(self, client_id: str, route: Optional[str] = None) -> RateLimitDecision:
+        """
+        Take one token from each of the request's buckets.
+
+        Args:
+            client_id: Client identity (usually the remote address)
+            route: Matched route path, used for per-route limits
+
+        Returns:
+            Whether the request is allowed, with header values
+        """
+        buckets = self.buckets_for(client_id, route)
+        if time.monotonic() >= self._redis_retry_at:
+            try:
+                return await self._check_redis(buckets)
+            except Exception as e:
+                logger.warning(
+                    f"Rate limiter falling back to in-process buckets for "
+                    f"{self.redis_retry_interval}s: {e}"
+                )
+                self._redis_retry_at = time.monotonic() + self.redis_retry_interval
+        return self.local.acquire(buckets)
+
+    async def _check_redis(self, buckets: List[TokenBucket]) -> RateLimitDecision:
+        redis = self.client.get_client()
+        if self._script is None or self._script.registered_client is not redis:
+            # AsyncScript runs EVALSHA and reloads the script on NOSCRIPT
+            self._script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+        args = []
+        for bucket in buckets:
+            args.extend((bucket.capacity, repr(bucket.refill_per_second / 1000)))
+        allowed, retry_ms, remaining, tightest = await self._script(
+            keys=[b.key for b in buckets],
+            args=args
+        )
+        return RateLimitDecision(
+            allowed=bool(allowed),
+            limit=buckets[int(tightest)].capacity,
+            remaining=max(0, int(remaining)),
+            retry_after=int(retry_ms) / 1000
+        )
+
+
+# Global API rate limiter
+api_rate_limiter = RateLimiter.from_settings(get_security_settings())
@@ -1,14 +1,25 @@
 """Redis connection and client configuration"""
 
 import redis
-from typing import Optional
+import redis.asyncio as aioredis
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 import logging
 
+from src.config.settings import settings
+
 logger = logging.getLogger("chimera.redis")
 
+# Deletes a key only while it still holds the caller's token (e.g. a lock it set)
+DELETE_IF_EQUAL_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
 
 class RedisClient:
-    """Redis client wrapper"""
+    """Synchronous Redis client wrapper, for scripts and other non-async callers"""
     
     def __init__(self, redis_url: str):
         self.redis_url = redis_url
@@ -43,3 +54,146 @@ class RedisClient:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.disconnect()
+
+
+class AsyncRedisClient:
+    """
+    Asyncio Redis client backed by a fixed-size blocking connection pool.
+    
+    Callers wait up to ``pool_timeout`` for a free connection instead of
+    opening new ones past ``max_connections``. Multi-key helpers batch their
+    commands into one round trip.
+    """
+    
+    def __init__(
+        self,
+        redis_url: str,
+        max_connections: int = 50,
+        pool_timeout: float = 5.0,
+        socket_timeout: float = 2.0,
+        health_check_interval: int = 30
+    ):
+        self.redis_url = redis_url
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self.socket_timeout = socket_timeout
+        self.health_check_interval = health_check_interval
+        self.pool: Optional[aioredis.BlockingConnectionPool] = None
+        self.client: Optional[aioredis.Redis] = None
+    
+    def connect(self) -> None:
+        """Create the connection pool (connections are opened lazily)"""
+        if self.client is not None:
+            return
+        self.pool = aioredis.BlockingConnectionPool.from_url(
+            self.redis_url,
+            max_connections=self.max_connections,
+            timeout=self.pool_timeout,
+            socket_timeout=self.socket_timeout,
+            socket_connect_timeout=self.socket_timeout,
+            health_check_interval=self.health_check_interval,
+            decode_responses=True
+        )
+        self.client = aioredis.Redis(connection_pool=self.pool)
+        logger.info(f"Redis pool created (max_connections={self.max_connections})")
+    
+    async def disconnect(self) -> None:
+        """Close the client and every pooled connection"""
+        if self.client is not None:
+            await self.client.aclose()
+            await self.pool.disconnect()
+            self.client = None
+            self.pool = None
+            logger.info("Redis pool closed")
+    
+    def get_client(self) -> aioredis.Redis:
+        """Get Redis client instance, creating the pool on first use"""
+        if self.client is None:
+            self.connect()
+        return self.client
+    
+    async def ping(self) -> bool:
+        """Check connectivity"""
+        return await self.get_client().ping()
+    
+    async def get(self, key: str) -> Optional[str]:
+        return await self.get_client().get(key)
+    
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        await self.get_client().set(key, value, ex=ttl)
+    
+    async def set_if_absent(self, key: str, value: str, ttl: int) -> bool:
+        """SET NX with expiry, returns True if the key was set"""
+        return bool(await self.get_client().set(key, value, nx=True, ex=ttl))
+    
+    async def delete_if_equal(self, key: str, value: str) -> bool:
+        """Atomically delete ``key`` if it still holds ``value``, returns True if it was deleted"""
+        return bool(await self.get_client().eval(DELETE_IF_EQUAL_SCRIPT, 1, key, value))
+    
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Read many keys in one round trip"""
+        if not keys:
+            return []
+        return await self.get_client().mget(keys)
+    
+    async def mset(self, mapping: Mapping[str, str], ttl: Optional[int] = None) -> None:
+        """Write many keys, each with the same expiry, in one pipelined round trip"""
+        if not mapping:
+            return
+        async with self.get_client().pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=ttl)
+            await pipe.execute()
+    
+    async def incr_many(self, keys: Iterable[str], ttl: Optional[int] = None) -> List[int]:
+        """Increment many counters in one pipelined round trip, optionally setting expiry"""
+        keys = list(keys)
+        if not keys:
+            return []
+        async with self.get_client().pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.incr(key)
+                if ttl is not None:
+                    pipe.expire(key, ttl)
+            results = await pipe.execute()
+        return results[::2] if ttl is not None else results
+    
+    async def hgetall(self, key: str) -> Dict[str, str]:
+        """Every field of a hash"""
+        return await self.get_client().hgetall(key)
+    
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete many keys in one round trip"""
+        keys = list(keys)
+        if not keys:
+            return 0
+        return await self.get_client().delete(*keys)
+    
+    async def execute_pipeline(self, commands: Iterable[tuple]) -> List[Any]:
+        """
+        Run arbitrary commands in one pipelined round trip.
+        
+        Args:
+            commands: Tuples of (method_name, *args) or (method_name, args, kwargs dict)
+        
+        Returns:
+            Results in command order
+        """
+        async with self.get_client().pipeline(transaction=False) as pipe:
+            for command in commands:
+                name, *rest = command
+                if len(rest) == 2 and isinstance(rest[0], tuple) and isinstance(rest[1], dict):
+                    getattr(pipe, name)(*rest[0], **rest[1])
+                else:
+                    getattr(pipe, name)(*rest)
+            return await pipe.execute()
+
+
+# Global Redis client instance, pool is created in the app lifespan
+redis_client = AsyncRedisClient(
+    settings.redis_url,
+    max_connections=settings.redis_max_connections,
+    pool_timeout=settings.redis_pool_timeout,
+    socket_timeout=settings.redis_socket_timeout,
+    health_check_interval=settings.redis_health_check_interval
+)
@@ -0,0 +1,131 @@
+"""Vectorized niche relevance scoring for trend batches (FR-003)"""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+import re
+
+import numpy as np
+
+from src.config.settings import settings
+
+# Engagement counters combined into one engagement signal, by weight
+ENGAGEMENT_WEIGHTS = {"likes": 1.0, "shares": 3.0, "comments": 2.0, "views": 0.01}
+
+
+_ACRONYM_BOUNDARY = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_CAMEL_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+_WORD = re.compile(r"\w+")
+
+
+def split_words(text: str) -> List[str]:
+    """Lowercase words, splitting hashtags and camel case (``#AIArt`` -> ai, art)"""
+    text = _CAMEL_BOUNDARY.sub(r"\1 \2", _ACRONYM_BOUNDARY.sub(r"\1 \2", text))
+    return _WORD.findall(text.lower())
+
+
+def niche_terms(niche: str) -> List[str]:
+    """Distinct lowercase word terms of a niche, in first-seen order"""
+    return list(dict.fromkeys(re.findall(r"\w+", niche.lower())))
+
+
+class BatchRelevanceScorer:
+    """
+    Scores whole batches of trends against one niche with NumPy.
+
+    The lexical score is the share of niche terms found as whole words in
+    a trend's topic name or hashtags, the same as ``lexical_relevance``.
+    Instead of tokenizing trends one by one, the batch is joined into one
+    lowercased string and scanned once for the niche terms only; match
+    offsets are mapped back to trends with ``searchsorted`` and counted in
+    a trends x terms hit matrix.
+
+    With ``engagement_weight`` above 0 the score blends in engagement:
+    a weighted sum of likes, shares, comments and views, log-scaled and
+    min-max normalized within the batch. Scores always land in 0.0-1.0.
+    """
+
+    def __init__(self, niche: str, engagement_weight: float = settings.relevance_engagement_weight):
+        if not 0.0 <= engagement_weight <= 1.0:
+            raise ValueError("engagement_weight must be between 0 and 1")
+        self.niche = niche
+        self.engagement_weight = engagement_weight
+        self.terms = niche_terms(niche)
+        self._term_index = {term: i for i, term in enumerate(self.terms)}
+        alternation = "|".join(re.escape(t) for t in sorted(self.terms, key=len, reverse=True))
+        self._pattern = re.compile(rf"(?<!\w)(?:{alternation})(?!\w)") if self.terms else None
+
+    def lexical_scores(self, trends: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """Share of niche terms matched per trend"""
+        scores = np.zeros(len(trends))
+        if self._pattern is None or not trends:
+            return scores
+
+        # Lowercased before measuring: lower() can change a string's length (e.g. "İ")
+        texts = [" ".join([t.get("topic_name") or "", *(t.get("related_hashtags") or [])]).lower() for t in trends]
+        # Offset where each trend's text starts in the joined batch (+1 for the separator)
+        starts = np.cumsum([0] + [len(text) + 1 for text in texts[:-1]])
+        joined = "\n".join(texts)
+
+        positions, terms = [], []
+        for match in self._pattern.finditer(joined):
+            positions.append(match.start())
+            terms.append(self._term_index[match.group()])
+        if positions:
+            rows = np.searchsorted(starts, positions, side="right") - 1
+            hits = np.zeros((len(trends), len(self.terms)), dtype=bool)
+            hits[rows, terms] = True
+            scores = hits.sum(axis=1) / len(self.terms)
+        return scores
+
+    @staticmethod
+    def engagement_scores(trends: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """Log-scaled engagement per trend, normalized to 0.0-1.0 within the batch"""
+        metrics = [t.get("engagement_metrics") or {} for t in trends]
+        weighted = np.zeros(len(trends))
+        for key, weight in ENGAGEMENT_WEIGHTS.items():
+            # One column at a time: fromiter avoids building a nested list per trend
+            column = np.fromiter((m.get(key) or 0 for m in metrics), dtype=float, count=len(metrics))
+            weighted += weight * np.clip(column, 0, None)
+        signal = np.log1p(weighted)
+        if not len(signal) or signal.max() == signal.min():
+            return np.zeros(len(trends))
+        return (signal - signal.min()) / (signal.max() - signal.min())
+
+    def niche_scores(self, trends: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """How well each trend matches the niche, 0.0-1.0 (lexical here; subclasses may embed)"""
+        return self.lexical_scores(trends)
+
+    def score(self, trends: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """Relevance of every trend, rounded to 4 decimals"""
+        scores = self.niche_scores(trends)
+        if self.engagement_weight:
+            scores = (1 - self.engagement_weight) * scores + self.engagement_weight * self.engagement_scores(trends)
+        return np.round(np.clip(scores, 0.0, 1.0), 4)
+
+    def score_into(self, trends: List[Dict[str, Any]], overwrite: bool = False) -> List[Dict[str, Any]]:
+        """Set ``relevance_score`` on trends that have none (or all, with ``overwrite``)"""
+        pending = trends if overwrite else [t for t in trends if t.get("relevance_score") is None]
+        for trend, score in zip(pending, self.score(pending).tolist()):
+            trend["relevance_score"] = score
+        return trends
+
+    def filter(self, trends: List[Dict[str, Any]], min_score: float, overwrite: bool = False) -> List[Dict[str, Any]]:
+        """Score trends, keeping those scoring at least ``min_score``"""
+        self.score_into(trends, overwrite)
+        scores = np.array([t["relevance_score"] for t in trends], dtype=float)
+        return [trends[i] for i in np.flatnonzero(scores >= min_score)]
+
+
+@lru_cache(maxsize=128)
+def get_scorer(niche: str, engagement_weight: Optional[float] = None) -> BatchRelevanceScorer:
+    """
+    Shared scorer per niche, so its term pattern (or exemplar index) is built once.
+
+    ``settings.relevance_mode`` picks lexical or embedding scoring.
+    """
+    if engagement_weight is None:
+        engagement_weight = settings.relevance_engagement_weight
+    if settings.relevance_mode == "embedding":
+        from src.services.embedding_relevance import EmbeddingRelevanceScorer
+        return EmbeddingRelevanceScorer(niche, engagement_weight)
+    return BatchRelevanceScorer(niche, engagement_weight)
@@ -0,0 +1,166 @@
+"""Circuit breaking and request hedging for calls to remote servers"""
+
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+import asyncio
+import logging
+import math
+import time
+
+from src.utils.error_handler import MCPServerError
+
+logger = logging.getLogger("chimera.resilience")
+
+
+class CircuitState:
+    """States of a circuit breaker"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Per-server circuit breaker.
+
+    Closed: calls flow, and ``failure_threshold`` consecutive failures open
+    the circuit. Open: calls fail immediately for ``recovery_timeout``
+    seconds. Half-open: up to ``half_open_max_calls`` probe calls go
+    through; a success closes the circuit, a failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.times_opened = 0
+        self.rejected = 0
+        self._state = CircuitState.CLOSED
+        self._probes = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == CircuitState.OPEN and self.clock() - self.opened_at >= self.recovery_timeout:
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+            logger.info(f"Circuit for {self.name} half-open, probing")
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Admit a call or reject it.
+
+        Raises:
+            MCPServerError: If the circuit is open or its probe slots are taken
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return
+        if state == CircuitState.HALF_OPEN and self._probes < self.half_open_max_calls:
+            self._probes += 1
+            return
+        self.rejected += 1
+        retry_in = max(0.0, self.recovery_timeout - (self.clock() - self.opened_at))
+        raise MCPServerError(
+            f"Circuit open for {self.name}",
+            self.name,
+            {"circuit": state, "retry_in": round(retry_in, 1)}
+        )
+
+    def release(self) -> None:
+        """Give back a probe slot taken by a call that ended without an outcome (e.g. cancelled)"""
+        if self._state == CircuitState.HALF_OPEN and self._probes:
+            self._probes -= 1
+
+    def record_success(self) -> None:
+        if self._state != CircuitState.CLOSED:
+            logger.info(f"Circuit for {self.name} closed")
+        self._state = CircuitState.CLOSED
+        self.failures = 0
+        self._probes = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self._state != CircuitState.OPEN:
+                self.times_opened += 1
+                logger.warning(f"Circuit for {self.name} opened after {self.failures} failures")
+            self._state = CircuitState.OPEN
+            self.opened_at = self.clock()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected
+        }
+
+
+class LatencyWindow:
+    """Recent call latencies (seconds) for percentile estimates"""
+
+    def __init__(self, size: int = 200):
+        self.samples: deque = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+async def hedged(
+    call: Callable[[], Awaitable[Any]],
+    delay: float,
+    on_hedge: Optional[Callable[[], None]] = None,
+    on_hedge_win: Optional[Callable[[], None]] = None
+) -> Any:
+    """
+    Await ``call``; if it hasn't finished after ``delay`` seconds, start a
+    duplicate and return whichever succeeds first.
+
+    The loser is cancelled. If the first call to finish fails, the other
+    one is still awaited; the error is raised only if both fail. Only use
+    for idempotent calls.
+    """
+    tasks = [asyncio.ensure_future(call())]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            if on_hedge is not None:
+                on_hedge()
+            tasks.append(asyncio.ensure_future(call()))
+
+        pending = set(tasks)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is not tasks[0] and on_hedge_win is not None:
+                        on_hedge_win()
+                    return task.result()
+                error = error or task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
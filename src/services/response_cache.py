@@ -0,0 +1,213 @@
+"""Redis-backed API response cache with stale-while-revalidate"""
+
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import uuid
+
+import orjson
+
+from src.config.settings import settings
+from src.models.trend import Platform
+from src.services.redis_client import AsyncRedisClient, redis_client
+
+logger = logging.getLogger("chimera.response_cache")
+
+ALL_PLATFORMS = tuple(p.value for p in Platform)
+
+# Query parameters holding comma-separated sets, compared order-insensitively
+SET_PARAMS = ("platforms", "hashtags")
+
+
+def normalize_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize query parameters into a canonical, JSON-serializable form.
+
+    None values are dropped, comma-separated set parameters are lowercased,
+    de-duplicated and sorted, and datetimes are rendered as ISO 8601.
+    """
+    normalized = {}
+    for name, value in params.items():
+        if value is None or value == "":
+            continue
+        if name in SET_PARAMS and isinstance(value, str):
+            value = ",".join(sorted({v.strip().lower() for v in value.split(",") if v.strip()}))
+        elif isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        elif isinstance(value, str):
+            value = value.strip()
+        normalized[name] = value
+    return dict(sorted(normalized.items()))
+
+
+class ResponseCache:
+    """
+    Caches endpoint payloads in Redis.
+
+    Each entry records when it stops being fresh and the per-platform
+    generation counters it was built from. Ingestion bumps a platform's
+    generation, which makes every entry covering that platform a miss
+    without having to find and delete keys. Entries past their fresh TTL
+    are still served for ``stale_ttl`` seconds while a single request
+    (guarded by a Redis lock, released when it finishes) refreshes them in
+    the background.
+    """
+
+    def __init__(
+        self,
+        client: AsyncRedisClient = redis_client,
+        namespace: str = "chimera:cache",
+        stale_ttl: int = settings.response_cache_stale_ttl,
+        enabled: bool = settings.response_cache_enabled
+    ):
+        self.client = client
+        self.namespace = namespace
+        self.stale_ttl = stale_ttl
+        self.enabled = enabled
+        self.stats: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self._refreshing: Set[str] = set()
+
+    def make_key(self, endpoint: str, params: Dict[str, Any]) -> str:
+        """Cache key for an endpoint and its normalized parameters"""
+        canonical = json.dumps(normalize_params(params), separators=(",", ":"))
+        digest = hashlib.sha1(canonical.encode()).hexdigest()
+        return f"{self.namespace}:{endpoint}:{digest}"
+
+    def _generation_key(self, platform: str) -> str:
+        return f"{self.namespace}:generation:{platform}"
+
+    async def get_or_compute(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        platforms: Optional[Iterable[str]],
+        ttl: int,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return a cached payload or compute and store it.
+
+        Args:
+            endpoint: Endpoint name, used in the key and for stats
+            params: Query parameters identifying the response
+            platforms: Platforms the response covers (None means all)
+            ttl: Seconds the entry is fresh
+            compute: Coroutine factory producing an orjson-serializable payload
+
+        Returns:
+            The payload
+        """
+        if not self.enabled:
+            return await compute()
+
+        stats = self.stats[endpoint]
+        key = self.make_key(endpoint, params)
+        covered = sorted(set(platforms or ALL_PLATFORMS))
+
+        try:
+            # Entry and generation counters come back in a single MGET
+            raw, *generations = await self.client.mget(
+                [key] + [self._generation_key(p) for p in covered]
+            )
+        except Exception as e:
+            logger.warning(f"Response cache read failed for {endpoint}: {e}")
+            stats["errors"] += 1
+            return await compute()
+
+        current = dict(zip(covered, (int(g or 0) for g in generations)))
+        if raw is not None:
+            entry = orjson.loads(raw)
+            if entry["generations"] == current:
+                if time.time() < entry["fresh_until"]:
+                    stats["hits"] += 1
+                    return entry["payload"]
+                stats["stale_hits"] += 1
+                self._schedule_refresh(endpoint, key, current, ttl, compute)
+                return entry["payload"]
+
+        stats["misses"] += 1
+        payload = await compute()
+        await self._store(endpoint, key, current, ttl, payload)
+        return payload
+
+    async def _store(
+        self,
+        endpoint: str,
+        key: str,
+        generations: Dict[str, int],
+        ttl: int,
+        payload: Any
+    ) -> None:
+        entry = {"payload": payload, "fresh_until": time.time() + ttl, "generations": generations}
+        try:
+            await self.client.set(key, orjson.dumps(entry, option=orjson.OPT_UTC_Z), ttl + self.stale_ttl)
+        except Exception as e:
+            logger.warning(f"Response cache write failed for {endpoint}: {e}")
+            self.stats[endpoint]["errors"] += 1
+
+    def _schedule_refresh(
+        self,
+        endpoint: str,
+        key: str,
+        generations: Dict[str, int],
+        ttl: int,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> None:
+        # One refresh per key in this process; the Redis lock covers other processes
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def refresh() -> None:
+            lock, token = f"{key}:refresh", uuid.uuid4().hex
+            try:
+                if not await self.client.set_if_absent(lock, token, max(ttl, 1)):
+                    return
+                try:
+                    payload = await compute()
+                    await self._store(endpoint, key, generations, ttl, payload)
+                    self.stats[endpoint]["refreshes"] += 1
+                finally:
+                    # Only our own lock: after its TTL another refresh may hold the key
+                    await self.client.delete_if_equal(lock, token)
+            except Exception as e:
+                logger.warning(f"Background refresh failed for {endpoint}: {e}")
+                self.stats[endpoint]["errors"] += 1
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def invalidate_platforms(self, platforms: Iterable[str]) -> None:
+        """Invalidate every cached response covering any of these platforms"""
+        platforms = sorted({p.value if isinstance(p, Platform) else str(p).lower() for p in platforms})
+        if not self.enabled or not platforms:
+            return
+        try:
+            await self.client.incr_many(self._generation_key(p) for p in platforms)
+        except Exception as e:
+            logger.warning(f"Response cache invalidation failed for {platforms}: {e}")
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint counters with hit ratio"""
+        report = {}
+        for endpoint, counters in self.stats.items():
+            served = counters["hits"] + counters["stale_hits"]
+            lookups = served + counters["misses"]
+            report[endpoint] = {
+                **counters,
+                "hit_ratio": round(served / lookups, 4) if lookups else 0.0
+            }
+        return report
+
+
+# Global response cache for trend endpoints
+trend_response_cache = ResponseCache()
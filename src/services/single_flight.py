@@ -0,0 +1,85 @@
+"""Single-flight coalescing of identical concurrent calls"""
+
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger("chimera.single_flight")
+
+
+def call_key(*parts: Any) -> str:
+    """Stable digest of call parts; dict arguments compare order-insensitively"""
+    canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(canonical.encode()).hexdigest()
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call between concurrent callers with the same key.
+
+    The first caller starts the call as a task; callers arriving while it
+    runs await the same task instead of starting their own. The task is
+    shielded, so a caller that is cancelled does not cancel the call for
+    the others. Errors reach every waiter. Results are returned to the
+    first caller as is and deep-copied for the others, so one caller
+    mutating its result cannot affect another.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.stats: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    async def run(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[Any]],
+        label: Optional[str] = None
+    ) -> Any:
+        """
+        Run ``call``, or join the identical call already in flight.
+
+        Args:
+            key: Identity of the call
+            call: Coroutine factory, only invoked when nothing is in flight
+            label: Stats bucket (defaults to "default")
+
+        Returns:
+            The call's result
+        """
+        stats = self.stats[label or "default"]
+        stats["calls"] += 1
+        task = self._calls.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            stats["coalesced"] += 1
+            return copy.deepcopy(await asyncio.shield(task))
+
+        stats["upstream"] += 1
+        task = asyncio.ensure_future(call())
+        self._calls[key] = task
+        task.add_done_callback(lambda t: self._finish(key, t))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Every waiter may have been cancelled; don't warn about an unretrieved error
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Coalesced call failed: {task.exception()}")
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-label calls, upstream requests, coalesced calls and coalesce ratio"""
+        return {
+            label: {
+                **counters,
+                "coalesce_ratio": round(counters["coalesced"] / counters["calls"], 4) if counters["calls"] else 0.0
+            }
+            for label, counters in self.stats.items()
+        }
@@ -0,0 +1,226 @@
+"""Cross-platform trend deduplication and aggregation with MinHash/LSH (US-2, SC-003)"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+import uuid
+import zlib
+
+import numpy as np
+
+from src.config.settings import settings
+from src.services.relevance import ENGAGEMENT_WEIGHTS, split_words
+
+# Mersenne prime modulus of the MinHash permutations (a * x + b) % p
+_PRIME = (1 << 31) - 1
+
+# Trends per chunk when building signatures, bounding the (tokens, num_perm) temporary
+_SIGNATURE_CHUNK = 4096
+
+
+def trend_tokens(trend: Dict[str, Any]) -> List[str]:
+    """Distinct words of a trend's topic name and hashtags (``#AIAgents`` -> ai, agents)"""
+    text = " ".join([trend.get("topic_name") or "", *(trend.get("related_hashtags") or [])])
+    return list(dict.fromkeys(split_words(text)))
+
+
+def weighted_engagement(trends: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """ENGAGEMENT_WEIGHTS-weighted sum of each trend's engagement counters"""
+    metrics = [t.get("engagement_metrics") or {} for t in trends]
+    weighted = np.zeros(len(trends))
+    for key, weight in ENGAGEMENT_WEIGHTS.items():
+        weighted += weight * np.fromiter((m.get(key) or 0 for m in metrics), dtype=float, count=len(metrics))
+    return weighted
+
+
+class MinHashLSH:
+    """
+    Near-duplicate detection over token sets with MinHash and banded LSH.
+
+    Each set is summarized by ``num_perm`` minimum hash values, one per
+    random permutation ``(a * x + b) % p``; two signatures agree in a
+    position with probability equal to the sets' Jaccard similarity.
+    Signatures are cut into ``bands`` bands and every band is bucketed with
+    one sort, so only sets sharing a whole band become candidate pairs;
+    candidates are kept when their estimated similarity reaches
+    ``threshold``. Work grows with the number of sets plus candidate pairs
+    instead of with every pair.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = settings.trend_dedup_num_perm,
+        bands: int = settings.trend_dedup_bands,
+        threshold: float = settings.trend_dedup_threshold,
+        seed: int = 1
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be above 0 and at most 1")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, num_perm, dtype=np.uint64)
+        # Folds a band's rows into one uint64 bucket key (wrapping arithmetic)
+        self._band_mix = rng.integers(1, 1 << 63, self.rows, dtype=np.uint64) | np.uint64(1)
+
+    def signatures(self, token_sets: Sequence[Sequence[str]]) -> np.ndarray:
+        """(sets, num_perm) signatures; empty sets get rows of ``p``, which match nothing"""
+        vocab: Dict[str, int] = {}
+        ids = np.fromiter(
+            (vocab.setdefault(token, len(vocab)) for tokens in token_sets for token in tokens),
+            dtype=np.int64
+        )
+        lengths = np.fromiter((len(tokens) for tokens in token_sets), dtype=np.int64, count=len(token_sets))
+        sigs = np.full((len(token_sets), self.num_perm), _PRIME, dtype=np.uint32)
+        if not vocab:
+            return sigs
+
+        # Each distinct token is permuted once; trends gather their tokens' rows
+        hashes = np.fromiter((zlib.crc32(t.encode()) for t in vocab), dtype=np.uint64, count=len(vocab))
+        permuted = ((hashes % _PRIME)[:, None] * self._a + self._b) % _PRIME
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        for lo in range(0, len(token_sets), _SIGNATURE_CHUNK):
+            hi = min(lo + _SIGNATURE_CHUNK, len(token_sets))
+            rows = lo + np.flatnonzero(lengths[lo:hi])
+            if len(rows):
+                tokens = permuted[ids[offsets[lo]:offsets[hi]]]
+                sigs[rows] = np.minimum.reduceat(tokens, offsets[rows] - offsets[lo], axis=0)
+        return sigs
+
+    def candidate_pairs(self, sigs: np.ndarray) -> np.ndarray:
+        """Distinct (i, j) pairs, i < j, whose signatures share at least one band"""
+        valid = np.flatnonzero(sigs[:, 0] != _PRIME)
+        found = []
+        for band in range(self.bands):
+            block = sigs[valid, band * self.rows:(band + 1) * self.rows].astype(np.uint64)
+            keys = (block * self._band_mix).sum(axis=1)
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            first = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+            # Pair every bucket member with the bucket's first (lowest) index
+            heads = order[first][np.cumsum(first) - 1]
+            found.append(np.stack([heads[~first], order[~first]], axis=1))
+        pairs = valid[np.concatenate(found)] if found else np.empty((0, 2), dtype=np.int64)
+        if not len(pairs):
+            return pairs
+        codes = np.unique(pairs[:, 0] * len(sigs) + pairs[:, 1])
+        return np.stack([codes // len(sigs), codes % len(sigs)], axis=1)
+
+    def cluster(self, token_sets: Sequence[Sequence[str]]) -> np.ndarray:
+        """
+        Cluster label per set: the lowest index of its connected near-duplicates.
+
+        Verified pairs are joined by min-label propagation with pointer
+        jumping, so components resolve in a few vectorized passes.
+        """
+        sigs = self.signatures(token_sets)
+        labels = np.arange(len(sigs))
+        pairs = self.candidate_pairs(sigs)
+        if not len(pairs):
+            return labels
+        similarity = (sigs[pairs[:, 0]] == sigs[pairs[:, 1]]).mean(axis=1)
+        left, right = pairs[similarity >= self.threshold].T
+        while len(left):
+            updated = labels.copy()
+            low = np.minimum(labels[left], labels[right])
+            np.minimum.at(updated, left, low)
+            np.minimum.at(updated, right, low)
+            updated = updated[updated]
+            if np.array_equal(updated, labels):
+                break
+            labels = updated
+        return labels
+
+
+def _trend_key(trend: Dict[str, Any]) -> str:
+    return str(trend.get("platform_trend_id") or trend.get("trend_id") or trend.get("topic_name"))
+
+
+@dataclass
+class TrendCluster:
+    """Near-duplicate trends merged into one cross-platform trend"""
+    cluster_id: str
+    topic_name: str
+    trends: List[Dict[str, Any]]
+    platform_sequence: List[str]  # Platforms in the order the topic first trended on them
+    engagement_metrics: Dict[str, int] = field(default_factory=dict)
+    trend_velocity: float = 0.0
+    relevance_score: Optional[float] = None
+    related_hashtags: List[str] = field(default_factory=list)
+    first_seen: Optional[str] = None
+
+    @property
+    def cross_platform(self) -> bool:
+        return len(self.platform_sequence) > 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "cluster_id": self.cluster_id,
+            "topic_name": self.topic_name,
+            "platform_sequence": self.platform_sequence,
+            "cross_platform": self.cross_platform,
+            "engagement_metrics": self.engagement_metrics,
+            "trend_velocity": self.trend_velocity,
+            "relevance_score": self.relevance_score,
+            "related_hashtags": self.related_hashtags,
+            "first_seen": self.first_seen,
+            "trend_ids": [_trend_key(t) for t in self.trends],
+        }
+
+
+def _merge(members: List[Dict[str, Any]], engagement: np.ndarray) -> TrendCluster:
+    """Combine one cluster's trends; the most engaged member names the cluster"""
+    lead = members[int(np.argmax(engagement))]
+    by_time = sorted(members, key=lambda t: t.get("timestamp") or "")
+    metrics: Dict[str, int] = {}
+    for trend in members:
+        for key, value in (trend.get("engagement_metrics") or {}).items():
+            metrics[key] = metrics.get(key, 0) + (value or 0)
+    scores = [t["relevance_score"] for t in members if t.get("relevance_score") is not None]
+    ids = sorted(_trend_key(t) for t in members)
+    return TrendCluster(
+        cluster_id=str(uuid.uuid5(uuid.NAMESPACE_URL, "|".join(ids))),
+        topic_name=lead.get("topic_name"),
+        trends=members,
+        platform_sequence=list(dict.fromkeys(t.get("platform") for t in by_time)),
+        engagement_metrics=metrics,
+        trend_velocity=round(sum(t.get("trend_velocity") or 0.0 for t in members), 4),
+        relevance_score=max(scores) if scores else None,
+        related_hashtags=list(dict.fromkeys(h for t in members for h in t.get("related_hashtags") or [])),
+        first_seen=by_time[0].get("timestamp"),
+    )
+
+
+def aggregate_trends(
+    trends: Sequence[Dict[str, Any]],
+    lsh: Optional[MinHashLSH] = None
+) -> List[TrendCluster]:
+    """
+    Merge near-duplicate trends (within and across platforms) into clusters.
+
+    Args:
+        trends: Trends in the skill output shape
+        lsh: Matcher to use (defaults to the ``trend_dedup_*`` settings)
+
+    Returns:
+        One cluster per distinct topic, highest combined engagement first
+    """
+    if not trends:
+        return []
+    lsh = lsh or MinHashLSH()
+    labels = lsh.cluster([trend_tokens(t) for t in trends])
+    engagement = weighted_engagement(trends)
+
+    order = np.argsort(labels, kind="stable")
+    sorted_labels = labels[order]
+    bounds = np.flatnonzero(np.r_[True, sorted_labels[1:] != sorted_labels[:-1], True])
+    totals = np.add.reduceat(engagement[order], bounds[:-1])
+    clusters = []
+    for i in np.argsort(-totals, kind="stable"):
+        members = order[bounds[i]:bounds[i + 1]]
+        clusters.append(_merge([trends[k] for k in members], engagement[members]))
+    return clusters
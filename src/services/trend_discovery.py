@@ -0,0 +1,465 @@
+"""Concurrent trend discovery across platforms via MCP (FR-001, FR-007, SC-001)"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Protocol
+import asyncio
+import logging
+import time
+import uuid
+
+from src.config.settings import settings
+from src.services.mcp_client import iter_tool_pages
+from src.services.platform_scheduler import PlatformScheduler, platform_scheduler
+from src.utils.error_handler import RateLimitError
+from src.utils.mcp_sense_logger import MCPSenseLogger, get_mcp_sense_logger
+
+logger = logging.getLogger("chimera.trend_discovery")
+
+# Social media MCP tool serving each platform
+PLATFORM_TOOLS = {
+    "twitter": "fetch_twitter_trends",
+    "tiktok": "fetch_tiktok_trends",
+    "instagram": "fetch_instagram_trends",
+}
+
+# Social media MCP tool querying several platforms in one call
+BATCH_TOOL = "fetch_trends_batch"
+
+# Extra seconds the whole batch call may take beyond its slowest platform's deadline
+BATCH_TIMEOUT_GRACE = 1.0
+
+
+class ToolClient(Protocol):
+    """Anything that can call an MCP tool and return its decoded result"""
+
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        ...
+
+
+@dataclass
+class PlatformResult:
+    """Trends from one platform, or why there are none"""
+    platform: str
+    trends: List[Dict[str, Any]] = field(default_factory=list)
+    duration_ms: int = 0
+    error: Optional[str] = None
+    retry_after: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class DiscoveryResult:
+    """Per-platform results of one discovery run, in completion order"""
+    results: Dict[str, PlatformResult] = field(default_factory=dict)
+    duration_ms: int = 0
+
+    @property
+    def trends(self) -> List[Dict[str, Any]]:
+        return [t for r in self.results.values() for t in r.trends]
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        return {p: r.error for p, r in self.results.items() if r.error}
+
+    @property
+    def platform_durations_ms(self) -> Dict[str, int]:
+        return {p: r.duration_ms for p, r in self.results.items()}
+
+
+def _isoformat(value: Any) -> str:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def since_arguments(since: Optional[Dict[str, datetime]], platform: str) -> Dict[str, Any]:
+    """Tool arguments asking for trends updated after ``since[platform]`` (none without a marker)"""
+    marker = (since or {}).get(platform)
+    return {"since": _isoformat(marker)} if marker is not None else {}
+
+
+def normalize_trend(platform: str, raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a trend from an MCP tool into the trend research output shape.
+
+    ``topic`` mirrors ``topic_name`` for agent callers.
+    """
+    topic = raw.get("topic_name") or raw.get("topic") or raw.get("name")
+    return {
+        "trend_id": str(raw.get("trend_id") or uuid.uuid4()),
+        "topic_name": topic,
+        "topic": topic,
+        "platform": platform,
+        "engagement_metrics": raw.get("engagement_metrics") or {},
+        "trend_velocity": float(raw.get("trend_velocity") or 0.0),
+        "relevance_score": raw.get("relevance_score"),
+        "related_hashtags": raw.get("related_hashtags") or [],
+        "timestamp": _isoformat(raw.get("timestamp") or datetime.now(timezone.utc)),
+        "platform_trend_id": str(raw.get("platform_trend_id") or f"{platform}_{topic}"),
+    }
+
+
+class TrendDiscoveryService:
+    """
+    Queries every platform's MCP tool concurrently.
+
+    Each platform runs under its own deadline, so one slow or failing
+    platform neither delays nor breaks the others, and results are
+    available platform by platform as they complete.
+
+    Platform calls spend that platform's rate-limit budget in the shared
+    ``platform_scheduler`` (pass ``scheduler=None`` to call tools directly):
+    calls past the budget wait for the window to reset (within their
+    deadline) and rate-limited calls are retried, larger fetches first.
+    """
+
+    def __init__(
+        self,
+        mcp_client: ToolClient,
+        platform_timeout: float = settings.trend_platform_timeout,
+        platform_timeouts: Optional[Dict[str, float]] = None,
+        sense_logger: Optional[MCPSenseLogger] = None,
+        scheduler: Optional[PlatformScheduler] = platform_scheduler
+    ):
+        self.mcp_client = mcp_client
+        self.platform_timeout = platform_timeout
+        self.platform_timeouts = settings.trend_platform_timeouts if platform_timeouts is None else platform_timeouts
+        self.sense_logger = sense_logger or get_mcp_sense_logger()
+        self.scheduler = scheduler
+
+    def timeout_for(self, platform: str) -> float:
+        return self.platform_timeouts.get(platform, self.platform_timeout)
+
+    @staticmethod
+    def _raise_for_rate_limit(platform: str, payload: Dict[str, Any]) -> None:
+        if payload.get("status") == "rate_limited":
+            raise RateLimitError(
+                f"{platform} rate limit reached",
+                platform=platform,
+                retry_after=payload.get("retry_after")
+            )
+
+    def _apply_payload(self, result: PlatformResult, payload: Dict[str, Any], tool: str) -> None:
+        """Fill ``result`` with a tool payload's trends, raising if it carries none"""
+        self._raise_for_rate_limit(result.platform, payload)
+        if "trends" not in payload:
+            raise ValueError(payload.get("error") or payload.get("message") or f"Unexpected response from {tool}")
+        result.trends = [normalize_trend(result.platform, t) for t in payload["trends"]]
+
+    def _apply_error(self, result: PlatformResult, error: Exception) -> None:
+        if isinstance(error, asyncio.TimeoutError):
+            result.error = f"Timed out after {self.timeout_for(result.platform)}s"
+        elif isinstance(error, RateLimitError):
+            result.error = "rate_limited"
+            result.retry_after = error.details.get("retry_after")
+        else:
+            result.error = str(error) or type(error).__name__
+
+    def _report(self, result: PlatformResult, trace_id: Optional[str]) -> None:
+        if result.ok:
+            self.sense_logger.log_trend_discovery(result.platform, len(result.trends), trace_id)
+        else:
+            logger.warning(f"Trend discovery failed for {result.platform}: {result.error}")
+            self.sense_logger.log_activity(
+                "trend_discovery_error",
+                "trend_discovery_service",
+                {"platform": result.platform, "error": result.error, "duration_ms": result.duration_ms},
+                trace_id
+            )
+
+    async def fetch_platform(
+        self,
+        platform: str,
+        limit: int = settings.trend_discovery_limit,
+        trace_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+        since: Optional[Dict[str, datetime]] = None
+    ) -> PlatformResult:
+        """
+        Fetch one platform's trends within its deadline.
+
+        With a ``since`` marker for the platform, only trends updated after
+        it are requested (delta sync). Never raises: timeouts, rate limits
+        and MCP errors are reported on the returned PlatformResult.
+        """
+        tool = PLATFORM_TOOLS.get(platform)
+        if tool is None:
+            return PlatformResult(platform, error=f"Unsupported platform: {platform}")
+
+        async def request() -> Dict[str, Any]:
+            payload = await self.mcp_client.call_tool(tool, {"limit": limit, **since_arguments(since, platform)})
+            self._raise_for_rate_limit(platform, payload)
+            return payload
+
+        timeout = self.timeout_for(platform) if timeout is None else timeout
+        start = time.perf_counter()
+        result = PlatformResult(platform)
+        try:
+            if self.scheduler is None:
+                call = request()
+            else:
+                # Larger fetches get more trends out of each request in the window
+                call = self.scheduler.submit(
+                    platform, request, priority=limit, deadline=self.scheduler.clock() + timeout
+                )
+            payload = await asyncio.wait_for(call, timeout=timeout)
+            self._apply_payload(result, payload, tool)
+        except Exception as e:
+            self._apply_error(result, e)
+        result.duration_ms = round((time.perf_counter() - start) * 1000)
+
+        self._report(result, trace_id)
+        return result
+
+    async def iter_platform(
+        self,
+        platform: str,
+        limit: int = settings.trend_discovery_limit,
+        page_size: int = settings.trend_page_size,
+        trace_id: Optional[str] = None,
+        since: Optional[Dict[str, datetime]] = None
+    ) -> AsyncIterator[PlatformResult]:
+        """
+        Yield one platform's trends a page at a time, following the tool's cursor.
+
+        The next page is only requested once the consumer asks for it, so
+        memory stays at one page however large ``limit`` is. Each page runs
+        under the platform deadline and, with a scheduler, spends one
+        request of the platform's budget. Never raises: a failed page is
+        yielded with its error and ends the iteration.
+        """
+        tool = PLATFORM_TOOLS.get(platform)
+        if tool is None:
+            yield PlatformResult(platform, error=f"Unsupported platform: {platform}")
+            return
+
+        timeout = self.timeout_for(platform)
+
+        async def request(arguments: Dict[str, Any]) -> Dict[str, Any]:
+            payload = await self.mcp_client.call_tool(tool, arguments)
+            self._raise_for_rate_limit(platform, payload)
+            return payload
+
+        async def call(arguments: Dict[str, Any]) -> Dict[str, Any]:
+            if self.scheduler is None:
+                return await asyncio.wait_for(request(arguments), timeout=timeout)
+            return await asyncio.wait_for(
+                self.scheduler.submit(
+                    platform,
+                    lambda: request(arguments),
+                    priority=page_size,
+                    deadline=self.scheduler.clock() + timeout
+                ),
+                timeout=timeout
+            )
+
+        remaining = limit
+        pages = iter_tool_pages(call, {"limit": limit, **since_arguments(since, platform)}, page_size)
+        try:
+            while remaining > 0:
+                start = time.perf_counter()
+                result = PlatformResult(platform)
+                try:
+                    self._apply_payload(result, await pages.__anext__(), tool)
+                except StopAsyncIteration:
+                    return
+                except Exception as e:
+                    self._apply_error(result, e)
+                result.trends = result.trends[:remaining]
+                remaining -= len(result.trends)
+                result.duration_ms = round((time.perf_counter() - start) * 1000)
+                self._report(result, trace_id)
+                yield result
+                if not result.ok:
+                    return
+        finally:
+            await pages.aclose()
+
+    async def stream_pages(
+        self,
+        platforms: Iterable[str],
+        limit: int = settings.trend_discovery_limit,
+        page_size: int = settings.trend_page_size,
+        trace_id: Optional[str] = None,
+        since: Optional[Dict[str, datetime]] = None
+    ) -> AsyncIterator[PlatformResult]:
+        """
+        Yield trend pages from all platforms as they arrive.
+
+        Platforms are paged concurrently; each one waits for its previous
+        page to be handed to the consumer before fetching the next, so at
+        most two pages per platform are buffered.
+        """
+        platforms = list(dict.fromkeys(platforms))
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        done = object()
+
+        async def pump(platform: str) -> None:
+            async for page in self.iter_platform(platform, limit, page_size, trace_id, since):
+                await queue.put(page)
+            await queue.put(done)
+
+        tasks = [asyncio.create_task(pump(p)) for p in platforms]
+        try:
+            pending = len(tasks)
+            while pending:
+                page = await queue.get()
+                if page is done:
+                    pending -= 1
+                else:
+                    yield page
+        finally:
+            # The consumer stopped early; don't leave queries running
+            for task in tasks:
+                task.cancel()
+
+    async def fetch_batch(
+        self,
+        platforms: Iterable[str],
+        limit: int = settings.trend_discovery_limit,
+        trace_id: Optional[str] = None,
+        since: Optional[Dict[str, datetime]] = None
+    ) -> List[PlatformResult]:
+        """
+        Fetch every platform in one fetch_trends_batch call.
+
+        The server runs the platforms concurrently, each under the deadline
+        passed in its spec, and reports per-platform errors inline. If the
+        batch call itself fails (e.g. a server without the batch tool), the
+        batched platforms are queried individually instead, with the budget
+        taken for the batch given back first. Never raises.
+
+        With a scheduler, only platforms with budget left join the batch;
+        the rest, and any the batch reports as rate limited, are fetched
+        through the scheduler within their remaining deadline.
+        """
+        platforms = list(dict.fromkeys(platforms))
+        supported = [p for p in platforms if p in PLATFORM_TOOLS]
+        results = {
+            p: PlatformResult(p, error=f"Unsupported platform: {p}")
+            for p in platforms if p not in PLATFORM_TOOLS
+        }
+        scheduled: List[str] = []
+        if self.scheduler is not None:
+            scheduled = [p for p in supported if not self.scheduler.try_acquire(p)]
+            supported = [p for p in supported if p not in scheduled]
+        batch_start = time.perf_counter()
+
+        if supported:
+            specs = [
+                {"platform": p, "limit": limit, "timeout": self.timeout_for(p), **since_arguments(since, p)}
+                for p in supported
+            ]
+            deadline = max(spec["timeout"] for spec in specs) + BATCH_TIMEOUT_GRACE
+            start = time.perf_counter()
+            try:
+                payload = await asyncio.wait_for(
+                    self.mcp_client.call_tool(BATCH_TOOL, {"requests": specs}),
+                    timeout=deadline
+                )
+                entries = payload["results"]
+                if len(entries) != len(specs):
+                    raise ValueError(f"Expected {len(specs)} results, got {len(entries)}")
+            except asyncio.TimeoutError:
+                entries = [None] * len(supported)
+            except Exception as e:
+                logger.warning(f"{BATCH_TOOL} failed, querying platforms individually: {e}")
+                if self.scheduler is not None:
+                    for platform in supported:
+                        self.scheduler.release(platform)
+                scheduled.extend(supported)
+                entries = []
+            elapsed_ms = round((time.perf_counter() - start) * 1000)
+
+            for platform, entry in zip(supported, entries):
+                result = PlatformResult(platform, duration_ms=elapsed_ms)
+                if entry is None:
+                    result.error = f"Timed out after {deadline}s"
+                else:
+                    result.duration_ms = entry.get("duration_ms", elapsed_ms)
+                    try:
+                        self._apply_payload(result, entry, BATCH_TOOL)
+                    except Exception as e:
+                        self._apply_error(result, e)
+                if result.error == "rate_limited" and self.scheduler is not None:
+                    self.scheduler.record_rate_limit(platform, result.retry_after)
+                    scheduled.append(platform)
+                    continue
+                results[platform] = result
+
+        for platform in results:
+            self._report(results[platform], trace_id)
+
+        if scheduled:
+            spent = time.perf_counter() - batch_start
+            retried = await asyncio.gather(*(
+                self.fetch_platform(p, limit, trace_id, timeout=max(0.0, self.timeout_for(p) - spent), since=since)
+                for p in scheduled
+            ))
+            results.update((r.platform, r) for r in retried)
+        return [results[p] for p in platforms]
+
+    async def stream(
+        self,
+        platforms: Iterable[str],
+        limit: int = settings.trend_discovery_limit,
+        trace_id: Optional[str] = None,
+        batch: bool = False,
+        since: Optional[Dict[str, datetime]] = None
+    ) -> AsyncIterator[PlatformResult]:
+        """
+        Yield each platform's result as soon as it completes.
+
+        With ``batch``, all platforms share one fetch_trends_batch round
+        trip and their results are yielded together when it returns.
+        """
+        if batch:
+            for result in await self.fetch_batch(platforms, limit, trace_id, since):
+                yield result
+            return
+
+        tasks = [
+            asyncio.create_task(self.fetch_platform(p, limit, trace_id, since=since))
+            for p in dict.fromkeys(platforms)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer stopped early; don't leave queries running
+            for task in tasks:
+                task.cancel()
+
+    async def discover(
+        self,
+        platforms: Iterable[str],
+        limit: int = settings.trend_discovery_limit,
+        trace_id: Optional[str] = None,
+        batch: bool = False,
+        since: Optional[Dict[str, datetime]] = None
+    ) -> DiscoveryResult:
+        """
+        Query all platforms concurrently and collect their results.
+
+        Args:
+            platforms: Platform names
+            limit: Trends requested per platform
+            trace_id: MCP Sense trace identifier
+            batch: Use one fetch_trends_batch call instead of a call per platform
+            since: Per-platform markers; only trends updated after them are requested
+
+        Returns:
+            Per-platform trends, errors and durations
+        """
+        start = time.perf_counter()
+        discovery = DiscoveryResult()
+        async for result in self.stream(platforms, limit, trace_id, batch, since):
+            discovery.results[result.platform] = result
+        discovery.duration_ms = round((time.perf_counter() - start) * 1000)
+        return discovery
@@ -0,0 +1,303 @@
+"""Bulk trend ingestion into PostgreSQL (FR-005)"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, Tuple, Union
+import json
+import logging
+import uuid
+
+from sqlalchemy import text
+
+from src.config.settings import settings
+from src.models.trend import Platform
+from src.services.database import Database, database
+from src.services.response_cache import ResponseCache, trend_response_cache
+from src.services.trend_velocity import VelocityEngine, velocity_engine
+from src.utils.error_handler import DatabaseError
+from src.utils.mcp_sense_logger import MCPSenseLogger, get_mcp_sense_logger
+
+logger = logging.getLogger("chimera.trend_ingestion")
+
+STAGING_TABLE = "trends_staging"
+
+# Columns written by COPY, in record order
+STAGING_COLUMNS = (
+    "trend_id",
+    "topic_name",
+    "platform",
+    "engagement_metrics",
+    "trend_velocity",
+    "timestamp",
+    "relevance_score",
+    "related_hashtags",
+    "platform_trend_id",
+    "engagement_velocity",
+)
+
+CREATE_STAGING_SQL = f"""
+CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+    trend_id uuid NOT NULL,
+    topic_name varchar(500) NOT NULL,
+    platform platform NOT NULL,
+    engagement_metrics jsonb NOT NULL,
+    trend_velocity double precision NOT NULL,
+    timestamp timestamptz NOT NULL,
+    relevance_score double precision,
+    related_hashtags jsonb,
+    platform_trend_id varchar NOT NULL,
+    engagement_velocity double precision
+) ON COMMIT DELETE ROWS
+"""
+
+# DISTINCT ON keeps the last row per unique key so a single statement never
+# touches the same target row twice. (xmax = 0) is true only for rows this
+# statement inserted, which separates inserts from conflict updates.
+MERGE_SQL = f"""
+INSERT INTO trends ({", ".join(STAGING_COLUMNS)})
+SELECT DISTINCT ON (platform, platform_trend_id, timestamp) {", ".join(STAGING_COLUMNS)}
+FROM {STAGING_TABLE}
+ORDER BY platform, platform_trend_id, timestamp, ctid DESC
+ON CONFLICT ON CONSTRAINT uq_trends_platform_trend_id_timestamp DO UPDATE SET
+    topic_name = EXCLUDED.topic_name,
+    engagement_metrics = EXCLUDED.engagement_metrics,
+    trend_velocity = EXCLUDED.trend_velocity,
+    engagement_velocity = COALESCE(EXCLUDED.engagement_velocity, trends.engagement_velocity),
+    relevance_score = COALESCE(EXCLUDED.relevance_score, trends.relevance_score),
+    related_hashtags = EXCLUDED.related_hashtags,
+    updated_at = now()
+RETURNING (xmax = 0) AS inserted
+"""
+
+
+@dataclass
+class BatchResult:
+    """Outcome of merging one batch into the trends table"""
+    rows_received: int
+    rows_inserted: int
+    rows_updated: int
+    velocities_computed: int = 0
+    rows_rejected: int = 0  # Invalid trends dropped before the copy (not in rows_received)
+
+    @property
+    def rows_deduplicated(self) -> int:
+        """Rows collapsed into a later row of the same batch (same platform, trend id and timestamp)"""
+        return self.rows_received - self.rows_inserted - self.rows_updated
+
+
+@dataclass
+class IngestionSummary:
+    """Totals across all batches of one ingestion run"""
+    batches: List[BatchResult] = field(default_factory=list)
+
+    @property
+    def rows_received(self) -> int:
+        return sum(b.rows_received for b in self.batches)
+
+    @property
+    def rows_inserted(self) -> int:
+        return sum(b.rows_inserted for b in self.batches)
+
+    @property
+    def rows_updated(self) -> int:
+        return sum(b.rows_updated for b in self.batches)
+
+    @property
+    def rows_deduplicated(self) -> int:
+        return sum(b.rows_deduplicated for b in self.batches)
+
+    @property
+    def velocities_computed(self) -> int:
+        return sum(b.velocities_computed for b in self.batches)
+
+    @property
+    def rows_rejected(self) -> int:
+        return sum(b.rows_rejected for b in self.batches)
+
+
+def to_record(trend: Dict[str, Any], default_timestamp: datetime) -> Tuple[Any, ...]:
+    """
+    Convert a discovered trend dict into a COPY record.
+
+    Accepts the skill output shape (``topic`` or ``topic_name``, platform as
+    a lowercase string or Platform) and encodes JSON columns as text.
+
+    Raises:
+        ValueError: If required fields are missing or the platform is unknown
+    """
+    topic = trend.get("topic_name") or trend.get("topic")
+    platform_trend_id = trend.get("platform_trend_id")
+    if not topic or not platform_trend_id:
+        raise ValueError(f"Trend is missing topic_name or platform_trend_id: {trend}")
+
+    platform = trend["platform"]
+    if not isinstance(platform, Platform):
+        platform = Platform(str(platform).lower())
+
+    timestamp = trend.get("timestamp") or default_timestamp
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+
+    trend_id = trend.get("trend_id") or uuid.uuid4()
+    if isinstance(trend_id, str):
+        trend_id = uuid.UUID(trend_id)
+
+    hashtags = trend.get("related_hashtags")
+    return (
+        trend_id,
+        topic[:500],
+        # The platform enum is stored by member name (see Trend.platform)
+        platform.name,
+        json.dumps(trend.get("engagement_metrics") or {}),
+        float(trend.get("trend_velocity") or 0.0),
+        timestamp,
+        trend.get("relevance_score"),
+        json.dumps(hashtags) if hashtags is not None else None,
+        str(platform_trend_id),
+        trend.get("engagement_velocity"),
+    )
+
+
+class TrendIngestionService:
+    """
+    Streams trend batches into PostgreSQL via COPY and a single merge.
+
+    With a VelocityEngine, each batch's ``engagement_velocity`` is computed from
+    the engine's in-memory history before it is written (and rolled back if
+    the write fails), and the engine is checkpointed to Redis after every
+    ingestion run.
+    """
+
+    def __init__(
+        self,
+        db: Database = database,
+        batch_size: int = settings.trend_ingestion_batch_size,
+        sense_logger: Optional[MCPSenseLogger] = None,
+        response_cache: ResponseCache = trend_response_cache,
+        velocity: Optional[VelocityEngine] = velocity_engine
+    ):
+        self.db = db
+        self.batch_size = batch_size
+        self.sense_logger = sense_logger or get_mcp_sense_logger()
+        self.response_cache = response_cache
+        self.velocity = velocity
+
+    async def ingest(
+        self,
+        trends: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+        trace_id: Optional[str] = None
+    ) -> IngestionSummary:
+        """
+        Ingest trends in batches of ``batch_size``.
+
+        Args:
+            trends: Trend dicts, sync or async iterable
+            trace_id: MCP Sense trace identifier
+
+        Returns:
+            Per-batch and total row counts
+        """
+        summary = IngestionSummary()
+        batch: List[Dict[str, Any]] = []
+
+        if hasattr(trends, "__aiter__"):
+            async for trend in trends:
+                batch.append(trend)
+                if len(batch) >= self.batch_size:
+                    summary.batches.append(await self.ingest_batch(batch, trace_id))
+                    batch = []
+        else:
+            for trend in trends:
+                batch.append(trend)
+                if len(batch) >= self.batch_size:
+                    summary.batches.append(await self.ingest_batch(batch, trace_id))
+                    batch = []
+
+        if batch:
+            summary.batches.append(await self.ingest_batch(batch, trace_id))
+        if self.velocity is not None:
+            await self.velocity.checkpoint()
+        return summary
+
+    async def ingest_batch(
+        self,
+        trends: List[Dict[str, Any]],
+        trace_id: Optional[str] = None
+    ) -> BatchResult:
+        """
+        Copy one batch into the staging table and merge it into trends.
+
+        Trends that can't be converted to records are logged, counted in
+        ``rows_rejected`` and dropped; the rest of the batch is stored.
+
+        Raises:
+            DatabaseError: If the copy or merge fails
+        """
+        now = datetime.now(timezone.utc)
+        valid: List[Dict[str, Any]] = []
+        records: List[Tuple[Any, ...]] = []
+        for trend in trends:
+            try:
+                records.append(to_record(trend, now))
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping invalid trend: {e}")
+                continue
+            valid.append(trend)
+        rejected = len(trends) - len(valid)
+
+        savepoint = self.velocity.savepoint(valid) if self.velocity is not None else None
+        velocities = 0
+        try:
+            if self.velocity is not None:
+                velocities = self.velocity.fill(valid)
+                # Engagement velocity (the last column) is only known once the batch is observed
+                records = [record[:-1] + (t.get("engagement_velocity"),) for record, t in zip(records, valid)]
+            inserted, updated = await self._copy_and_merge(records) if records else (0, 0)
+        except Exception as e:
+            if savepoint is not None:
+                self.velocity.rollback(savepoint)
+            logger.error(f"Trend ingestion batch failed: {e}")
+            raise DatabaseError(
+                f"Failed to ingest {len(records)} trends: {e}",
+                operation="trend_ingestion",
+                details={"batch_size": len(records)}
+            ) from e
+
+        result = BatchResult(
+            rows_received=len(records),
+            rows_inserted=inserted,
+            rows_updated=updated,
+            velocities_computed=velocities,
+            rows_rejected=rejected
+        )
+        if inserted or updated:
+            await self.response_cache.invalidate_platforms(
+                {Platform[record[2]] for record in records}
+            )
+        self.sense_logger.log_trend_storage(
+            result.rows_inserted,
+            trace_id,
+            rows_updated=result.rows_updated,
+            rows_deduplicated=result.rows_deduplicated,
+            velocities_computed=result.velocities_computed,
+            rows_rejected=result.rows_rejected
+        )
+        return result
+
+    async def _copy_and_merge(self, records: List[Tuple[Any, ...]]) -> Tuple[int, int]:
+        """Run COPY + merge in one transaction, returning (inserted, updated)"""
+        async with self.db.get_engine().begin() as conn:
+            await conn.execute(text(CREATE_STAGING_SQL))
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                STAGING_TABLE,
+                records=records,
+                columns=list(STAGING_COLUMNS)
+            )
+            result = await conn.execute(text(MERGE_SQL))
+            flags = [row.inserted for row in result]
+
+        inserted = sum(1 for f in flags if f)
+        return inserted, len(flags) - inserted
@@ -0,0 +1,226 @@
+"""Weekly range partition management and retention for the trends table"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+import asyncio
+import logging
+import re
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.config.settings import settings
+from src.services.database import Database, database
+
+logger = logging.getLogger("chimera.trend_partitions")
+
+PARENT_TABLE = "trends"
+DEFAULT_PARTITION = "trends_default"
+PARTITION_PREFIX = "trends_p"
+PARTITION_SPAN = timedelta(weeks=1)
+
+# Arbitrary constant so only one worker runs maintenance at a time
+MAINTENANCE_LOCK_ID = 7_364_021
+
+_PARTITION_NAME_RE = re.compile(rf"^{PARTITION_PREFIX}(\d{{8}})$")
+
+
+@dataclass(frozen=True)
+class TrendPartition:
+    """One weekly partition covering [start, end)"""
+    start: date
+
+    @property
+    def end(self) -> date:
+        return self.start + PARTITION_SPAN
+
+    @property
+    def name(self) -> str:
+        return f"{PARTITION_PREFIX}{self.start:%Y%m%d}"
+
+    @classmethod
+    def for_timestamp(cls, ts: datetime) -> "TrendPartition":
+        """Partition containing ``ts`` (weeks start on Monday, UTC)"""
+        if ts.tzinfo is not None:
+            ts = ts.astimezone(timezone.utc)
+        day = ts.date()
+        return cls(day - timedelta(days=day.weekday()))
+
+    @classmethod
+    def from_name(cls, name: str) -> Optional["TrendPartition"]:
+        """Parse a partition table name, returning None for non-managed tables"""
+        match = _PARTITION_NAME_RE.match(name)
+        if not match:
+            return None
+        return cls(datetime.strptime(match.group(1), "%Y%m%d").date())
+
+    @property
+    def bounds_sql(self) -> str:
+        return f"FROM ('{self.start.isoformat()} 00:00:00+00') TO ('{self.end.isoformat()} 00:00:00+00')"
+
+    @property
+    def range_predicate(self) -> str:
+        return (
+            f"timestamp >= '{self.start.isoformat()} 00:00:00+00' "
+            f"AND timestamp < '{self.end.isoformat()} 00:00:00+00'"
+        )
+
+    def create_sql(self) -> str:
+        return f"CREATE TABLE IF NOT EXISTS {self.name} PARTITION OF {PARENT_TABLE} FOR VALUES {self.bounds_sql}"
+
+    def split_from_default_sql(self) -> List[str]:
+        """
+        Statements creating this partition when the default partition holds
+        rows in its range, which a plain CREATE ... PARTITION OF rejects.
+
+        The rows are copied into a standalone table and removed from the
+        default partition before the table is attached (in one transaction).
+        """
+        return [
+            f"CREATE TABLE {self.name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+            f"INSERT INTO {self.name} SELECT * FROM {DEFAULT_PARTITION} WHERE {self.range_predicate}",
+            f"DELETE FROM {DEFAULT_PARTITION} WHERE {self.range_predicate}",
+            f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {self.name} FOR VALUES {self.bounds_sql}",
+        ]
+
+
+def partitions_between(start: datetime, end: datetime) -> List[TrendPartition]:
+    """All weekly partitions needed to cover [start, end]"""
+    current = TrendPartition.for_timestamp(start)
+    last = TrendPartition.for_timestamp(end)
+    partitions = []
+    while current.start <= last.start:
+        partitions.append(current)
+        current = TrendPartition(current.end)
+    return partitions
+
+
+def expired_partitions(
+    names: Iterable[str],
+    now: datetime,
+    retention_days: int
+) -> List[TrendPartition]:
+    """Managed partitions whose entire range is older than the retention window"""
+    cutoff = (now - timedelta(days=retention_days)).date()
+    expired = []
+    for name in names:
+        partition = TrendPartition.from_name(name)
+        if partition is not None and partition.end <= cutoff:
+            expired.append(partition)
+    return sorted(expired, key=lambda p: p.start)
+
+
+class TrendPartitionManager:
+    """
+    Pre-creates upcoming partitions and retires expired ones.
+
+    Rows that landed in the default partition (future-dated, or written
+    while maintenance was down and their week had no partition) are split
+    out into their weekly partition once that week is within the premake
+    horizon, so they are retired with it. Rows further ahead stay in the
+    default partition until then.
+    """
+
+    def __init__(
+        self,
+        db: Database = database,
+        premake: int = settings.trend_partition_premake,
+        retention_days: int = settings.trend_retention_days,
+        detach_only: bool = settings.trend_partition_detach_only
+    ):
+        self.db = db
+        self.premake = premake
+        self.retention_days = retention_days
+        self.detach_only = detach_only
+
+    async def list_partitions(self, conn: AsyncConnection) -> List[str]:
+        """Names of tables currently attached to the trends parent"""
+        result = await conn.execute(text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :parent"
+        ), {"parent": PARENT_TABLE})
+        return [row[0] for row in result]
+
+    async def default_partition_weeks(self, conn: AsyncConnection, horizon: datetime) -> List[TrendPartition]:
+        """Weekly partitions with rows waiting in the default partition, up to ``horizon``"""
+        result = await conn.execute(text(
+            f"SELECT DISTINCT date_trunc('week', timestamp AT TIME ZONE 'UTC')::date "
+            f"FROM {DEFAULT_PARTITION} WHERE timestamp < :horizon"
+        ), {"horizon": horizon})
+        return sorted((TrendPartition(row[0]) for row in result), key=lambda p: p.start)
+
+    async def run_maintenance(self, now: Optional[datetime] = None) -> dict:
+        """
+        Create upcoming partitions and drop/detach expired ones.
+
+        Weeks with rows in the default partition are split out first, so
+        creating them never fails and expired ones are retired this run.
+
+        Returns:
+            Dictionary with created and retired partition names
+        """
+        now = now or datetime.now(timezone.utc)
+        created: List[str] = []
+        retired: List[str] = []
+
+        async with self.db.get_engine().begin() as conn:
+            locked = await conn.scalar(
+                text("SELECT pg_try_advisory_xact_lock(:lock_id)"),
+                {"lock_id": MAINTENANCE_LOCK_ID}
+            )
+            if not locked:
+                logger.info("Partition maintenance already running elsewhere, skipping")
+                return {"created": created, "retired": retired}
+
+            existing = set(await self.list_partitions(conn))
+            horizon = now + PARTITION_SPAN * self.premake
+            stranded = set()
+            if DEFAULT_PARTITION in existing:
+                last = TrendPartition.for_timestamp(horizon).end
+                stranded = set(await self.default_partition_weeks(
+                    conn, datetime(last.year, last.month, last.day, tzinfo=timezone.utc)
+                ))
+
+            for partition in sorted(stranded | set(partitions_between(now, horizon)), key=lambda p: p.start):
+                if partition.name in existing:
+                    continue
+                statements = partition.split_from_default_sql() if partition in stranded else [partition.create_sql()]
+                for statement in statements:
+                    await conn.execute(text(statement))
+                existing.add(partition.name)
+                created.append(partition.name)
+
+            for partition in expired_partitions(existing, now, self.retention_days):
+                await conn.execute(text(
+                    f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition.name}"
+                ))
+                if not self.detach_only:
+                    await conn.execute(text(f"DROP TABLE {partition.name}"))
+                retired.append(partition.name)
+
+        if created or retired:
+            logger.info(f"Trend partitions created={created} retired={retired}")
+        return {"created": created, "retired": retired}
+
+    async def run_forever(self, interval: float = settings.trend_partition_maintenance_interval) -> None:
+        """Run maintenance periodically until cancelled"""
+        while True:
+            try:
+                await self.run_maintenance()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Trend partition maintenance failed: {e}")
+            await asyncio.sleep(interval)
+
+
+if __name__ == "__main__":
+    async def _main() -> None:
+        manager = TrendPartitionManager()
+        print(await manager.run_maintenance())
+        await manager.db.disconnect()
+
+    asyncio.run(_main())
@@ -0,0 +1,201 @@
+"""Trend storage service - historical trend retrieval (FR-006, SC-004)"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+import base64
+import logging
+import uuid
+
+from sqlalchemy import Numeric, Select, Text, and_, cast, func, literal_column, or_, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.trend import Trend, Platform
+
+logger = logging.getLogger("chimera.trend_storage")
+
+# engagement_metrics keys with expression indexes (alembic 003)
+INDEXED_METRICS = ("likes", "views")
+
+
+def normalize_hashtag(tag: str) -> str:
+    """Normalize a hashtag to the stored ``#Tag`` form"""
+    tag = tag.strip()
+    return tag if tag.startswith("#") else f"#{tag}"
+
+
+def hashtags_expression():
+    """
+    ``lower(related_hashtags::text)::jsonb``, matching the case-insensitive
+    GIN index (alembic 004). Stored hashtags keep their original case.
+    """
+    return cast(func.lower(cast(Trend.related_hashtags, Text)), JSONB)
+
+
+def metric_expression(metric: str):
+    """
+    ``(engagement_metrics ->> 'metric')::numeric``, matching the expression
+    index for that metric. The key is rendered as a literal because an
+    index expression cannot match a bound parameter.
+    """
+    if metric not in INDEXED_METRICS:
+        raise ValueError(f"Metric '{metric}' is not indexed")
+    return cast(
+        type_coerce(Trend.engagement_metrics, JSONB).op("->>")(literal_column(f"'{metric}'")),
+        Numeric
+    )
+
+
+@dataclass(frozen=True)
+class TrendCursor:
+    """Keyset pagination cursor pointing at the last row of a page"""
+    timestamp: datetime
+    trend_id: uuid.UUID
+
+    def encode(self) -> str:
+        """Encode cursor as an opaque URL-safe token"""
+        raw = f"{self.timestamp.isoformat()}|{self.trend_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "TrendCursor":
+        """
+        Decode a cursor token.
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+            timestamp, trend_id = raw.split("|", 1)
+            return cls(datetime.fromisoformat(timestamp), uuid.UUID(trend_id))
+        except Exception as e:
+            raise ValueError(f"Invalid cursor: {token}") from e
+
+    @classmethod
+    def from_trend(cls, trend: Trend) -> "TrendCursor":
+        """Build the cursor that resumes after the given trend"""
+        return cls(trend.timestamp, trend.trend_id)
+
+
+def build_trend_query(
+    platforms: Optional[Sequence[Platform]] = None,
+    min_relevance: Optional[float] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    cursor: Optional[TrendCursor] = None,
+    limit: int = 50,
+    hashtags: Optional[Sequence[str]] = None,
+    min_likes: Optional[int] = None,
+    min_views: Optional[int] = None
+) -> Select:
+    """
+    Build the keyset-paginated trend query.
+
+    Rows are ordered newest first by ``(timestamp, trend_id)``. The
+    timestamp bounds are written as plain range predicates so Postgres can
+    drive the scan from ``ix_trends_platform_timestamp`` (or
+    ``ix_trends_timestamp`` when no platform is given), and
+    ``min_relevance`` can be served by ``ix_trends_relevance_score``.
+    Resuming from a cursor adds another range predicate rather than an
+    OFFSET, so every page costs the same as the first.
+
+    ``hashtags`` uses case-insensitive JSONB containment (``@>``), served
+    by the ``ix_trends_related_hashtags_lower`` GIN index; ``min_likes`` and
+    ``min_views`` use the ``ix_trends_engagement_*`` expression indexes.
+    These filters require PostgreSQL.
+
+    Args:
+        platforms: Restrict to these platforms
+        min_relevance: Minimum relevance score (inclusive)
+        start_date: Oldest timestamp to include (inclusive)
+        end_date: Newest timestamp to include (inclusive)
+        cursor: Resume strictly after this position
+        limit: Page size
+        hashtags: Require all of these hashtags
+        min_likes: Minimum engagement_metrics.likes
+        min_views: Minimum engagement_metrics.views
+
+    Returns:
+        SQLAlchemy select over Trend
+    """
+    conditions = []
+
+    if platforms:
+        conditions.append(Trend.platform.in_(list(platforms)))
+    if min_relevance is not None:
+        conditions.append(Trend.relevance_score >= min_relevance)
+    if start_date is not None:
+        conditions.append(Trend.timestamp >= start_date)
+    if end_date is not None:
+        conditions.append(Trend.timestamp <= end_date)
+    if hashtags:
+        tags = [normalize_hashtag(t).lower() for t in hashtags]
+        conditions.append(hashtags_expression().contains(tags))
+    if min_likes is not None:
+        conditions.append(metric_expression("likes") >= min_likes)
+    if min_views is not None:
+        conditions.append(metric_expression("views") >= min_views)
+    if cursor is not None:
+        # Equivalent to (timestamp, trend_id) < (cursor.timestamp, cursor.trend_id),
+        # expanded so the leading timestamp bound stays index-usable
+        conditions.append(Trend.timestamp <= cursor.timestamp)
+        conditions.append(
+            or_(
+                Trend.timestamp < cursor.timestamp,
+                Trend.trend_id < cursor.trend_id
+            )
+        )
+
+    query = select(Trend)
+    if conditions:
+        query = query.where(and_(*conditions))
+    return query.order_by(Trend.timestamp.desc(), Trend.trend_id.desc()).limit(limit)
+
+
+async def retrieve_trends(
+    session: AsyncSession,
+    platforms: Optional[Sequence[Platform]] = None,
+    min_relevance: Optional[float] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    cursor: Optional[TrendCursor] = None,
+    limit: int = 50,
+    hashtags: Optional[Sequence[str]] = None,
+    min_likes: Optional[int] = None,
+    min_views: Optional[int] = None
+) -> Tuple[List[Trend], Optional[TrendCursor]]:
+    """
+    Retrieve one page of historical trends.
+
+    Returns:
+        Tuple of (trends, next_cursor); next_cursor is None on the last page
+    """
+    # Fetch one extra row to know whether another page exists
+    query = build_trend_query(
+        platforms=platforms,
+        min_relevance=min_relevance,
+        start_date=start_date,
+        end_date=end_date,
+        cursor=cursor,
+        limit=limit + 1,
+        hashtags=hashtags,
+        min_likes=min_likes,
+        min_views=min_views
+    )
+    result = await session.execute(query)
+    trends = list(result.scalars().all())
+
+    next_cursor = None
+    if len(trends) > limit:
+        trends = trends[:limit]
+        next_cursor = TrendCursor.from_trend(trends[-1])
+
+    return trends, next_cursor
+
+
+async def get_trend_by_id(session: AsyncSession, trend_id: uuid.UUID) -> Optional[Trend]:
+    """Look up a single trend by primary key"""
+    return await session.get(Trend, trend_id)
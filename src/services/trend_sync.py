@@ -0,0 +1,316 @@
+"""Delta sync of platform trends against PlatformConnection.last_sync_timestamp"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import asyncio
+import hashlib
+import logging
+import time
+import uuid
+
+import numpy as np
+import orjson
+from sqlalchemy import bindparam, text
+
+from src.config.settings import settings
+from src.models.trend import Platform
+from src.services.database import Database, database
+from src.services.relevance import get_scorer
+from src.services.trend_discovery import PLATFORM_TOOLS, TrendDiscoveryService
+from src.services.trend_ingestion import TrendIngestionService
+from src.utils.error_handler import DatabaseError
+from src.utils.mcp_sense_logger import MCPSenseLogger, get_mcp_sense_logger
+
+logger = logging.getLogger("chimera.trend_sync")
+
+LOAD_MARKERS_SQL = text("""
+SELECT platform_name, last_sync_timestamp
+FROM platform_connections
+WHERE platform_name IN :platforms
+""").bindparams(bindparam("platforms", expanding=True))
+
+# Markers only move forward, even if an older cycle commits last
+ADVANCE_MARKER_SQL = text("""
+INSERT INTO platform_connections (connection_id, platform_name, connection_status, rate_limit_status, last_sync_timestamp)
+VALUES (:connection_id, :platform, 'CONNECTED', '{}', :synced_at)
+ON CONFLICT ON CONSTRAINT uq_platform_connection_platform_name DO UPDATE SET
+    last_sync_timestamp = GREATEST(platform_connections.last_sync_timestamp, EXCLUDED.last_sync_timestamp),
+    updated_at = now()
+""")
+
+# Fields whose change makes a trend worth re-scoring and storing again
+FINGERPRINT_FIELDS = ("topic_name", "engagement_metrics", "trend_velocity", "related_hashtags")
+
+
+def trend_fingerprints(trends: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """
+    64-bit fingerprint per trend of its identity and FINGERPRINT_FIELDS.
+
+    Timestamps and generated trend_ids are left out, so a trend returned
+    again with the same content has the same fingerprint.
+    """
+    fingerprints = np.empty(len(trends), dtype=np.uint64)
+    for i, trend in enumerate(trends):
+        content = orjson.dumps(
+            [trend.get("platform"), trend.get("platform_trend_id"), *(trend.get(f) for f in FINGERPRINT_FIELDS)],
+            option=orjson.OPT_SORT_KEYS
+        )
+        fingerprints[i] = int.from_bytes(hashlib.blake2b(content, digest_size=8).digest(), "little")
+    return fingerprints
+
+
+class FingerprintSet:
+    """
+    Fingerprints of stored trends per platform, as sorted uint64 arrays.
+
+    Membership for a whole batch is one ``searchsorted``; each entry takes
+    16 bytes (fingerprint and last-seen time). Entries not seen again for
+    ``ttl`` seconds are dropped when new ones are added.
+    """
+
+    def __init__(self, ttl: float = settings.trend_sync_fingerprint_ttl):
+        self.ttl = ttl
+        self._fingerprints: Dict[str, np.ndarray] = defaultdict(lambda: np.empty(0, dtype=np.uint64))
+        self._seen_at: Dict[str, np.ndarray] = defaultdict(lambda: np.empty(0))
+
+    def __len__(self) -> int:
+        return sum(len(f) for f in self._fingerprints.values())
+
+    def contains(self, platform: str, fingerprints: np.ndarray) -> np.ndarray:
+        """Mask of fingerprints already stored for ``platform``"""
+        known = self._fingerprints[platform]
+        if not len(known):
+            return np.zeros(len(fingerprints), dtype=bool)
+        positions = np.minimum(np.searchsorted(known, fingerprints), len(known) - 1)
+        return known[positions] == fingerprints
+
+    def add(self, platform: str, fingerprints: np.ndarray, now: Optional[float] = None) -> None:
+        """Record fingerprints as stored (refreshing ones already known)"""
+        now = time.time() if now is None else now
+        merged = np.concatenate([self._fingerprints[platform], fingerprints])
+        seen_at = np.concatenate([self._seen_at[platform], np.full(len(fingerprints), now)])
+        # Newest entry per fingerprint wins; expired ones are dropped
+        order = np.lexsort((-seen_at, merged))
+        merged, seen_at = merged[order], seen_at[order]
+        keep = np.r_[True, merged[1:] != merged[:-1]] & (seen_at >= now - self.ttl)
+        self._fingerprints[platform], self._seen_at[platform] = merged[keep], seen_at[keep]
+
+
+@dataclass
+class PlatformSync:
+    """One platform's part of a sync cycle"""
+    platform: str
+    since: Optional[datetime] = None
+    fetched: int = 0
+    unchanged: int = 0
+    truncated: bool = False
+    error: Optional[str] = None
+
+    @property
+    def changed(self) -> int:
+        return self.fetched - self.unchanged
+
+
+@dataclass
+class SyncReport:
+    """Outcome of one delta sync cycle"""
+    started_at: datetime
+    platforms: Dict[str, PlatformSync] = field(default_factory=dict)
+    committed: bool = False
+    rows_inserted: int = 0
+    rows_updated: int = 0
+    error: Optional[str] = None
+    duration_ms: int = 0
+
+    @property
+    def fetched(self) -> int:
+        return sum(p.fetched for p in self.platforms.values())
+
+    @property
+    def unchanged(self) -> int:
+        return sum(p.unchanged for p in self.platforms.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "committed": self.committed,
+            "trends_fetched": self.fetched,
+            "trends_unchanged": self.unchanged,
+            "rows_inserted": self.rows_inserted,
+            "rows_updated": self.rows_updated,
+            "platforms": {
+                p.platform: {
+                    "since": p.since.isoformat() if p.since else None,
+                    "fetched": p.fetched,
+                    "unchanged": p.unchanged,
+                    "truncated": p.truncated,
+                    "error": p.error
+                }
+                for p in self.platforms.values()
+            },
+            "error": self.error,
+            "duration_ms": self.duration_ms
+        }
+
+
+class TrendSyncService:
+    """
+    Polls platforms for what changed since their last successful sync.
+
+    Each cycle reads every platform's ``last_sync_timestamp`` and passes it
+    to the MCP tools as ``since``. Returned trends whose fingerprint was
+    already stored are counted as unchanged and skip scoring and storage;
+    the rest are scored as one batch and ingested. Only after the ingestion
+    commits are their fingerprints recorded and the platforms' markers
+    advanced, so a failed cycle is retried in full.
+
+    A platform's marker moves to the cycle's start, unless it returned a
+    full ``limit`` of trends: delta results come oldest update first, so
+    its marker moves to the newest trend returned and the next cycle picks
+    up the changes beyond the cap.
+    """
+
+    def __init__(
+        self,
+        discovery: TrendDiscoveryService,
+        ingestion: Optional[TrendIngestionService] = None,
+        db: Database = database,
+        niche: str = settings.agent_niche,
+        limit: int = settings.trend_discovery_limit,
+        fingerprints: Optional[FingerprintSet] = None,
+        sense_logger: Optional[MCPSenseLogger] = None
+    ):
+        self.discovery = discovery
+        self.ingestion = ingestion or TrendIngestionService(db=db)
+        self.db = db
+        self.niche = niche
+        self.limit = limit
+        self.fingerprints = fingerprints or FingerprintSet()
+        self.sense_logger = sense_logger or get_mcp_sense_logger()
+
+    async def load_markers(self, platforms: Iterable[str]) -> Dict[str, datetime]:
+        """Last successful sync per platform (platforms never synced are absent)"""
+        names = [Platform(p).name for p in platforms]
+        async with self.db.get_engine().connect() as conn:
+            rows = (await conn.execute(LOAD_MARKERS_SQL, {"platforms": names})).all()
+        return {Platform[row.platform_name].value: row.last_sync_timestamp for row in rows if row.last_sync_timestamp}
+
+    async def advance_markers(self, markers: Dict[str, datetime]) -> None:
+        """Move each platform's last_sync_timestamp forward to its marker"""
+        params = [
+            {"connection_id": uuid.uuid4(), "platform": Platform(p).name, "synced_at": synced_at}
+            for p, synced_at in markers.items()
+        ]
+        if not params:
+            return
+        async with self.db.get_engine().begin() as conn:
+            await conn.execute(ADVANCE_MARKER_SQL, params)
+
+    @staticmethod
+    def next_marker(trends: Sequence[Dict[str, Any]], started_at: datetime) -> Optional[datetime]:
+        """Newest update among a truncated result (None when no trend has a timestamp)"""
+        times = [
+            datetime.fromisoformat(str(t["timestamp"]).replace("Z", "+00:00"))
+            for t in trends if t.get("timestamp")
+        ]
+        if not times:
+            return None
+        return min(max(times), started_at)
+
+    async def sync(self, platforms: Optional[List[str]] = None, trace_id: Optional[str] = None) -> SyncReport:
+        """
+        Run one delta sync cycle.
+
+        Never raises for platform or storage failures: they are reported on
+        the returned SyncReport, and nothing is marked as synced.
+        """
+        platforms = list(dict.fromkeys(platforms or PLATFORM_TOOLS))
+        trace_id = trace_id or str(uuid.uuid4())
+        start = time.perf_counter()
+        report = SyncReport(started_at=datetime.now(timezone.utc))
+        try:
+            since = await self.load_markers(platforms)
+        except Exception as e:
+            # Without markers every trend is fetched; fingerprints still skip unchanged ones
+            logger.warning(f"Could not read sync markers, fetching full trend lists: {e}")
+            since = {}
+
+        discovery = await self.discovery.discover(
+            platforms, self.limit, trace_id, batch=settings.trend_discovery_batch, since=since
+        )
+        changed: List[Dict[str, Any]] = []
+        seen: Dict[str, np.ndarray] = {}
+        markers: Dict[str, datetime] = {}
+        for platform in platforms:
+            result = discovery.results.get(platform)
+            entry = report.platforms[platform] = PlatformSync(platform, since=since.get(platform))
+            if result is None or not result.ok:
+                entry.error = result.error if result is not None else "No result"
+                continue
+            fingerprints = trend_fingerprints(result.trends)
+            known = self.fingerprints.contains(platform, fingerprints)
+            entry.fetched = len(result.trends)
+            entry.unchanged = int(known.sum())
+            entry.truncated = entry.fetched >= self.limit
+            changed.extend(t for t, k in zip(result.trends, known.tolist()) if not k)
+            seen[platform] = fingerprints
+            marker = self.next_marker(result.trends, report.started_at) if entry.truncated else report.started_at
+            if marker is not None:
+                markers[platform] = marker
+
+        get_scorer(self.niche).score_into(changed)
+        try:
+            summary = await self.ingestion.ingest(changed, trace_id)
+        except DatabaseError as e:
+            report.error = str(e)
+        else:
+            report.rows_inserted = summary.rows_inserted
+            report.rows_updated = summary.rows_updated
+            for platform, fingerprints in seen.items():
+                self.fingerprints.add(platform, fingerprints)
+            try:
+                await self.advance_markers(markers)
+                report.committed = True
+            except Exception as e:
+                report.error = f"Trends stored but sync markers not advanced: {e}"
+
+        report.duration_ms = round((time.perf_counter() - start) * 1000)
+        if report.error:
+            logger.error(f"Trend delta sync failed: {report.error}")
+        self.sense_logger.log_activity("trend_delta_sync", "trend_sync_service", report.to_dict(), trace_id)
+        return report
+
+    async def run_forever(
+        self,
+        platforms: Optional[List[str]] = None,
+        interval: float = settings.trend_sync_interval
+    ) -> None:
+        """Run sync cycles periodically until cancelled"""
+        while True:
+            try:
+                report = await self.sync(platforms)
+                logger.info(
+                    f"Trend delta sync: {report.fetched} fetched, {report.unchanged} unchanged, "
+                    f"{report.rows_inserted} inserted"
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Trend delta sync failed: {e}")
+            await asyncio.sleep(interval)
+
+
+if __name__ == "__main__":
+    async def _main() -> None:
+        from src.services.mcp_client import managed_tool_client, mcp_client_manager
+        from src.services.platform_scheduler import platform_scheduler
+
+        mcp_client_manager.register_default_servers()
+        await platform_scheduler.load()
+        service = TrendSyncService(TrendDiscoveryService(managed_tool_client()))
+        print(orjson.dumps((await service.sync()).to_dict(), option=orjson.OPT_INDENT_2).decode())
+        await mcp_client_manager.disconnect_all()
+        await service.db.disconnect()
+
+    asyncio.run(_main())
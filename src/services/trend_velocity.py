@@ -0,0 +1,361 @@
+"""Incremental sliding-window engagement velocity with Redis checkpoints (Trend.engagement_velocity)"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+import logging
+import math
+import time
+
+import numpy as np
+import orjson
+
+from src.config.settings import settings
+from src.services.redis_client import AsyncRedisClient, redis_client
+
+logger = logging.getLogger("chimera.trend_velocity")
+
+TrendKey = Tuple[str, str]
+
+SECONDS_PER_HOUR = 3600.0
+
+
+def _epoch(value: Any) -> float:
+    if value is None:
+        return time.time()
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class VelocityEngine:
+    """
+    Windowed activity rate and acceleration per (platform, platform_trend_id).
+
+    Every trend owns one row of fixed-size ring buffers holding its last
+    ``capacity`` observations: when it was seen and its activity count
+    (the sum of ``metrics`` in its engagement counters). An observation
+    writes one ring position and compares against the oldest observation
+    still inside ``window`` (or the previous one, if the trend was polled
+    less often than that), so each costs the same however long the trend
+    has been tracked and never needs stored history from the database.
+
+    Velocity is the count gained per hour (engagement per hour, unlike the
+    platforms' posts-per-hour ``trend_velocity``); acceleration is the
+    change in velocity per hour since the previous observation. Observations no newer
+    than a trend's latest are ignored; a count that goes down restarts the
+    trend's buffer. Trends idle for ``idle_ttl`` are dropped.
+
+    ``savepoint`` and ``rollback`` undo observations of a batch whose write
+    failed, so a retried batch is observed as new rather than as a repeat.
+
+    ``checkpoint`` writes trends observed since the last checkpoint to one
+    Redis hash and ``restore`` loads it, so a restarted worker computes
+    velocities from its first poll.
+    """
+
+    def __init__(
+        self,
+        window: float = settings.trend_velocity_window,
+        capacity: int = settings.trend_velocity_capacity,
+        metrics: Optional[Sequence[str]] = None,
+        idle_ttl: float = settings.trend_velocity_idle_ttl,
+        client: Optional[AsyncRedisClient] = redis_client,
+        namespace: str = "chimera:velocity"
+    ):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.window = window
+        self.capacity = capacity
+        self.metrics = list(settings.trend_velocity_metrics if metrics is None else metrics)
+        self.idle_ttl = idle_ttl
+        self.client = client
+        self.namespace = namespace
+
+        self._slots: Dict[TrendKey, int] = {}
+        self._free: List[int] = []
+        self._dirty: Set[TrendKey] = set()
+        self._expired: Set[TrendKey] = set()
+        self._allocate(1024)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _allocate(self, rows: int) -> None:
+        """Create (or grow to) ``rows`` ring buffers"""
+        old = len(getattr(self, "_head", ()))
+        times = np.full((rows, self.capacity), np.nan)
+        counts = np.zeros((rows, self.capacity))
+        head = np.zeros(rows, dtype=np.int64)
+        rate = np.full(rows, np.nan)
+        accel = np.full(rows, np.nan)
+        if old:
+            times[:old], counts[:old], head[:old] = self._times, self._counts, self._head
+            rate[:old], accel[:old] = self._rate, self._accel
+        self._times, self._counts, self._head, self._rate, self._accel = times, counts, head, rate, accel
+        self._free.extend(range(rows - 1, old - 1, -1))
+
+    def _slot(self, key: TrendKey) -> int:
+        slot = self._slots.get(key)
+        if slot is None:
+            if not self._free:
+                self._allocate(2 * len(self._head))
+            slot = self._free.pop()
+            self._clear(slot)
+            self._slots[key] = slot
+            self._expired.discard(key)
+        return slot
+
+    def _clear(self, slots: Any) -> None:
+        self._times[slots] = np.nan
+        self._head[slots] = 0
+        self._rate[slots] = np.nan
+        self._accel[slots] = np.nan
+
+    def activity(self, trends: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """Activity count per trend (NaN when it reports none of ``metrics``)"""
+        counts = np.full(len(trends), np.nan)
+        for i, trend in enumerate(trends):
+            engagement = trend.get("engagement_metrics") or {}
+            values = [engagement[m] for m in self.metrics if engagement.get(m) is not None]
+            if values:
+                counts[i] = sum(values)
+        return counts
+
+    def observe(
+        self,
+        keys: Sequence[TrendKey],
+        times: np.ndarray,
+        counts: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Record one observation per key, returning each key's (velocity, acceleration).
+
+        Both are NaN until a trend has two observations. Several observations
+        of the same key in one call are applied in order, each getting the
+        values as of itself.
+        """
+        times = np.asarray(times, dtype=float)
+        counts = np.asarray(counts, dtype=float)
+        slots = np.fromiter((self._slot(k) for k in keys), dtype=np.int64, count=len(keys))
+        self._dirty.update(keys)
+
+        # Repeated keys go in successive rounds, so every round writes each slot once
+        order = np.argsort(slots, kind="stable")
+        sorted_slots = slots[order]
+        first = np.r_[True, sorted_slots[1:] != sorted_slots[:-1]] if len(slots) else np.zeros(0, bool)
+        starts = np.flatnonzero(first)
+        repeat = np.empty(len(slots), dtype=np.int64)
+        repeat[order] = np.arange(len(slots)) - np.repeat(starts, np.diff(np.r_[starts, len(slots)]))
+        rates = np.full(len(slots), np.nan)
+        accels = np.full(len(slots), np.nan)
+        for round_ in range(int(repeat.max()) + 1 if len(slots) else 0):
+            rows = np.flatnonzero(repeat == round_)
+            self._observe_unique(slots[rows], times[rows], counts[rows])
+            rates[rows], accels[rows] = self._rate[slots[rows]], self._accel[slots[rows]]
+        return rates, accels
+
+    def _observe_unique(self, slots: np.ndarray, times: np.ndarray, counts: np.ndarray) -> None:
+        cap = self.capacity
+        last = (self._head[slots] - 1) % cap
+        last_time = self._times[slots, last]
+        last_count = self._counts[slots, last]
+        fresh = ~np.isnan(counts) & (np.isnan(last_time) | (times > last_time))
+        restart = fresh & (counts < last_count)
+        if restart.any():
+            self._clear(slots[restart])
+            last_time = np.where(restart, np.nan, last_time)
+        slots, times, counts, last_time = slots[fresh], times[fresh], counts[fresh], last_time[fresh]
+        if not len(slots):
+            return
+
+        head = self._head[slots]
+        self._times[slots, head] = times
+        self._counts[slots, head] = counts
+        self._head[slots] = (head + 1) % cap
+
+        # Oldest earlier observation inside the window; the previous one if none is
+        history = self._times[slots].copy()
+        history[np.arange(len(slots)), head] = np.nan
+        in_window = history >= (times - self.window)[:, None]
+        base = np.argmin(np.where(in_window, history, np.inf), axis=1)
+        base = np.where(in_window.any(axis=1), base, (head - 1) % cap)
+        base_time = self._times[slots, base]
+        base_count = self._counts[slots, base]
+
+        hours = (times - base_time) / SECONDS_PER_HOUR
+        rate = np.maximum(counts - base_count, 0.0) / hours
+        previous_rate = self._rate[slots]
+        accel = (rate - previous_rate) / ((times - last_time) / SECONDS_PER_HOUR)
+        self._rate[slots] = rate
+        self._accel[slots] = accel
+
+    @staticmethod
+    def _keys(trends: Sequence[Dict[str, Any]]) -> List[TrendKey]:
+        return [(str(t.get("platform")).lower(), str(t.get("platform_trend_id"))) for t in trends]
+
+    def fill(self, trends: Sequence[Dict[str, Any]]) -> int:
+        """
+        Observe trends and set their ``engagement_velocity`` and ``engagement_acceleration``.
+
+        Both stay unset for trends seen for the first time. The
+        platform-reported ``trend_velocity`` is never changed.
+
+        Returns:
+            How many trends got a computed velocity
+        """
+        keys = self._keys(trends)
+        times = np.fromiter((_epoch(t.get("timestamp")) for t in trends), dtype=float, count=len(trends))
+        rates, accels = self.observe(keys, times, self.activity(trends))
+        filled = 0
+        for trend, rate, accel in zip(trends, rates.tolist(), accels.tolist()):
+            if not math.isnan(rate):
+                trend["engagement_velocity"] = round(rate, 2)
+                trend["engagement_acceleration"] = None if math.isnan(accel) else round(accel, 2)
+                filled += 1
+        return filled
+
+    def savepoint(self, trends: Sequence[Dict[str, Any]]) -> Dict[TrendKey, Any]:
+        """The state of the trends' buffers, for ``rollback`` if their write fails"""
+        saved: Dict[TrendKey, Any] = {}
+        for key in self._keys(trends):
+            if key in saved:
+                continue
+            slot = self._slots.get(key)
+            row = None if slot is None else (
+                self._times[slot].copy(),
+                self._counts[slot].copy(),
+                int(self._head[slot]),
+                float(self._rate[slot]),
+                float(self._accel[slot]),
+            )
+            saved[key] = (row, key in self._dirty, key in self._expired)
+        return saved
+
+    def rollback(self, saved: Dict[TrendKey, Any]) -> None:
+        """Undo observations of the trends in ``saved`` made since the savepoint"""
+        for key, (row, dirty, expired) in saved.items():
+            if row is None:
+                slot = self._slots.pop(key, None)
+                if slot is not None:
+                    self._free.append(slot)
+            else:
+                slot = self._slot(key)
+                self._times[slot], self._counts[slot], self._head[slot], self._rate[slot], self._accel[slot] = row
+            (self._dirty.add if dirty else self._dirty.discard)(key)
+            (self._expired.add if expired else self._expired.discard)(key)
+
+    def get(self, platform: str, platform_trend_id: str) -> Tuple[Optional[float], Optional[float]]:
+        """Latest (velocity, acceleration) of a trend, None where unknown"""
+        slot = self._slots.get((platform, platform_trend_id))
+        if slot is None:
+            return None, None
+        rate, accel = float(self._rate[slot]), float(self._accel[slot])
+        return (None if math.isnan(rate) else rate), (None if math.isnan(accel) else accel)
+
+    def prune(self, now: Optional[float] = None) -> List[TrendKey]:
+        """Drop trends not observed for ``idle_ttl`` seconds, returning their keys"""
+        now = time.time() if now is None else now
+        if not self._slots:
+            return []
+        keys = list(self._slots)
+        slots = np.fromiter(self._slots.values(), dtype=np.int64, count=len(keys))
+        latest = np.fmax.reduce(self._times[slots], axis=1)
+        # Trends with no usable observation (NaN) expire too
+        expired = [keys[i] for i in np.flatnonzero(~(latest >= now - self.idle_ttl))]
+        for key in expired:
+            self._free.append(self._slots.pop(key))
+        self._dirty.difference_update(expired)
+        self._expired.update(expired)
+        return expired
+
+    @staticmethod
+    def _field(key: TrendKey) -> str:
+        return f"{key[0]}:{key[1]}"
+
+    def _state(self, slot: int) -> bytes:
+        """A trend's observations, oldest first, with its latest rate and acceleration"""
+        ring = np.roll(np.arange(self.capacity), -int(self._head[slot]))
+        times = self._times[slot, ring]
+        kept = ~np.isnan(times)
+        rate, accel = float(self._rate[slot]), float(self._accel[slot])
+        return orjson.dumps({
+            "t": times[kept].tolist(),
+            "c": self._counts[slot, ring][kept].tolist(),
+            "r": None if math.isnan(rate) else rate,
+            "a": None if math.isnan(accel) else accel,
+        })
+
+    def _load(self, key: TrendKey, raw: Any) -> None:
+        state = orjson.loads(raw)
+        observed = state["t"][-self.capacity:]
+        slot = self._slot(key)
+        self._clear(slot)
+        self._times[slot, :len(observed)] = observed
+        self._counts[slot, :len(observed)] = state["c"][-self.capacity:]
+        self._head[slot] = len(observed) % self.capacity
+        self._rate[slot] = np.nan if state["r"] is None else state["r"]
+        self._accel[slot] = np.nan if state["a"] is None else state["a"]
+
+    async def checkpoint(self) -> int:
+        """
+        Save trends observed since the last checkpoint to Redis in one round trip.
+
+        Trends pruned as idle since the last checkpoint are deleted from the
+        hash. Redis errors are logged and the same changes are retried at the
+        next checkpoint.
+
+        Returns:
+            Trends written
+        """
+        self.prune()
+        if self.client is None:
+            self._dirty.clear()
+            self._expired.clear()
+            return 0
+        expired = list(self._expired)
+        dirty = list(self._dirty)
+        commands: List[tuple] = []
+        if dirty:
+            mapping = {self._field(k): self._state(self._slots[k]) for k in dirty}
+            commands.append(("hset", (self.namespace,), {"mapping": mapping}))
+        if expired:
+            commands.append(("hdel", self.namespace, *map(self._field, expired)))
+        if not commands:
+            return 0
+        try:
+            await self.client.execute_pipeline(commands)
+        except Exception as e:
+            logger.warning(f"Velocity checkpoint failed, keeping {len(dirty)} trends for the next one: {e}")
+            return 0
+        self._dirty.difference_update(dirty)
+        self._expired.difference_update(expired)
+        return len(dirty)
+
+    async def restore(self) -> int:
+        """
+        Load the last checkpoint, skipping trends idle past ``idle_ttl``.
+
+        Returns:
+            Trends restored (0 when Redis is unavailable)
+        """
+        if self.client is None:
+            return 0
+        try:
+            saved = await self.client.hgetall(self.namespace)
+        except Exception as e:
+            logger.warning(f"Velocity restore failed, starting cold: {e}")
+            return 0
+        restored = 0
+        for field, raw in saved.items():
+            platform, _, platform_trend_id = field.partition(":")
+            self._load((platform, platform_trend_id), raw)
+            restored += 1
+        expired = self.prune()
+        logger.info(f"Restored velocity state for {restored - len(expired)} trends")
+        return restored - len(expired)
+
+
+# Global velocity engine, restored and checkpointed by the API lifespan and ingestion
+velocity_engine = VelocityEngine()
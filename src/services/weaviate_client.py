@@ -1,23 +1,26 @@
 """Weaviate connection and client configuration"""
 
 import weaviate
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import logging
 
+from src.config.settings import settings
+
 logger = logging.getLogger("chimera.weaviate")
 
 
 class WeaviateClient:
     """Weaviate client wrapper"""
     
-    def __init__(self, weaviate_url: str):
+    def __init__(self, weaviate_url: str, timeout: float = settings.weaviate_timeout):
         self.weaviate_url = weaviate_url
+        self.timeout = timeout
         self.client: Optional[weaviate.Client] = None
     
     def connect(self) -> None:
         """Connect to Weaviate"""
         try:
-            self.client = weaviate.Client(url=self.weaviate_url)
+            self.client = weaviate.Client(url=self.weaviate_url, timeout_config=(self.timeout, self.timeout))
             # Test connection
             self.client.is_ready()
             logger.info("Weaviate connection established")
@@ -37,9 +40,72 @@ class WeaviateClient:
             self.connect()
         return self.client
     
+    def ensure_class(self, class_name: str, properties: Dict[str, str]) -> None:
+        """Create a class for self-supplied vectors (vectorizer "none") if it doesn't exist"""
+        client = self.get_client()
+        if client.schema.exists(class_name):
+            return
+        client.schema.create_class({
+            "class": class_name,
+            "vectorizer": "none",
+            "vectorIndexConfig": {"distance": "cosine"},
+            "properties": [{"name": name, "dataType": [data_type]} for name, data_type in properties.items()]
+        })
+        logger.info(f"Created Weaviate class {class_name}")
+    
+    def batch_import(
+        self,
+        class_name: str,
+        objects: Sequence[Tuple[str, Dict[str, Any], Sequence[float]]],
+        batch_size: int = settings.weaviate_batch_size
+    ) -> int:
+        """
+        Import (uuid, properties, vector) objects with the batch API.
+        
+        Objects are upserted by uuid, so re-importing is idempotent.
+        
+        Returns:
+            Number of objects sent
+        """
+        client = self.get_client()
+        client.batch.configure(batch_size=batch_size, dynamic=False, timeout_retries=1)
+        with client.batch as batch:
+            for uuid, properties, vector in objects:
+                batch.add_data_object(properties, class_name, uuid=uuid, vector=list(vector))
+        return len(objects)
+    
+    def fetch_objects(
+        self,
+        class_name: str,
+        properties: List[str],
+        where: Optional[Dict[str, Any]] = None,
+        limit: int = 10_000
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch objects with their vectors, optionally filtered by ``where``.
+        
+        Returns:
+            Each object's properties plus ``vector``
+        """
+        client = self.get_client()
+        query = client.query.get(class_name, properties).with_additional(["vector"]).with_limit(limit)
+        if where is not None:
+            query = query.with_where(where)
+        response = query.do()
+        if response.get("errors"):
+            raise RuntimeError(f"Weaviate query failed: {response['errors']}")
+        return [
+            {**hit, "vector": hit["_additional"]["vector"]}
+            for hit in response["data"]["Get"].get(class_name) or []
+        ]
+    
     def __enter__(self):
         self.connect()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.disconnect()
+
+
+# Global Weaviate client instance, connects on first use
+weaviate_client = WeaviateClient(settings.weaviate_url)
@@ -72,13 +72,23 @@ class MCPSenseLogger:
     def log_trend_storage(
         self,
         trends_stored: int,
-        trace_id: Optional[str] = None
+        trace_id: Optional[str] = None,
+        rows_updated: int = 0,
+        rows_deduplicated: int = 0,
+        velocities_computed: int = 0,
+        rows_rejected: int = 0
     ) -> None:
         """Log trend storage activity"""
         self.log_activity(
             "trend_storage",
             "trend_storage_service",
-            {"trends_stored": trends_stored},
+            {
+                "trends_stored": trends_stored,
+                "rows_updated": rows_updated,
+                "rows_deduplicated": rows_deduplicated,
+                "velocities_computed": velocities_computed,
+                "rows_rejected": rows_rejected
+            },
             trace_id
         )
 
@@ -86,3 +96,15 @@ class MCPSenseLogger:
 # Global MCP Sense logger instance
 # Will be initialized with settings when config is loaded
 mcp_sense_logger: Optional[MCPSenseLogger] = None
+
+
+def get_mcp_sense_logger() -> MCPSenseLogger:
+    """Get the global MCP Sense logger, initializing it from settings on first use"""
+    global mcp_sense_logger
+    if mcp_sense_logger is None:
+        from src.config.settings import settings
+        mcp_sense_logger = MCPSenseLogger(
+            enabled=settings.mcp_sense_enabled,
+            session_id=settings.mcp_sense_session_id
+        )
+    return mcp_sense_logger
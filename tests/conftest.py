@@ -35,6 +35,65 @@ def db_session(db_engine) -> Generator[Session, None, None]:
         session.close()
 
 
+@pytest.fixture(scope="function")
+def override_db_session(tmp_path):
+    """Point the API's session dependency at a file-backed SQLite database"""
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    from sqlalchemy.pool import NullPool
+    from src.api import app
+    from src.services.database import get_db_session, get_db_session_factory
+    
+    db_path = tmp_path / "chimera_test.db"
+    sync_engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(sync_engine)
+    
+    # NullPool opens connections on whichever event loop is running, and
+    # TestClient may run each request on its own loop
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+    session_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+    
+    async def _get_test_session():
+        async with session_factory() as session:
+            yield session
+    
+    app.dependency_overrides[get_db_session] = _get_test_session
+    app.dependency_overrides[get_db_session_factory] = lambda: session_factory
+    yield sync_engine
+    app.dependency_overrides.pop(get_db_session, None)
+    app.dependency_overrides.pop(get_db_session_factory, None)
+    sync_engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def disable_response_cache(monkeypatch):
+    """Keep API tests independent of any local Redis"""
+    from src.services.response_cache import trend_response_cache
+    monkeypatch.setattr(trend_response_cache, "enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def social_media_sample_mode(monkeypatch):
+    """Serve sample trends from the social media MCP server"""
+    monkeypatch.setenv("SOCIAL_MEDIA_SAMPLE_MODE", "true")
+
+
+@pytest.fixture(autouse=True)
+def disable_rate_limiter(monkeypatch):
+    """Keep API tests from sharing rate limit buckets"""
+    from src.services.rate_limiter import api_rate_limiter
+    monkeypatch.setattr(api_rate_limiter, "enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def isolate_platform_scheduler(monkeypatch):
+    """Give each test fresh platform budgets, kept out of PostgreSQL"""
+    from collections import defaultdict
+    from src.services.platform_scheduler import platform_scheduler
+    monkeypatch.setattr(platform_scheduler, "db", None)
+    monkeypatch.setattr(platform_scheduler, "states", {})
+    monkeypatch.setattr(platform_scheduler, "stats", defaultdict(lambda: defaultdict(int)))
+
+
 @pytest.fixture
 def sample_trend_data():
     """Sample trend data for testing"""
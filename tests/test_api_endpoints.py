@@ -6,6 +6,8 @@ from src.api import app
 
 client = TestClient(app)
 
+pytestmark = pytest.mark.usefixtures("override_db_session")
+
 
 class TestHealthEndpoints:
     """Test health check endpoints"""
@@ -25,6 +27,7 @@ class TestHealthEndpoints:
         data = response.json()
         assert "status" in data
         assert "services" in data
+        assert "mcp_servers" in data["services"]
     
     def test_readiness_check(self):
         """Test readiness check endpoint"""
@@ -38,6 +41,26 @@ class TestHealthEndpoints:
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "alive"
+    
+    def test_database_probe_is_cached(self, monkeypatch):
+        """Test that repeated probes reuse the cached database status"""
+        from src.api.v1.routes import health
+        
+        calls = []
+        
+        async def fake_probe(db):
+            calls.append(db)
+            return {"status": "healthy", "message": "Database connection OK"}
+        
+        monkeypatch.setattr(health, "_probe_database", fake_probe)
+        monkeypatch.setattr(health, "_db_status_cache", None)
+        monkeypatch.setattr(health.settings, "health_check_cache_ttl", 60.0)
+        
+        for _ in range(3):
+            response = client.get("/api/v1/health/ready")
+            assert response.status_code == 200
+        
+        assert len(calls) == 1
 
 
 class TestTrendsEndpoints:
@@ -84,6 +107,25 @@ class TestTrendsEndpoints:
         response = client.get("/api/v1/trends/platforms/invalid/trends")
         assert response.status_code == 400
     
+    def test_trend_payload_matches_response_model(self, sample_trend_data):
+        """Test that the fast serialization path renders the same JSON as TrendResponse"""
+        import json
+        import uuid
+        from datetime import datetime, timezone
+        from src.api.responses import FastJSONResponse
+        from src.api.v1.routes.trends import TrendResponse, _trend_payload
+        from src.models.trend import Trend, Platform
+        
+        trend = Trend(**{
+            **sample_trend_data,
+            "trend_id": uuid.uuid4(),
+            "platform": Platform.TWITTER,
+            "timestamp": datetime(2026, 2, 5, 12, 0, 0, 123456, tzinfo=timezone.utc),
+        })
+        
+        fast = json.loads(FastJSONResponse(_trend_payload(trend)).body)
+        assert fast == TrendResponse.model_validate(trend).model_dump(mode="json")
+    
     def test_get_platform_status(self):
         """Test getting platform connection status"""
         response = client.get("/api/v1/trends/platforms/status")
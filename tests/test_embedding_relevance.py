@@ -0,0 +1,184 @@
+"""Embedding relevance and HNSW index tests"""
+
+import threading
+
+import numpy as np
+
+from src.services.embedding_relevance import (
+    EXEMPLAR_CLASS,
+    TREND_CLASS,
+    EmbeddingRelevanceScorer,
+    HashingEmbedder,
+    _store_executor,
+)
+from src.config.settings import settings
+from src.services.hnsw import HNSWIndex
+from src.services.relevance import split_words
+from src.services.weaviate_client import WeaviateClient
+
+TECH = [
+    "AI Agents", "Open Source LLMs", "Quantum Computing", "Tech Layoffs", "#AIArt", "#TechStartups",
+    "Gadget Unboxing", "Cybersecurity breach", "Robotics Startups", "Cloud outage", "Nvidia chips",
+]
+OTHER = [
+    "Taylor Swift tour", "Champions League final", "Sourdough recipe", "Study With Me", "Met Gala looks",
+    "Election debate", "Puppy videos", "Summer fashion", "Marathon training", "Gardening tips",
+]
+
+
+class InMemoryStore:
+    """WeaviateClient stand-in keeping objects in dicts"""
+
+    def __init__(self):
+        self.classes = {}
+        self.objects = {}
+
+    def ensure_class(self, class_name, properties):
+        self.classes[class_name] = properties
+        self.objects.setdefault(class_name, {})
+
+    def batch_import(self, class_name, objects):
+        for uuid, properties, vector in objects:
+            self.objects[class_name][uuid] = (properties, np.asarray(vector))
+        return len(objects)
+
+    def fetch_objects(self, class_name, properties, where=None):
+        return [
+            {**props, "vector": vector.tolist()} for props, vector in self.objects[class_name].values()
+            if where is None or props[where["path"][0]] == where["valueText"]
+        ]
+
+
+class BlockedStore(InMemoryStore):
+    """InMemoryStore whose trend imports hang until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def batch_import(self, class_name, objects):
+        if class_name == TREND_CLASS:
+            self.release.wait(timeout=10)
+        return super().batch_import(class_name, objects)
+
+
+def wait_for_sync(scorer):
+    scorer._sync.result(timeout=10)
+
+
+def drain_store_queue():
+    _store_executor.submit(lambda: None).result(timeout=10)
+
+
+def test_hnsw_recall_against_brute_force():
+    """Test that the HNSW index finds nearly all true nearest neighbors"""
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(20, 32))
+    data = centers[rng.integers(0, 20, 2000)] + 0.3 * rng.normal(size=(2000, 32))
+    queries = centers[rng.integers(0, 20, 50)] + 0.3 * rng.normal(size=(50, 32))
+    index = HNSWIndex(32, seed=1)
+    assert index.add(range(2000), data) == 2000
+    assert index.add([0, 1], data[:2]) == 0
+
+    ids, sims = index.search(queries, k=5)
+
+    unit = data / np.linalg.norm(data, axis=1, keepdims=True)
+    exact = np.argsort(-(queries / np.linalg.norm(queries, axis=1, keepdims=True)) @ unit.T, axis=1)[:, :5]
+    recall = np.mean([len(set(found) & set(true.tolist())) / 5 for found, true in zip(ids, exact)])
+    assert recall >= 0.9
+    assert (np.diff(sims, axis=1) <= 1e-6).all()
+
+
+def test_hashing_embedder_is_stable_and_splits_hashtags():
+    """Test deterministic vectors and hashtag word splitting"""
+    embedder = HashingEmbedder(dim=64)
+    first, second = embedder.embed(["AI Art", "#AIArt"]), HashingEmbedder(dim=64).embed(["AI Art", "#AIArt"])
+
+    assert split_words("#AIArt TechStartups") == ["ai", "art", "tech", "startups"]
+    assert np.allclose(first, second)
+    assert np.allclose(first[0], first[1])
+    assert np.allclose(np.linalg.norm(first, axis=1), 1.0)
+
+
+def test_separates_niche_topics_locally():
+    """Test niche relevance accuracy with Weaviate out of the picture (SC-002)"""
+    scorer = EmbeddingRelevanceScorer("technology", store=None)
+    scores = scorer.score([{"topic_name": t} for t in TECH + OTHER])
+
+    predicted = scores >= 0.5
+    expected = np.array([True] * len(TECH) + [False] * len(OTHER))
+    assert (predicted == expected).mean() >= 0.8
+    assert ((scores >= 0) & (scores <= 1)).all()
+    assert scorer.get_stats()["local_queries"] == 1
+
+
+def test_syncs_exemplars_and_trends_with_weaviate():
+    """Test that exemplars and scored trends are batch-imported, and stored exemplars pulled in"""
+    store = InMemoryStore()
+    store.ensure_class(EXEMPLAR_CLASS, {})
+    vector = HashingEmbedder().embed(["Puppy videos"])[0]
+    store.objects[EXEMPLAR_CLASS]["added-elsewhere"] = ({"niche": "technology", "text": "Puppy videos"}, vector)
+    scorer = EmbeddingRelevanceScorer("technology", store=store)
+    wait_for_sync(scorer)
+    trends = [{"topic_name": t, "platform_trend_id": f"t{i}"} for i, t in enumerate(TECH + OTHER)]
+
+    scores = scorer.score(trends)
+    # Trend vectors are imported in the background; wait for the queue to drain
+    drain_store_queue()
+
+    assert len(store.objects[EXEMPLAR_CLASS]) == len(scorer.exemplars)
+    assert "Puppy videos" in scorer.exemplars
+    assert scores[TECH.index("Quantum Computing")] > 0.5
+    assert scores[len(TECH) + OTHER.index("Puppy videos")] == 1.0
+    stats = scorer.get_stats()
+    assert stats["exemplar_syncs"] == 1
+    assert stats["exemplars_pulled"] == 1
+    assert stats["local_queries"] == 1
+    assert len(store.objects[TREND_CLASS]) == len(trends)
+
+
+def test_same_trend_id_on_two_platforms_is_two_objects():
+    """Test that trend objects are keyed by platform as well as platform_trend_id"""
+    store = InMemoryStore()
+    scorer = EmbeddingRelevanceScorer("technology", store=store)
+    wait_for_sync(scorer)
+
+    scorer.score([
+        {"topic_name": "AI Agents", "platform": "twitter", "platform_trend_id": "123"},
+        {"topic_name": "Puppy videos", "platform": "tiktok", "platform_trend_id": "123"},
+    ])
+    drain_store_queue()
+
+    assert sorted(props["platform"] for props, _ in store.objects[TREND_CLASS].values()) == ["tiktok", "twitter"]
+
+def test_slow_imports_are_bounded():
+    """Test that scoring keeps answering while imports hang, skipping batches past the limit"""
+    store = BlockedStore()
+    scorer = EmbeddingRelevanceScorer("technology", store=store)
+    wait_for_sync(scorer)
+    limit = settings.weaviate_max_pending_imports
+    try:
+        for i in range(limit + 3):
+            scores = scorer.score([{"topic_name": "Quantum Computing", "platform_trend_id": f"t{i}"}])
+            assert scores[0] > 0.5
+    finally:
+        store.release.set()
+    drain_store_queue()
+
+    stats = scorer.get_stats()
+    assert stats["imports_skipped"] == 3
+    assert stats["trends_imported"] == limit
+
+
+def test_falls_back_when_weaviate_is_down():
+    """Test that an unreachable Weaviate leaves scoring on the local index"""
+    scorer = EmbeddingRelevanceScorer("technology", store=WeaviateClient("http://127.0.0.1:9", timeout=0.2))
+    wait_for_sync(scorer)
+
+    scores = scorer.score([{"topic_name": "Quantum Computing"}, {"topic_name": "Puppy videos"}])
+
+    assert scores[0] > 0.5 > scores[1]
+    stats = scorer.get_stats()
+    assert stats["store_ready"] is False
+    assert stats["store_errors"] == 1
+    assert stats["local_queries"] == 1
@@ -0,0 +1,135 @@
+"""Fake MCP server tests"""
+
+import pytest
+from mcp.types import ListToolsRequest
+
+from mcp_servers import openclaw, social_media
+from mcp_servers.fake import FakeBehavior, create_server
+from skills.trend_research import TrendResearchAgent
+from src.services.mcp_client import InProcessMCPClient
+from src.utils.error_handler import MCPServerError
+
+
+def make_client(**behavior):
+    server = create_server(FakeBehavior(latency_ms=1, seed=7, **behavior))
+    return server, InProcessMCPClient(server)
+
+
+class QuietSenseLogger:
+    def log_activity(self, *args, **kwargs):
+        pass
+
+    def log_trend_discovery(self, *args, **kwargs):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_serves_the_real_tool_schemas():
+    """Test that the fake lists exactly the social media and OpenClaw tools"""
+    server, _ = make_client()
+    real = [*await social_media.list_tools(), *await openclaw.list_tools()]
+    result = await server.request_handlers[ListToolsRequest](ListToolsRequest(method="tools/list"))
+    assert result.root.tools == real
+
+
+@pytest.mark.asyncio
+async def test_generates_requested_payload_size():
+    """Test that trend count and shape follow limit and behavior settings"""
+    _, client = make_client(max_trends=30, hashtags_per_trend=4, description_chars=100)
+    payload = await client.call_tool("fetch_tiktok_trends", {"limit": 50})
+    await client.disconnect()
+
+    assert len(payload["trends"]) == 30
+    trend = payload["trends"][0]
+    assert trend["platform"] == "tiktok"
+    assert len(trend["related_hashtags"]) == 4
+    assert len(trend["description"]) == 100
+
+
+@pytest.mark.asyncio
+async def test_rate_limits_and_failures():
+    """Test that exhausted windows answer rate_limited and failures surface as tool errors"""
+    _, client = make_client(rate_limit_per_window=2, rate_limit_window=60)
+    for _ in range(2):
+        payload = await client.call_tool("fetch_twitter_trends", {"limit": 1})
+        assert payload["status"] == "ok"
+    limited = await client.call_tool("fetch_twitter_trends", {"limit": 1})
+    assert limited["status"] == "rate_limited"
+    assert 0 < limited["retry_after"] <= 60
+    # Windows are per platform
+    assert (await client.call_tool("fetch_instagram_trends", {"limit": 1}))["status"] == "ok"
+    await client.disconnect()
+
+    _, failing = make_client(failure_rate=1.0)
+    with pytest.raises(MCPServerError, match="Simulated"):
+        await failing.call_tool("fetch_twitter_trends", {})
+    await failing.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_openclaw_tools_keep_state():
+    """Test that registered agents can be discovered by capability"""
+    server, client = make_client()
+    await client.call_tool("register_agent", {"agent_id": "a1", "capabilities": ["trend_research"]})
+    await client.call_tool("register_agent", {"agent_id": "a2", "capabilities": ["video"]})
+    found = await client.call_tool("discover_agents", {"capabilities": ["trend_research"]})
+    await client.disconnect()
+
+    assert [a["agent_id"] for a in found["agents"]] == ["a1"]
+    assert server.fake_state.calls["register_agent"] == 2
+
+
+@pytest.mark.asyncio
+async def test_agent_discovers_through_fake_batch_tool():
+    """Test the full agent discovery path against the fake server"""
+    _, client = make_client()
+    agent = TrendResearchAgent(agent_id="agent-1", mcp_client=client, sense_logger=QuietSenseLogger())
+    trends = await agent.discover_trends_async(platforms=["twitter", "tiktok", "instagram"], limit=5)
+    await client.disconnect()
+
+    assert len(trends) == 15
+    assert {t["platform"] for t in trends} == {"twitter", "tiktok", "instagram"}
+
+
+@pytest.mark.asyncio
+async def test_paginates_with_cursors():
+    """Test that following next_cursor pages through exactly limit trends"""
+    server, client = make_client(max_trends=500)
+    sizes = []
+    cursor = None
+    while True:
+        args = {"limit": 250, "page_size": 100, **({"cursor": cursor} if cursor else {})}
+        page = await client.call_tool("fetch_twitter_trends", args)
+        sizes.append(len(page["trends"]))
+        cursor = page.get("next_cursor")
+        if cursor is None:
+            break
+    with pytest.raises(MCPServerError, match="Invalid cursor"):
+        await client.call_tool("fetch_twitter_trends", {"cursor": "not-a-cursor"})
+    await client.disconnect()
+
+    assert sizes == [100, 100, 50]
+    assert social_media.decode_cursor(social_media.encode_cursor(200)) == 200
+
+
+@pytest.mark.asyncio
+async def test_agent_streams_scored_pages():
+    """Test that stream_trends yields scored trends a page at a time"""
+    server, client = make_client(max_trends=500)
+    agent = TrendResearchAgent(
+        agent_id="agent-1",
+        mcp_client=client,
+        sense_logger=QuietSenseLogger(),
+        niche="AI agents"
+    )
+    stream = agent.stream_trends(platforms=["twitter", "instagram"], limit=250, page_size=100)
+    first = await stream.__anext__()
+    # Later pages are only requested as earlier ones are consumed
+    assert server.fake_state.calls["fetch_twitter_trends"] + server.fake_state.calls["fetch_instagram_trends"] < 6
+    assert first["relevance_score"] is not None
+    trends = [first, *[t async for t in stream]]
+    await client.disconnect()
+
+    assert len(trends) == 500
+    assert server.fake_state.calls["fetch_twitter_trends"] == 3
+    assert len({t["platform_trend_id"] for t in trends}) == 500
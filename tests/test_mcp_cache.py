@@ -0,0 +1,157 @@
+"""MCP result cache tests"""
+
+import pytest
+
+from src.services.mcp_cache import LRUByteCache, MCPResultCache
+
+
+class FakeRedisClient:
+    """In-memory stand-in for the AsyncRedisClient helpers the cache uses"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def mget(self, keys):
+        return [self.data.get(k) for k in keys]
+
+    async def set(self, key, value, ttl=None):
+        self.data[key] = value
+
+    async def incr_many(self, keys, ttl=None):
+        results = []
+        for key in keys:
+            self.data[key] = str(int(self.data.get(key, 0)) + 1)
+            results.append(int(self.data[key]))
+        return results
+
+
+class UnavailableRedisClient:
+    async def mget(self, keys):
+        raise ConnectionError("Redis unavailable")
+
+    async def set(self, key, value, ttl=None):
+        raise ConnectionError("Redis unavailable")
+
+    async def incr_many(self, keys, ttl=None):
+        raise ConnectionError("Redis unavailable")
+
+
+def make_cache(client=None, **kwargs):
+    return MCPResultCache(
+        client=client or FakeRedisClient(),
+        ttls={"discover_agents": 60, "get_platform_status": 30},
+        invalidations={"register_agent": ["discover_agents"]},
+        enabled=True,
+        **kwargs
+    )
+
+
+def make_call(calls, result=None):
+    async def call():
+        calls.append(1)
+        return result if result is not None else {"agents": [], "n": len(calls)}
+    return call
+
+
+class TestLRUByteCache:
+    """Test the in-process level"""
+
+    def test_evicts_least_recently_used_past_budget(self):
+        """Test that inserts past the byte budget evict the oldest unused entries"""
+        lru = LRUByteCache(max_bytes=25)
+        lru.set("a", b"x" * 9, 60)
+        lru.set("b", b"x" * 9, 60)
+        assert lru.get("a") is not None
+        lru.set("c", b"x" * 9, 60)
+
+        assert lru.get("b") is None
+        assert lru.get("a") is not None and lru.get("c") is not None
+        assert lru.evictions == 1
+        assert lru.bytes == 20
+
+    def test_expired_entries_are_dropped(self):
+        """Test that entries past their TTL are misses"""
+        lru = LRUByteCache(max_bytes=100)
+        lru.set("a", b"1", 0)
+        assert lru.get("a") is None
+        assert lru.bytes == 0
+
+    def test_oversized_values_are_not_stored(self):
+        """Test that a value larger than the budget is skipped"""
+        lru = LRUByteCache(max_bytes=10)
+        lru.set("a", b"x" * 20, 60)
+        assert len(lru) == 0
+
+
+class TestMCPResultCache:
+    """Test the two-level tool result cache"""
+
+    @pytest.mark.asyncio
+    async def test_local_then_redis_hits(self):
+        """Test that results are served locally, and from Redis to another process"""
+        redis = FakeRedisClient()
+        cache, other = make_cache(redis), make_cache(redis)
+        calls = []
+        args = {"capabilities": ["trend_research"]}
+
+        first = await cache.get_or_call("openclaw", "discover_agents", args, make_call(calls))
+        assert await cache.get_or_call("openclaw", "discover_agents", args, make_call(calls)) == first
+        assert await other.get_or_call("openclaw", "discover_agents", args, make_call(calls)) == first
+        assert await other.get_or_call("openclaw", "discover_agents", args, make_call(calls)) == first
+
+        assert len(calls) == 1
+        assert cache.get_stats()["tools"]["discover_agents"]["local_hits"] == 1
+        other_stats = other.get_stats()["tools"]["discover_agents"]
+        assert other_stats["redis_hits"] == 1
+        assert other_stats["local_hits"] == 1
+        assert other_stats["hit_ratio"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_uncached_tools_always_call(self):
+        """Test that tools without a TTL bypass the cache"""
+        cache = make_cache()
+        calls = []
+        for _ in range(3):
+            await cache.get_or_call("social", "fetch_twitter_trends", {"limit": 10}, make_call(calls))
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_write_tool_invalidates_related_results(self):
+        """Test that a write tool drops the cached results it makes stale, in every process"""
+        redis = FakeRedisClient()
+        cache, other = make_cache(redis), make_cache(redis)
+        calls = []
+        args = {"capabilities": ["trend_research"]}
+
+        await cache.get_or_call("openclaw", "discover_agents", args, make_call(calls))
+        await cache.get_or_call("openclaw", "register_agent", {"agent_id": "a"}, make_call([], {"ok": 1}))
+
+        # Local entry deleted, Redis entry outdated by the generation bump
+        result = await other.get_or_call("openclaw", "discover_agents", args, make_call(calls))
+        assert result["n"] == 2
+        assert cache.get_stats()["tools"]["discover_agents"]["invalidated_entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_when_redis_is_down(self):
+        """Test that a Redis outage leaves the in-process level working"""
+        cache = make_cache(UnavailableRedisClient())
+        calls = []
+
+        for _ in range(3):
+            await cache.get_or_call("social", "get_platform_status", {"platform": "twitter"}, make_call(calls))
+
+        assert len(calls) == 1
+        stats = cache.get_stats()["tools"]["get_platform_status"]
+        assert stats["local_hits"] == 2
+        # One failure opens the retry window; Redis is not retried on every call
+        assert stats["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_evictions_are_reported(self):
+        """Test that byte budget evictions show up in the stats"""
+        cache = make_cache(max_bytes=200)
+        for i in range(10):
+            await cache.get_or_call("social", "get_platform_status", {"platform": str(i)}, make_call([]))
+        stats = cache.get_stats()
+        assert stats["evictions"] > 0
+        assert stats["bytes"] <= 200
@@ -0,0 +1,322 @@
+"""Pooled MCP client tests"""
+
+import asyncio
+import json
+
+import pytest
+from mcp.server import Server
+from mcp.types import TextContent, Tool
+
+from src.services.mcp_cache import MCPResultCache
+from src.config.settings import settings
+from src.services.mcp_client import InProcessMCPClient, MCPClient, MCPClientManager, PooledMCPClient
+from src.utils.error_handler import MCPServerError
+
+
+def make_server():
+    """A server whose ``sleep`` tool tracks how many calls overlap"""
+    server = Server("test-mcp")
+    server.active = 0
+    server.peak = 0
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return [
+            Tool(name="sleep", description="Sleep then echo", inputSchema={"type": "object"}),
+            Tool(name="fail", description="Always fails", inputSchema={"type": "object"}),
+        ]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+        if name == "fail":
+            raise ValueError("boom")
+        server.active += 1
+        server.peak = max(server.peak, server.active)
+        await asyncio.sleep(arguments.get("seconds", 0.05))
+        server.active -= 1
+        return [TextContent(type="text", text=json.dumps({"echo": arguments.get("n")}))]
+
+    return server
+
+
+class TestPooledMCPClient:
+    """Test session pooling and concurrency limits"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_pooled_sessions(self):
+        """Test that many in-flight calls run over at most pool_size sessions"""
+        client = InProcessMCPClient(make_server(), pool_size=3, max_concurrency=500)
+        opened = []
+        original = client._open_session
+
+        async def counting_open():
+            opened.append(1)
+            return await original()
+
+        client._open_session = counting_open
+        results = await asyncio.gather(*(client.call_tool("sleep", {"n": i}) for i in range(200)))
+
+        assert [r["echo"] for r in results] == list(range(200))
+        assert 1 <= len(opened) <= 3
+        assert client.server.peak > 3  # Calls overlap within a session
+        await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        """Test that max_concurrency bounds calls in flight"""
+        client = InProcessMCPClient(make_server(), pool_size=2, max_concurrency=5)
+        await asyncio.gather(*(client.call_tool("sleep", {"seconds": 0.02}) for _ in range(30)))
+        assert client.server.peak == 5
+        await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_tool_error_raises_mcp_server_error(self):
+        """Test that tool failures surface as MCPServerError"""
+        client = InProcessMCPClient(make_server())
+        with pytest.raises(MCPServerError):
+            await client.call_tool("fail", {})
+        # The session stays usable after a tool error
+        assert (await client.call_tool("sleep", {"n": 1, "seconds": 0})) == {"echo": 1}
+        assert client.get_stats()["sessions"] == 1
+        await client.disconnect()
+
+    def test_reusable_across_event_loops(self):
+        """Test that sessions are reopened when each call runs in its own loop"""
+        client = InProcessMCPClient(make_server())
+        for n in range(2):
+            assert asyncio.run(client.call_tool("sleep", {"n": n, "seconds": 0})) == {"echo": n}
+
+
+class StubClient(MCPClient):
+    """Client whose connect takes ``delay`` seconds and optionally fails"""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.connects = 0
+
+    async def connect(self):
+        self.connects += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("refused")
+
+    async def disconnect(self):
+        pass
+
+    async def call_tool(self, tool_name, arguments):
+        return {"tool": tool_name}
+
+    async def get_resource(self, resource_name):
+        return {}
+
+
+class TestMCPClientManager:
+    """Test the server registry"""
+
+    @pytest.mark.asyncio
+    async def test_connect_and_call(self):
+        """Test calling a tool through a registered server"""
+        manager = MCPClientManager()
+        manager.register_server("test", "memory://test", InProcessMCPClient(make_server()))
+
+        await manager.connect_all()
+        assert await manager.call_tool("test", "sleep", {"n": 7, "seconds": 0}) == {"echo": 7}
+        await manager.disconnect_all()
+
+        with pytest.raises(ValueError):
+            manager.get_client("missing")
+
+    @pytest.mark.asyncio
+    async def test_registers_default_servers_from_settings(self, monkeypatch):
+        """Test that the bundled servers are registered in-process or at their configured URL"""
+        monkeypatch.setattr(settings, "mcp_social_media_url", "")
+        monkeypatch.setattr(settings, "mcp_openclaw_url", "http://openclaw.internal:9000/mcp")
+        manager = MCPClientManager()
+
+        manager.register_default_servers()
+        social_media = manager.get_client("social_media")
+        manager.register_default_servers()
+
+        assert isinstance(social_media, InProcessMCPClient)
+        assert manager.get_client("social_media") is social_media
+        openclaw = manager.get_client("openclaw")
+        assert isinstance(openclaw, PooledMCPClient) and not isinstance(openclaw, InProcessMCPClient)
+        assert manager.get_status()["openclaw"]["url"] == "http://openclaw.internal:9000/mcp"
+
+        page = await manager.tool_client("social_media").call_tool("fetch_twitter_trends", {"limit": 2})
+        await manager.disconnect_all()
+        assert len(page["trends"]) == 2
+        assert manager.get_status()["social_media"]["status"] == "disconnected"
+
+    @pytest.mark.asyncio
+    async def test_connect_all_is_parallel_and_records_times(self):
+        """Test that servers connect concurrently and each connect time is recorded"""
+        manager = MCPClientManager()
+        for i in range(5):
+            manager.register_server(f"s{i}", f"memory://s{i}", StubClient(delay=0.2))
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        status = await manager.connect_all(lazy=False)
+
+        assert loop.time() - started < 0.6
+        assert all(s["status"] == "connected" for s in status.values())
+        assert all(s["connect_ms"] >= 150 for s in status.values())
+
+    @pytest.mark.asyncio
+    async def test_failing_servers_are_degraded(self):
+        """Test that failed or slow servers are degraded without aborting the others"""
+        manager = MCPClientManager(connect_timeout=0.1, reconnect_interval=60)
+        manager.register_server("ok", "memory://ok", StubClient())
+        manager.register_server("down", "memory://down", StubClient(fail=True))
+        manager.register_server("slow", "memory://slow", StubClient(delay=5))
+
+        status = await manager.connect_all(lazy=False)
+
+        assert status["ok"]["status"] == "connected"
+        assert status["down"] == {
+            "status": "degraded", "url": "memory://down",
+            "connect_ms": status["down"]["connect_ms"], "error": "refused",
+            "circuit": status["down"]["circuit"]
+        }
+        assert status["slow"]["status"] == "degraded"
+        assert "timed out" in status["slow"]["error"]
+
+        assert await manager.call_tool("ok", "t", {}) == {"tool": "t"}
+        with pytest.raises(MCPServerError):
+            await manager.call_tool("down", "t", {})
+        # Fails fast until the reconnect interval has passed
+        assert manager.get_client("down").connects == 1
+
+    @pytest.mark.asyncio
+    async def test_degraded_server_reconnects_after_interval(self):
+        """Test that a degraded server is retried once the interval has passed"""
+        manager = MCPClientManager(reconnect_interval=0)
+        client = StubClient(fail=True)
+        manager.register_server("flaky", "memory://flaky", client)
+
+        await manager.connect_all(lazy=False)
+        assert manager.get_status()["flaky"]["status"] == "degraded"
+
+        client.fail = False
+        assert await manager.call_tool("flaky", "t", {}) == {"tool": "t"}
+        assert manager.get_status()["flaky"]["status"] == "connected"
+
+    @pytest.mark.asyncio
+    async def test_lazy_connect_on_first_call(self):
+        """Test that lazy mode defers each connect to the server's first call"""
+        manager = MCPClientManager(lazy=True)
+        used, unused = StubClient(), StubClient()
+        manager.register_server("used", "memory://used", used)
+        manager.register_server("unused", "memory://unused", unused)
+
+        status = await manager.connect_all()
+        assert {s["status"] for s in status.values()} == {"pending"}
+
+        await asyncio.gather(*(manager.call_tool("used", "t", {}) for _ in range(5)))
+        assert used.connects == 1
+        assert unused.connects == 0
+        assert manager.get_status()["used"]["status"] == "connected"
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_are_coalesced(self):
+        """Test that concurrent identical tool calls share one upstream request"""
+        manager = MCPClientManager(coalesce_tools=["sleep"])
+        client = InProcessMCPClient(make_server())
+        manager.register_server("test", "memory://test", client)
+        await manager.connect_all(lazy=False)
+
+        results = await asyncio.gather(
+            *(manager.call_tool("test", "sleep", {"n": 1, "seconds": 0.05}) for _ in range(20)),
+            manager.call_tool("test", "sleep", {"n": 2, "seconds": 0.05})
+        )
+        await manager.disconnect_all()
+
+        assert results[:20] == [{"echo": 1}] * 20
+        assert results[20] == {"echo": 2}
+        stats = manager.get_stats()["coalescing"]["tools"]["test.sleep"]
+        assert stats["upstream"] == 2
+        assert stats["coalesced"] == 19
+
+    @pytest.mark.asyncio
+    async def test_identical_writes_are_not_coalesced(self):
+        """Test that concurrent identical write calls each reach the server"""
+        sent = []
+
+        class RecordingClient(StubClient):
+            async def call_tool(self, tool_name, arguments):
+                sent.append(tool_name)
+                await asyncio.sleep(0.05)
+                return {"status": "sent"}
+
+        manager = MCPClientManager(result_cache=MCPResultCache(enabled=False))
+        manager.register_server("openclaw", "memory://openclaw", RecordingClient())
+        message = {"to_agent_id": "agent-2", "message": "hello"}
+
+        await asyncio.gather(*(manager.call_tool("openclaw", "send_agent_message", message) for _ in range(3)))
+        await asyncio.gather(*(manager.call_tool("openclaw", "discover_agents", {}) for _ in range(3)))
+
+        assert sent.count("send_agent_message") == 3
+        assert sent.count("discover_agents") == 1
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_recovers(self):
+        """Test that repeated failures fail fast until a probe call succeeds"""
+        manager = MCPClientManager(breaker_threshold=2, breaker_recovery=0.1, coalesce=False)
+        manager.register_server("test", "memory://test", InProcessMCPClient(make_server()))
+        await manager.connect_all(lazy=False)
+
+        # Tool errors come from a healthy server and don't trip the breaker
+        for _ in range(3):
+            with pytest.raises(MCPServerError):
+                await manager.call_tool("test", "fail", {})
+        assert manager.get_status()["test"]["circuit"]["state"] == "closed"
+
+        manager.call_timeout = 0.05
+        for _ in range(2):
+            with pytest.raises(MCPServerError, match="timed out"):
+                await manager.call_tool("test", "sleep", {"n": 1, "seconds": 1})
+        with pytest.raises(MCPServerError, match="Circuit open") as rejected:
+            await manager.call_tool("test", "sleep", {"n": 1, "seconds": 0})
+        assert rejected.value.details["circuit"] == "open"
+
+        await asyncio.sleep(0.1)
+        manager.call_timeout = 5
+        assert manager.get_status()["test"]["circuit"]["state"] == "half_open"
+        assert await manager.call_tool("test", "sleep", {"n": 2, "seconds": 0}) == {"echo": 2}
+        assert manager.get_status()["test"]["circuit"]["state"] == "closed"
+        await manager.disconnect_all()
+
+    @pytest.mark.asyncio
+    async def test_slow_hedged_call_is_duplicated(self):
+        """Test that a hedged read gets a duplicate after its p95 latency and the faster answer wins"""
+        calls = []
+
+        class SlowFirstClient(StubClient):
+            async def call_tool(self, tool_name, arguments):
+                calls.append(tool_name)
+                # The first attempt of the last call stalls, its duplicate is fast
+                await asyncio.sleep(5 if len(calls) == 4 else 0.01)
+                return {"n": len(calls)}
+
+        manager = MCPClientManager(
+            hedged_tools=["discover_agents"],
+            hedge_min_samples=3,
+            coalesce=False,
+            result_cache=MCPResultCache(enabled=False)
+        )
+        manager.register_server("openclaw", "memory://openclaw", SlowFirstClient())
+        await manager.connect_all(lazy=False)
+        for _ in range(3):
+            await manager.call_tool("openclaw", "discover_agents", {})
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        assert await manager.call_tool("openclaw", "discover_agents", {}) == {"n": 5}
+        assert loop.time() - started < 1
+
+        stats = manager.get_stats()["hedging"]["openclaw.discover_agents"]
+        assert stats["hedged"] == 1
+        assert stats["hedge_wins"] == 1
+
@@ -0,0 +1,86 @@
+"""Typed MCP payload and encoding tests"""
+
+import pytest
+
+from mcp_servers import openclaw, social_media
+from mcp_servers.fake import FakeBehavior, create_server
+from mcp_servers.payloads import (
+    MSGPACK_MIME,
+    TrendPayload,
+    TrendsPage,
+    decode_contents,
+    encode_payload,
+)
+from src.services.mcp_client import InProcessMCPClient
+from src.utils.error_handler import MCPServerError
+
+
+def make_page():
+    trend = TrendPayload(
+        topic_name="AI Agents",
+        platform="twitter",
+        engagement_metrics={"likes": 10, "views": 1000},
+        trend_velocity=12.5,
+        related_hashtags=["#AIAgents"],
+        timestamp="2026-01-01T00:00:00+00:00",
+        platform_trend_id="twitter_1"
+    )
+    return TrendsPage(status="ok", platform="twitter", trends=[trend])
+
+
+@pytest.mark.parametrize("encoding", ["json", "msgpack"])
+def test_round_trips_typed_payloads(encoding):
+    """Test that both encodings decode to the same dict, without unset fields"""
+    page = make_page()
+    decoded = decode_contents(encode_payload(page, encoding))
+
+    assert decoded == page.model_dump(mode="json", exclude_none=True)
+    assert "next_cursor" not in decoded
+    assert decoded["trends"][0]["engagement_metrics"] == {"likes": 10, "shares": 0, "comments": 0, "views": 1000}
+    assert TrendsPage.model_validate(decoded) == page
+
+
+def test_msgpack_is_a_blob_resource():
+    """Test that msgpack payloads travel as embedded blobs and unknown encodings are refused"""
+    content = encode_payload({"status": "ok"}, "msgpack")[0]
+    assert content.type == "resource"
+    assert content.resource.mimeType == MSGPACK_MIME
+    with pytest.raises(ValueError, match="Unsupported encoding"):
+        encode_payload({"status": "ok"}, "xml")
+
+
+@pytest.mark.asyncio
+async def test_tools_advertise_encoding():
+    """Test that every tool accepts the encoding argument"""
+    for tool in [*await social_media.list_tools(), *await openclaw.list_tools()]:
+        assert tool.inputSchema["properties"]["encoding"]["enum"] == ["json", "msgpack"]
+
+
+@pytest.mark.asyncio
+async def test_client_negotiates_msgpack():
+    """Test that a msgpack client gets the same results as a JSON client, and bad encodings are refused"""
+    json_client = InProcessMCPClient(social_media.server, encoding="json")
+    msgpack_client = InProcessMCPClient(social_media.server, encoding="msgpack")
+    args = {"limit": 3}
+    as_json = await json_client.call_tool("fetch_twitter_trends", args)
+    as_msgpack = await msgpack_client.call_tool("fetch_twitter_trends", args)
+    batch = await msgpack_client.call_tool("fetch_trends_batch", {"requests": [{"platform": "tiktok", "limit": 2}]})
+    await json_client.disconnect()
+    await msgpack_client.disconnect()
+    openclaw_client = InProcessMCPClient(openclaw.server, encoding="msgpack")
+    agent = await openclaw_client.call_tool("register_agent", {"agent_id": "a1", "capabilities": []})
+    await openclaw_client.disconnect()
+
+    for trends in (as_json["trends"], as_msgpack["trends"]):
+        for trend in trends:
+            trend.pop("timestamp")
+    assert as_msgpack == as_json
+    assert len(as_msgpack["trends"]) == 3
+    assert batch["results"][0]["platform"] == "tiktok"
+    assert len(batch["results"][0]["trends"]) == 2
+    assert agent == {"status": "not_implemented", "agent_id": "a1", "message": "OpenClaw registration pending"}
+
+    failing = InProcessMCPClient(create_server(FakeBehavior(latency_ms=1, seed=1)), encoding="xml")
+    with pytest.raises(MCPServerError, match="xml"):
+        await failing.call_tool("fetch_twitter_trends", {"limit": 1})
+    await failing.disconnect()
@@ -0,0 +1,191 @@
+"""Rate-limit-aware platform scheduler tests"""
+
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.platform_scheduler import PlatformScheduler
+from src.services.trend_discovery import TrendDiscoveryService
+from src.utils.error_handler import RateLimitError
+
+
+class StatusDatabase:
+    """platform_connections stand-in holding rate_limit_status per platform name"""
+
+    def __init__(self, statuses=None, fail=False):
+        self.statuses = dict(statuses or {})
+        self.fail = fail
+
+    def get_engine(self):
+        return self
+
+    @asynccontextmanager
+    async def connect(self):
+        yield self
+
+    begin = connect
+
+    async def execute(self, statement, params=None):
+        if self.fail:
+            raise ConnectionError("connection refused")
+        if "SELECT" in str(statement):
+            return SimpleNamespace(all=lambda: [
+                SimpleNamespace(platform_name=name, rate_limit_status=json.dumps(status))
+                for name, status in self.statuses.items()
+            ])
+        for row in params:
+            self.statuses[row["platform"]] = json.loads(row["status"])
+
+
+def make_scheduler(**kwargs):
+    options = {"limits": {"twitter": 2}, "window_seconds": 0.2, "jitter": 0.0}
+    options.update(kwargs)
+    return PlatformScheduler(**options)
+
+
+class TestPlatformScheduler:
+    """Test budgets, priorities and rate limit recovery"""
+
+    @pytest.mark.asyncio
+    async def test_calls_past_budget_wait_for_reset(self):
+        """Test that calls beyond the window budget start once the window resets"""
+        scheduler = make_scheduler()
+        started = []
+
+        async def call():
+            started.append(time.monotonic())
+            return "ok"
+
+        begin = time.monotonic()
+        results = await asyncio.gather(*(scheduler.submit("twitter", call) for _ in range(4)))
+
+        assert results == ["ok"] * 4
+        offsets = sorted(t - begin for t in started)
+        assert offsets[1] < 0.1
+        assert offsets[2] >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_most_valuable_calls_run_first(self):
+        """Test that queued calls start in priority order when budget returns"""
+        scheduler = make_scheduler(limits={"twitter": 1})
+        order = []
+
+        def call(name):
+            async def run():
+                order.append(name)
+            return run
+
+        first = asyncio.create_task(scheduler.submit("twitter", call("first")))
+        await asyncio.sleep(0.01)
+        await asyncio.gather(
+            first,
+            scheduler.submit("twitter", call("low"), priority=1),
+            scheduler.submit("twitter", call("high"), priority=50),
+            scheduler.submit("twitter", call("mid"), priority=10),
+        )
+        assert order == ["first", "high", "mid", "low"]
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_call_is_retried_not_dropped(self):
+        """Test that a call hitting the rate limit is requeued and resumes after retry_after"""
+        scheduler = make_scheduler(limits={"twitter": 10})
+        attempts = []
+
+        async def call():
+            attempts.append(time.monotonic())
+            if len(attempts) == 1:
+                raise RateLimitError("limited", platform="twitter", retry_after=0.1)
+            return {"trends": []}
+
+        assert await scheduler.submit("twitter", call) == {"trends": []}
+        assert attempts[1] - attempts[0] >= 0.09
+        stats = scheduler.get_stats()["twitter"]
+        assert stats["rate_limited"] == 1
+        assert stats["requeued"] == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_when_reset_is_past_deadline(self):
+        """Test that a queued call fails fast if the window resets after its deadline"""
+        scheduler = make_scheduler(limits={"twitter": 1}, window_seconds=60)
+
+        async def call():
+            return "ok"
+
+        assert await scheduler.submit("twitter", call) == "ok"
+        with pytest.raises(RateLimitError):
+            await asyncio.wait_for(
+                scheduler.submit("twitter", call, deadline=scheduler.clock() + 1),
+                timeout=0.5
+            )
+
+    @pytest.mark.asyncio
+    async def test_budget_seeded_from_platform_connection_status(self):
+        """Test that a stored rate_limit_status replaces the default budget"""
+        scheduler = make_scheduler(window_seconds=900)
+        scheduler.update_from_status("twitter", {
+            "remaining_requests": 0,
+            "reset_timestamp": "2000-01-01T00:00:00Z",
+            "limit_per_window": 15
+        })
+        # The stored window already reset, so a fresh one starts with the stored limit
+        assert scheduler.reset_in("twitter") == 0
+        status = scheduler.get_stats()["twitter"]
+        assert status["limit_per_window"] == 15
+        assert status["remaining_requests"] == 15
+
+
+    @pytest.mark.asyncio
+    async def test_budget_loaded_from_and_saved_to_platform_connections(self):
+        """Test that stored budgets seed the scheduler and spent or rate-limited budgets are written back"""
+        reset = "2999-01-01T00:00:00Z"
+        db = StatusDatabase({"TWITTER": {"remaining_requests": 1, "reset_timestamp": reset, "limit_per_window": 15}})
+        scheduler = make_scheduler(db=db)
+
+        assert await scheduler.load() == 1
+        assert scheduler.try_acquire("twitter")
+        assert not scheduler.try_acquire("twitter")
+        await scheduler._save_task
+        assert db.statuses["TWITTER"] == {"remaining_requests": 0, "reset_timestamp": reset, "limit_per_window": 15}
+
+        scheduler.record_rate_limit("tiktok", retry_after=60)
+        await scheduler._save_task
+        assert db.statuses["TIKTOK"]["remaining_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unsaved_budgets_survive_database_errors(self):
+        """Test that budgets keep working without PostgreSQL and are saved once it is back"""
+        db = StatusDatabase(fail=True)
+        scheduler = make_scheduler(db=db)
+
+        assert await scheduler.load() == 0
+        assert scheduler.try_acquire("twitter")
+        await scheduler._save_task
+        assert db.statuses == {}
+
+        db.fail = False
+        assert await scheduler.save()
+        assert db.statuses["TWITTER"]["remaining_requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_discovery_retries_rate_limited_platform_through_scheduler():
+    """Test that a rate-limited platform recovers within its deadline instead of losing data"""
+    calls = []
+
+    class FlakyClient:
+        async def call_tool(self, tool_name, arguments):
+            calls.append(tool_name)
+            if len(calls) == 1:
+                return {"status": "rate_limited", "retry_after": 0.1}
+            return {"trends": [{"topic_name": "AI", "platform_trend_id": "t1"}]}
+
+    service = TrendDiscoveryService(FlakyClient(), scheduler=make_scheduler(), platform_timeout=2.0)
+    result = await service.fetch_platform("twitter")
+
+    assert result.ok
+    assert [t["topic_name"] for t in result.trends] == ["AI"]
+    assert len(calls) == 2
@@ -0,0 +1,182 @@
+"""Rate limiter tests"""
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+
+from src.api.middleware import RateLimitMiddleware
+from src.services.rate_limiter import LocalTokenBuckets, RateLimiter, TokenBucket
+from src.services.redis_client import AsyncRedisClient
+
+
+def unreachable_redis() -> AsyncRedisClient:
+    return AsyncRedisClient("redis://127.0.0.1:1/0", socket_timeout=0.2)
+
+
+def make_app(limiter: RateLimiter, **middleware_options) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, limiter=limiter, exempt_paths=["/health"], **middleware_options)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    @app.get("/other")
+    async def other():
+        return {}
+
+    @app.get("/health")
+    async def health():
+        return {}
+
+    return app
+
+
+class TestLocalTokenBuckets:
+    """Test the in-process fallback buckets"""
+
+    def test_burst_then_reject(self):
+        """Test that a bucket allows its capacity then reports when to retry"""
+        buckets = LocalTokenBuckets()
+        bucket = [TokenBucket("client", capacity=3, refill_per_second=1.0)]
+        decisions = [buckets.acquire(bucket) for _ in range(4)]
+
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        assert decisions[2].remaining == 0
+        assert 0 < decisions[3].retry_after <= 1.0
+        assert decisions[3].retry_after_seconds == 1
+
+    def test_refill(self, monkeypatch):
+        """Test that tokens come back over time"""
+        buckets = LocalTokenBuckets()
+        bucket = [TokenBucket("client", capacity=1, refill_per_second=0.5)]
+        assert buckets.acquire(bucket).allowed
+
+        real_monotonic = time.monotonic
+        monkeypatch.setattr(time, "monotonic", lambda: real_monotonic() + 2.5)
+        assert buckets.acquire(bucket).allowed
+
+    def test_rejection_does_not_drain_other_buckets(self):
+        """Test that a request rejected by one bucket keeps the other's tokens"""
+        buckets = LocalTokenBuckets()
+        client = TokenBucket("client", capacity=10, refill_per_second=0.001)
+        route = TokenBucket("client:route", capacity=1, refill_per_second=0.001)
+
+        assert buckets.acquire([client, route]).allowed
+        for _ in range(3):
+            assert not buckets.acquire([client, route]).allowed
+        assert buckets.acquire([client]).remaining == 8
+
+
+class TestRateLimitMiddleware:
+    """Test limits enforced through the middleware"""
+
+    def test_falls_back_without_redis_and_sets_headers(self):
+        """Test per-client limits and Retry-After when Redis is unreachable"""
+        limiter = RateLimiter(client=unreachable_redis(), requests_per_minute=2)
+        client = TestClient(make_app(limiter))
+
+        first = client.get("/other")
+        assert first.status_code == 200
+        assert first.headers["x-ratelimit-limit"] == "2"
+        assert first.headers["x-ratelimit-remaining"] == "1"
+        assert client.get("/other").status_code == 200
+
+        rejected = client.get("/other")
+        assert rejected.status_code == 429
+        assert int(rejected.headers["retry-after"]) >= 1
+        assert rejected.json() == {"detail": "Rate limit exceeded"}
+
+        # Exempt paths are never limited
+        assert client.get("/health").status_code == 200
+
+    def test_route_limit_uses_path_template(self):
+        """Test that per-route buckets group requests by route, not raw path"""
+        limiter = RateLimiter(
+            client=unreachable_redis(),
+            requests_per_minute=100,
+            route_limits={"/items/{item_id}": 2}
+        )
+        client = TestClient(make_app(limiter))
+
+        assert client.get("/items/1").status_code == 200
+        assert client.get("/items/2").status_code == 200
+        assert client.get("/items/3").status_code == 429
+        assert client.get("/other").status_code == 200
+
+    def test_spoofed_forwarded_for_is_ignored(self):
+        """Test that clients are keyed by the proxy-appended entry, not the client-supplied leftmost one"""
+        limiter = RateLimiter(client=unreachable_redis(), requests_per_minute=2)
+        client = TestClient(make_app(limiter, trust_forwarded_for=True))
+
+        statuses = [
+            client.get("/other", headers={"X-Forwarded-For": f"10.0.0.{i}, 203.0.113.7"}).status_code
+            for i in range(3)
+        ]
+        other = client.get("/other", headers={"X-Forwarded-For": "10.0.0.1, 198.51.100.2"})
+
+        assert statuses == [200, 200, 429]
+        assert other.status_code == 200
+
+    def test_trusted_proxy_hops(self):
+        """Test that with two proxies the client is the second entry from the right"""
+        limiter = RateLimiter(client=unreachable_redis(), requests_per_minute=1)
+        client = TestClient(make_app(limiter, trust_forwarded_for=True, trusted_proxy_hops=2))
+
+        first = client.get("/other", headers={"X-Forwarded-For": "1.1.1.1, 203.0.113.7, 10.0.0.2"})
+        spoofed = client.get("/other", headers={"X-Forwarded-For": "9.9.9.9, 203.0.113.7, 10.0.0.3"})
+
+        assert (first.status_code, spoofed.status_code) == (200, 429)
+
+    def test_cors_wraps_rate_limit(self):
+        """Test that 429s carry CORS headers and preflights don't spend tokens, as registered by create_app"""
+        from src.api import create_app
+
+        layers = [m.cls for m in create_app().user_middleware]
+        assert layers.index(CORSMiddleware) < layers.index(RateLimitMiddleware)
+
+        limiter = RateLimiter(client=unreachable_redis(), requests_per_minute=1)
+        app = make_app(limiter)
+        app.add_middleware(CORSMiddleware, allow_origins=["https://app.example"], allow_methods=["*"])
+        client = TestClient(app)
+        origin = {"Origin": "https://app.example"}
+        preflight = {**origin, "Access-Control-Request-Method": "GET"}
+
+        assert all(client.options("/other", headers=preflight).status_code == 200 for _ in range(3))
+        assert client.get("/other", headers=origin).status_code == 200
+        rejected = client.get("/other", headers=origin)
+        assert rejected.status_code == 429
+        assert rejected.headers["access-control-allow-origin"] == "https://app.example"
+
+    def test_disabled(self):
+        """Test that a disabled limiter lets everything through"""
+        limiter = RateLimiter(client=unreachable_redis(), requests_per_minute=1, enabled=False)
+        client = TestClient(make_app(limiter))
+        assert all(client.get("/other").status_code == 200 for _ in range(3))
+
+
+class TestRedisTokenBucket:
+    """Test the Lua script against a live Redis"""
+
+    @pytest.mark.asyncio
+    async def test_shared_limit(self):
+        """Test that limiters sharing Redis share buckets"""
+        redis = AsyncRedisClient("redis://localhost:6379/15", socket_timeout=0.5)
+        try:
+            await redis.ping()
+        except Exception:
+            pytest.skip("Redis not available")
+
+        namespace = f"test:ratelimit:{time.time_ns()}"
+        workers = [
+            RateLimiter(client=redis, requests_per_minute=3, namespace=namespace)
+            for _ in range(2)
+        ]
+        decisions = [await workers[i % 2].check("client") for i in range(4)]
+        await redis.disconnect()
+
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        assert decisions[3].retry_after_seconds >= 1
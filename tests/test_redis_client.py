@@ -0,0 +1,35 @@
+"""Async Redis client tests"""
+
+import pytest
+
+from src.services.redis_client import AsyncRedisClient
+
+
+class TestAsyncRedisClient:
+    """Test connection pool configuration"""
+
+    @pytest.mark.asyncio
+    async def test_pool_is_bounded_and_lazy(self):
+        """Test that the pool honours its limits and opens no connections up front"""
+        client = AsyncRedisClient(
+            "redis://localhost:6379/0",
+            max_connections=7,
+            pool_timeout=1.5
+        )
+        redis = client.get_client()
+
+        assert client.get_client() is redis
+        assert client.pool.max_connections == 7
+        assert client.pool.timeout == 1.5
+        assert client.pool.connection_kwargs["decode_responses"] is True
+
+        await client.disconnect()
+        assert client.client is None and client.pool is None
+
+    @pytest.mark.asyncio
+    async def test_empty_batches_skip_redis(self):
+        """Test that empty multi-key calls return without a round trip"""
+        client = AsyncRedisClient("redis://localhost:1/0")
+        assert await client.mget([]) == []
+        assert await client.incr_many([]) == []
+        assert await client.delete_many([]) == 0
@@ -0,0 +1,59 @@
+"""Batch relevance scorer tests"""
+
+import random
+
+import pytest
+
+from mcp_servers.fake import FakeBehavior, generate_trends
+from skills.trend_research import lexical_relevance
+from src.services.relevance import BatchRelevanceScorer, get_scorer
+
+
+def make_trends(count, seed=3):
+    return generate_trends(random.Random(seed), "twitter", count, FakeBehavior())
+
+
+@pytest.mark.parametrize("niche", ["AI agents", "rust hardware", "climate", "quantum chips startups", ""])
+def test_matches_per_trend_lexical_scores(niche):
+    """Test that batch scores equal lexical_relevance trend by trend"""
+    trends = make_trends(500)
+    trends.append({"topic_name": "AIAgents", "related_hashtags": ["#ai-agents"]})
+    trends.append({"topic_name": None})
+    # lower() lengthens "İ", which must not shift matches onto the next trend
+    trends.append({"topic_name": "İİİİİİ ai", "related_hashtags": None})
+    trends.append({"topic_name": "zzzzzzzzzzzzzzz"})
+
+    scores = BatchRelevanceScorer(niche, engagement_weight=0.0).score(trends)
+
+    assert scores.tolist() == [lexical_relevance(t, niche) for t in trends]
+
+
+def test_engagement_weight_blends_within_bounds():
+    """Test that engagement shifts scores while keeping them in 0.0-1.0"""
+    trends = [
+        {"topic_name": "AI Agents", "engagement_metrics": {"likes": 10}},
+        {"topic_name": "AI Agents", "engagement_metrics": {"likes": 100000, "views": 5000000}},
+        {"topic_name": "Gardening", "engagement_metrics": {}},
+    ]
+    scores = BatchRelevanceScorer("AI agents", engagement_weight=0.25).score(trends)
+
+    # Full lexical match plus the batch's top engagement scores 1.0
+    assert scores[1] == 1.0
+    assert 0.75 < scores[0] < 1.0
+    assert scores[2] == 0.0
+    with pytest.raises(ValueError):
+        BatchRelevanceScorer("AI", engagement_weight=1.5)
+
+
+def test_filter_scores_only_unscored_trends():
+    """Test that filtering keeps existing scores and scores the rest as one batch"""
+    trends = [
+        {"topic_name": "Gardening", "relevance_score": 0.9},
+        {"topic_name": "AI Agents"},
+        {"topic_name": "AI Chips"},
+    ]
+    kept = get_scorer("AI agents").filter(trends, min_score=0.7)
+
+    assert [t["topic_name"] for t in kept] == ["Gardening", "AI Agents"]
+    assert trends[2]["relevance_score"] == 0.5
+    assert get_scorer("AI agents") is get_scorer("AI agents")
@@ -0,0 +1,151 @@
+"""Response cache tests"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.services.response_cache import ResponseCache, normalize_params
+
+
+class FakeRedisClient:
+    """In-memory stand-in for the AsyncRedisClient helpers the cache uses"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def mget(self, keys):
+        return [self.data.get(k) for k in keys]
+
+    async def set(self, key, value, ttl=None):
+        self.data[key] = value
+
+    async def set_if_absent(self, key, value, ttl):
+        if key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def delete_if_equal(self, key, value):
+        if self.data.get(key) != value:
+            return False
+        del self.data[key]
+        return True
+
+    async def incr_many(self, keys, ttl=None):
+        results = []
+        for key in keys:
+            self.data[key] = str(int(self.data.get(key, 0)) + 1)
+            results.append(int(self.data[key]))
+        return results
+
+
+class UnavailableRedisClient:
+    async def mget(self, keys):
+        raise ConnectionError("Redis unavailable")
+
+
+def make_loader(calls):
+    async def load():
+        calls.append(1)
+        return {"value": len(calls)}
+    return load
+
+
+class TestNormalizeParams:
+    """Test cache key normalization"""
+
+    def test_equivalent_params_share_key(self):
+        """Test that ordering, case and empty values do not change the key"""
+        cache = ResponseCache(client=FakeRedisClient(), enabled=True)
+        a = cache.make_key("trends", {"platforms": "TikTok,twitter", "limit": 50, "niche": None})
+        b = cache.make_key("trends", {"limit": 50, "platforms": "twitter, tiktok"})
+        assert a == b
+
+    def test_drops_none(self):
+        """Test that None values are removed"""
+        assert normalize_params({"a": None, "b": 1}) == {"b": 1}
+
+
+class TestResponseCache:
+    """Test hit/miss, invalidation and stale-while-revalidate"""
+
+    @pytest.mark.asyncio
+    async def test_hit_after_miss(self):
+        """Test that a second identical lookup is served from cache"""
+        cache = ResponseCache(client=FakeRedisClient(), enabled=True)
+        calls = []
+        for _ in range(3):
+            payload = await cache.get_or_compute("trends", {"limit": 5}, ["twitter"], 60, make_loader(calls))
+        assert payload == {"value": 1}
+        assert len(calls) == 1
+        stats = cache.get_stats()["trends"]
+        assert stats["hits"] == 2 and stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_by_platform(self):
+        """Test that ingesting a platform invalidates responses covering it"""
+        cache = ResponseCache(client=FakeRedisClient(), enabled=True)
+        calls = []
+        await cache.get_or_compute("trends", {}, None, 60, make_loader(calls))
+        await cache.get_or_compute("platform_trends", {"p": "tiktok"}, ["tiktok"], 60, make_loader(calls))
+
+        await cache.invalidate_platforms(["twitter"])
+
+        # All-platform response is recomputed, tiktok-only response is not
+        await cache.get_or_compute("trends", {}, None, 60, make_loader(calls))
+        await cache.get_or_compute("platform_trends", {"p": "tiktok"}, ["tiktok"], 60, make_loader(calls))
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self, monkeypatch):
+        """Test that an expired entry is returned immediately and refreshed once"""
+        cache = ResponseCache(client=FakeRedisClient(), enabled=True, stale_ttl=300)
+        calls = []
+        await cache.get_or_compute("trends", {}, ["twitter"], 10, make_loader(calls))
+
+        real_time = time.time
+        monkeypatch.setattr(time, "time", lambda: real_time() + 30)
+
+        first = await cache.get_or_compute("trends", {}, ["twitter"], 10, make_loader(calls))
+        second = await cache.get_or_compute("trends", {}, ["twitter"], 10, make_loader(calls))
+        assert first == second == {"value": 1}
+
+        await asyncio.gather(*cache._refresh_tasks)
+        # The refresh lock lets only one background refresh through
+        assert len(calls) == 2
+        assert cache.get_stats()["trends"]["refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_lock_released_after_refresh(self, monkeypatch):
+        """Test that the next stale hit can refresh at once, and another holder's lock is left alone"""
+        client = FakeRedisClient()
+        cache = ResponseCache(client=client, enabled=True, stale_ttl=300)
+        calls = []
+        await cache.get_or_compute("trends", {}, ["twitter"], 10, make_loader(calls))
+        key = cache.make_key("trends", {})
+
+        real_time = time.time
+        for offset in (30, 60):
+            monkeypatch.setattr(time, "time", lambda offset=offset: real_time() + offset)
+            await cache.get_or_compute("trends", {}, ["twitter"], 10, make_loader(calls))
+            await asyncio.gather(*cache._refresh_tasks)
+            assert f"{key}:refresh" not in client.data
+
+        assert len(calls) == 3
+        client.data[f"{key}:refresh"] = "other-token"
+        assert not await client.delete_if_equal(f"{key}:refresh", "mine")
+        monkeypatch.setattr(time, "time", lambda: real_time() + 90)
+        await cache.get_or_compute("trends", {}, ["twitter"], 10, make_loader(calls))
+        await asyncio.gather(*cache._refresh_tasks)
+        assert len(calls) == 3
+        assert client.data[f"{key}:refresh"] == "other-token"
+
+    @pytest.mark.asyncio
+    async def test_fails_open_without_redis(self):
+        """Test that a Redis outage falls back to computing the response"""
+        cache = ResponseCache(client=UnavailableRedisClient(), enabled=True)
+        calls = []
+        payload = await cache.get_or_compute("trends", {}, None, 60, make_loader(calls))
+        assert payload == {"value": 1}
+        assert cache.get_stats()["trends"]["errors"] == 1
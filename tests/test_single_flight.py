@@ -0,0 +1,73 @@
+"""Single-flight coalescing tests"""
+
+import asyncio
+
+import pytest
+
+from src.services.single_flight import SingleFlight, call_key
+
+
+def test_call_key_ignores_argument_order():
+    """Test that argument dicts hash the same regardless of key order"""
+    assert call_key("twitter", "fetch", {"limit": 10, "location": "US"}) == \
+        call_key("twitter", "fetch", {"location": "US", "limit": 10})
+    assert call_key("twitter", "fetch", {"limit": 10}) != call_key("twitter", "fetch", {"limit": 20})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_request():
+    """Test that concurrent callers with one key trigger a single call"""
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"trends": [1, 2]}
+
+    results = await asyncio.gather(*(flight.run("k", fetch, label="fetch") for _ in range(10)))
+
+    assert len(calls) == 1
+    assert all(r == {"trends": [1, 2]} for r in results)
+    # Each caller owns its result
+    results[1]["trends"].append(3)
+    assert results[2] == {"trends": [1, 2]}
+    assert flight.get_stats()["fetch"] == {
+        "calls": 10, "upstream": 1, "coalesced": 9, "coalesce_ratio": 0.9
+    }
+    assert flight.in_flight == 0
+
+    # Sequential calls are not coalesced
+    await flight.run("k", fetch, label="fetch")
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter():
+    """Test that a failing call raises for all coalesced callers"""
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream down")
+
+    results = await asyncio.gather(*(flight.run("k", fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    """Test that cancelling the first caller leaves the call running for the others"""
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.create_task(flight.run("k", fetch))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(flight.run("k", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
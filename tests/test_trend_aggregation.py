@@ -0,0 +1,104 @@
+"""Cross-platform trend aggregation (MinHash/LSH) tests"""
+
+import random
+
+import numpy as np
+import pytest
+
+from skills.trend_research import TrendResearchAgent
+from src.services.trend_aggregation import MinHashLSH, aggregate_trends, trend_tokens
+
+
+def trend(topic, platform, hour=0, likes=0, hashtags=(), velocity=0.0):
+    return {
+        "topic_name": topic,
+        "platform": platform,
+        "platform_trend_id": f"{platform}_{topic}",
+        "related_hashtags": list(hashtags),
+        "timestamp": f"2026-10-18T{hour:02d}:00:00Z",
+        "engagement_metrics": {"likes": likes},
+        "trend_velocity": velocity,
+    }
+
+
+def test_signatures_estimate_jaccard_similarity():
+    """Test that matching signature positions track the true Jaccard similarity"""
+    rng = random.Random(0)
+    lsh = MinHashLSH(num_perm=256, bands=64)
+    for _ in range(20):
+        words = [f"w{i}" for i in rng.sample(range(1000), 20)]
+        a, b = words[:rng.randint(5, 15)], words[rng.randint(0, 5):]
+        sigs = lsh.signatures([a, b])
+        true = len(set(a) & set(b)) / len(set(a) | set(b))
+        assert abs((sigs[0] == sigs[1]).mean() - true) < 0.15
+
+
+def test_merges_platform_variants_into_one_cluster():
+    """Test cross-platform merging, combined engagement and platform sequence"""
+    trends = [
+        trend("AI Agents", "twitter", hour=9, likes=100, hashtags=["#AIAgents"], velocity=0.5),
+        trend("AIAgents", "instagram", hour=11, likes=300, velocity=0.25),
+        trend("AI agents explained", "tiktok", hour=7, likes=50, hashtags=["#AIAgents"]),
+        trend("Sourdough recipe", "tiktok", hour=8, likes=1000),
+    ]
+
+    clusters = aggregate_trends(trends)
+
+    assert [c.topic_name for c in clusters] == ["Sourdough recipe", "AIAgents"]
+    merged = clusters[1]
+    assert merged.cross_platform
+    assert merged.platform_sequence == ["tiktok", "twitter", "instagram"]
+    assert merged.engagement_metrics == {"likes": 450}
+    assert merged.trend_velocity == 0.75
+    assert merged.first_seen == "2026-10-18T07:00:00Z"
+    assert merged.related_hashtags == ["#AIAgents"]
+    assert not clusters[0].cross_platform
+
+
+def test_keeps_distinct_and_empty_topics_apart():
+    """Test that unrelated or empty topics are never merged"""
+    trends = [trend("Quantum Computing", "twitter"), trend("Quantum Chips", "tiktok"),
+              trend("", "twitter"), trend(None, "tiktok")]
+
+    assert len(aggregate_trends(trends)) == 4
+    assert trend_tokens(trend("#QuantumComputing", "x", hashtags=["#Qubits"])) == ["quantum", "computing", "qubits"]
+
+
+def test_clusters_transitive_matches_at_scale():
+    """Test that chains of near-duplicates resolve to one label, in one pass over many trends"""
+    rng = random.Random(1)
+    token_sets, truth = [], []
+    for topic in range(2000):
+        words = [f"t{topic}w{i}" for i in range(4)]
+        for _ in range(rng.randint(1, 3)):
+            token_sets.append(words + [rng.choice(["news", "live", "today"])])
+            truth.append(topic)
+
+    labels = MinHashLSH().cluster(token_sets)
+
+    truth = np.array(truth)
+    assert len(np.unique(labels)) == 2000
+    for topic in (0, 999, 1999):
+        assert len(set(labels[truth == topic].tolist())) == 1
+
+
+def test_rejects_bands_not_dividing_permutations():
+    """Test that bands must split the signature evenly"""
+    with pytest.raises(ValueError):
+        MinHashLSH(num_perm=128, bands=30)
+
+
+@pytest.mark.asyncio
+async def test_agent_aggregates_cross_platform_trends():
+    """Test that the agent merges sample trends across platforms and logs the run (US-2)"""
+    agent = TrendResearchAgent(agent_id="chimera-influencer-001", platforms=["twitter", "tiktok", "instagram"])
+
+    clusters = await agent.aggregate_cross_platform_trends(limit=5)
+
+    art = next(c for c in clusters if c["topic_name"] in ("AI Art Challenge", "AIArt"))
+    assert set(art["platform_sequence"]) == {"tiktok", "instagram"}
+    assert art["cross_platform"] is True
+    assert sum(len(c["trend_ids"]) for c in clusters) == 15
+    event = agent.get_mcp_sense_logs()[-1]
+    assert event["event"] == "trend_aggregation"
+    assert event["details"]["clusters"] == len(clusters)
@@ -0,0 +1,266 @@
+"""Concurrent trend discovery tests"""
+
+import asyncio
+import time
+
+import pytest
+
+from skills.trend_research import TrendResearchAgent, TrendResearchInput, research_trends
+from src.services.platform_scheduler import PlatformScheduler
+from src.services.trend_discovery import BATCH_TOOL, PLATFORM_TOOLS, TrendDiscoveryService
+
+TOOL_PLATFORMS = {tool: platform for platform, tool in PLATFORM_TOOLS.items()}
+
+
+class RecordingSenseLogger:
+    def __init__(self):
+        self.activities = []
+
+    def log_activity(self, activity_type, component, details=None, trace_id=None):
+        self.activities.append((activity_type, details))
+
+    def log_trend_discovery(self, platform, trends_found, trace_id=None):
+        self.activities.append(("trend_discovery", {"platform": platform, "trends_found": trends_found}))
+
+
+class DelayedToolClient:
+    """Answers each platform's tool after a fixed delay, singly or as a batch"""
+
+    def __init__(self, delays, responses=None, batch=True):
+        self.delays = delays
+        self.responses = responses or {}
+        self.batch = batch
+        self.calls = []
+
+    async def _fetch(self, platform):
+        await asyncio.sleep(self.delays.get(platform, 0))
+        if platform in self.responses:
+            return self.responses[platform]
+        return {"trends": [{"topic_name": f"{platform} topic", "platform_trend_id": f"{platform}_1"}]}
+
+    async def _fetch_spec(self, spec):
+        try:
+            return await asyncio.wait_for(self._fetch(spec["platform"]), spec["timeout"])
+        except asyncio.TimeoutError:
+            return {"status": "error", "error": f"Timed out after {spec['timeout']}s"}
+
+    async def call_tool(self, tool_name, arguments):
+        self.calls.append(tool_name)
+        if tool_name == BATCH_TOOL:
+            if not self.batch:
+                raise ValueError(f"Unknown tool: {tool_name}")
+            results = await asyncio.gather(*(self._fetch_spec(s) for s in arguments["requests"]))
+            return {"status": "ok", "results": list(results)}
+        return await self._fetch(TOOL_PLATFORMS[tool_name])
+
+
+def make_service(client, **kwargs):
+    # Direct tool calls unless a test brings its own scheduler
+    kwargs.setdefault("scheduler", None)
+    return TrendDiscoveryService(client, sense_logger=RecordingSenseLogger(), **kwargs)
+
+
+class TestTrendDiscoveryService:
+    """Test the concurrent per-platform fan-out"""
+
+    @pytest.mark.asyncio
+    async def test_platforms_are_queried_concurrently(self):
+        """Test that total time tracks the slowest platform, not the sum"""
+        service = make_service(DelayedToolClient({"twitter": 0.2, "tiktok": 0.2, "instagram": 0.2}))
+
+        start = time.perf_counter()
+        discovery = await service.discover(["twitter", "tiktok", "instagram"])
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.4
+        assert {t["platform"] for t in discovery.trends} == {"twitter", "tiktok", "instagram"}
+        assert set(discovery.platform_durations_ms) == {"twitter", "tiktok", "instagram"}
+        assert all(ms >= 190 for ms in discovery.platform_durations_ms.values())
+
+    @pytest.mark.asyncio
+    async def test_results_stream_in_completion_order(self):
+        """Test that fast platforms are yielded before slow ones finish"""
+        service = make_service(DelayedToolClient({"twitter": 0.3, "tiktok": 0.0, "instagram": 0.1}))
+        order = [r.platform async for r in service.stream(["twitter", "tiktok", "instagram"])]
+        assert order == ["tiktok", "instagram", "twitter"]
+
+    @pytest.mark.asyncio
+    async def test_per_platform_timeout(self):
+        """Test that a slow platform times out without holding back the others"""
+        service = make_service(
+            DelayedToolClient({"twitter": 5.0, "tiktok": 0.0}),
+            platform_timeout=1.0,
+            platform_timeouts={"twitter": 0.1}
+        )
+        discovery = await service.discover(["twitter", "tiktok"])
+
+        assert "Timed out" in discovery.errors["twitter"]
+        assert discovery.results["twitter"].trends == []
+        assert [t["platform"] for t in discovery.trends] == ["tiktok"]
+
+    @pytest.mark.asyncio
+    async def test_failures_are_isolated(self):
+        """Test that unsupported and not-implemented platforms report errors"""
+        client = DelayedToolClient({}, responses={"tiktok": {"status": "not_implemented", "message": "pending"}})
+        discovery = await make_service(client).discover(["twitter", "tiktok", "myspace"])
+
+        assert discovery.errors == {"tiktok": "pending", "myspace": "Unsupported platform: myspace"}
+        assert len(discovery.trends) == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_is_one_round_trip_with_inline_errors(self):
+        """Test that batch discovery makes one call and keeps per-platform errors"""
+        client = DelayedToolClient(
+            {"twitter": 5.0},
+            responses={"tiktok": {"status": "rate_limited", "retry_after": 30}}
+        )
+        service = make_service(client, platform_timeouts={"twitter": 0.1})
+
+        discovery = await service.discover(["twitter", "tiktok", "instagram", "myspace"], batch=True)
+
+        assert client.calls == [BATCH_TOOL]
+        assert "Timed out" in discovery.errors["twitter"]
+        assert discovery.errors["tiktok"] == "rate_limited"
+        assert discovery.results["tiktok"].retry_after == 30
+        assert discovery.errors["myspace"] == "Unsupported platform: myspace"
+        assert [t["platform"] for t in discovery.trends] == ["instagram"]
+
+    @pytest.mark.asyncio
+    async def test_batch_falls_back_to_single_calls(self):
+        """Test that a server without the batch tool is queried per platform"""
+        client = DelayedToolClient({}, batch=False)
+        discovery = await make_service(client).discover(["twitter", "tiktok"], batch=True)
+
+        assert client.calls[0] == BATCH_TOOL
+        assert sorted(client.calls[1:]) == sorted([PLATFORM_TOOLS["twitter"], PLATFORM_TOOLS["tiktok"]])
+        assert not discovery.errors
+
+    @pytest.mark.asyncio
+    async def test_batch_fallback_spends_budget_once(self):
+        """Test that a failed batch call gives back its budget and only re-queries platforms without a result"""
+        client = DelayedToolClient({}, batch=False)
+        scheduler = PlatformScheduler(limits={"twitter": 5, "tiktok": 5}, jitter=0.0)
+        discovery = await make_service(client, scheduler=scheduler).discover(["twitter", "tiktok", "myspace"], batch=True)
+
+        assert sorted(client.calls[1:]) == sorted([PLATFORM_TOOLS["twitter"], PLATFORM_TOOLS["tiktok"]])
+        assert discovery.errors == {"myspace": "Unsupported platform: myspace"}
+        stats = scheduler.get_stats()
+        assert [stats[p]["remaining_requests"] for p in ("twitter", "tiktok")] == [4, 4]
+        assert [stats[p]["executed"] for p in ("twitter", "tiktok")] == [1, 1]
+
+
+class TestTrendResearchAgentFanOut:
+    """Test the agent on top of the discovery service"""
+
+    @pytest.mark.asyncio
+    async def test_research_reports_per_platform_durations(self):
+        """Test that metadata breaks query_duration_ms down per platform"""
+        agent = TrendResearchAgent(
+            agent_id="agent-1",
+            mcp_client=DelayedToolClient({"twitter": 0.05}),
+            sense_logger=RecordingSenseLogger()
+        )
+        output = await agent.research(TrendResearchInput(
+            platforms=["twitter", "tiktok"],
+            niche="twitter topic",
+            min_relevance=0.75
+        ))
+
+        metadata = output.metadata
+        assert set(metadata["platform_query_duration_ms"]) == {"twitter", "tiktok"}
+        assert metadata["query_duration_ms"] >= metadata["platform_query_duration_ms"]["twitter"]
+        assert metadata["total_found"] == 2
+        assert [t["platform"] for t in output.trends] == ["twitter"]
+
+    @pytest.mark.asyncio
+    async def test_agent_uses_batch_tool_on_social_media_server(self):
+        """Test that the agent discovers all platforms in one batch call to the real server"""
+        from mcp_servers.social_media import server
+        from src.services.mcp_client import InProcessMCPClient
+
+        class RecordingClient(InProcessMCPClient):
+            def __init__(self):
+                super().__init__(server)
+                self.tools = []
+
+            async def call_tool(self, tool_name, arguments):
+                self.tools.append(tool_name)
+                return await super().call_tool(tool_name, arguments)
+
+        client = RecordingClient()
+        agent = TrendResearchAgent(
+            agent_id="agent-1", mcp_client=client, sense_logger=RecordingSenseLogger(), batch=True
+        )
+        trends = await agent.discover_trends_async(platforms=["twitter", "tiktok", "instagram"], limit=2)
+        await client.disconnect()
+
+        assert client.tools == [BATCH_TOOL]
+        assert len(trends) == 6
+        assert {t["platform"] for t in trends} == {"twitter", "tiktok", "instagram"}
+
+    @pytest.mark.asyncio
+    async def test_agent_calls_manager_registered_server(self):
+        """Test that agent discovery goes through the manager's pooled sessions and call stats"""
+        from mcp_servers.social_media import server
+        from src.services.mcp_client import MCPClientManager, PooledMCPClient, in_process_session_factory
+
+        manager = MCPClientManager()
+        pooled = PooledMCPClient("social_media", in_process_session_factory(server), pool_size=2)
+        manager.register_server("social_media", "memory://social_media", pooled)
+        await manager.connect_all(lazy=False)
+        agent = TrendResearchAgent(
+            agent_id="agent-1",
+            mcp_client=manager.tool_client("social_media"),
+            sense_logger=RecordingSenseLogger(),
+            batch=False
+        )
+
+        trends = await agent.discover_trends_async(platforms=["twitter", "tiktok", "instagram"], limit=2)
+        sessions = pooled.get_stats()["sessions"]
+        await manager.disconnect_all()
+
+        assert len(trends) == 6
+        assert 1 <= sessions <= 2
+        tools = manager.get_stats()["coalescing"]["tools"]
+        assert {tool: stats["upstream"] for tool, stats in tools.items()} == {
+            f"social_media.fetch_{p}_trends": 1 for p in ("twitter", "tiktok", "instagram")
+        }
+
+    @pytest.mark.asyncio
+    async def test_research_trends_uses_global_manager(self):
+        """Test that the skill entry point reaches the social media server through the global manager"""
+        from src.services.mcp_client import mcp_client_manager
+
+        output = await research_trends(TrendResearchInput(platforms=["twitter"], min_relevance=0.0, limit=3))
+
+        assert output.metadata["total_found"] == 3
+        assert mcp_client_manager.get_status()["social_media"]["status"] == "connected"
+
+    @pytest.mark.asyncio
+    async def test_missing_credential_is_an_error_outside_sample_mode(self, monkeypatch):
+        """Test that a platform without an API key fails instead of serving sample trends"""
+        from mcp_servers.social_media import server
+        from src.services.mcp_client import InProcessMCPClient
+
+        monkeypatch.delenv("SOCIAL_MEDIA_SAMPLE_MODE")
+        monkeypatch.delenv("TWITTER_API_KEY", raising=False)
+        client = InProcessMCPClient(server)
+        discovery = await make_service(client).discover(["twitter"], limit=2)
+        await client.disconnect()
+
+        assert discovery.results["twitter"].trends == []
+        assert discovery.results["twitter"].error == "TWITTER_API_KEY is not set"
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_platform_serves_last_results(self):
+        """Test that a rate-limited platform falls back to its previous trends"""
+        client = DelayedToolClient({})
+        agent = TrendResearchAgent(
+            agent_id="agent-1", mcp_client=client, sense_logger=RecordingSenseLogger(), scheduler=None
+        )
+        first = await agent.discover_trends_async(platform="twitter")
+
+        client.responses["twitter"] = {"status": "rate_limited", "retry_after": 30}
+        assert await agent.discover_trends_async(platform="twitter") == first
+        assert await agent.discover_trends_async(platform="twitter", handle_rate_limit=False) == []
+        assert agent.send_status_heartbeat()["status"]["recent_errors"][-1]["error"] == "rate_limited"
@@ -0,0 +1,153 @@
+"""Bulk trend ingestion tests"""
+
+import json
+import time
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import text
+
+from src.config.settings import settings
+from src.services.database import Database
+from src.services.trend_ingestion import TrendIngestionService, to_record
+from src.services.trend_velocity import VelocityEngine
+
+
+class RecordingSenseLogger:
+    """Collects log_trend_storage calls"""
+
+    def __init__(self):
+        self.calls = []
+
+    def log_trend_storage(self, trends_stored, trace_id=None, **kwargs):
+        self.calls.append({"trends_stored": trends_stored, "trace_id": trace_id, **kwargs})
+
+
+class RecordingCache:
+    """Collects invalidated platforms"""
+
+    def __init__(self):
+        self.invalidated = []
+
+    async def invalidate_platforms(self, platforms):
+        self.invalidated.append(sorted(p.value for p in platforms))
+
+
+class TestToRecord:
+    """Test conversion of discovered trends into COPY records"""
+
+    def test_record_from_sample(self, sample_trend_data):
+        """Test that sample trend data maps onto staging columns"""
+        now = datetime(2026, 2, 5, tzinfo=timezone.utc)
+        record = to_record(sample_trend_data, now)
+
+        assert record[1] == "AI Agents"
+        assert record[2] == "TWITTER"
+        assert json.loads(record[3])["likes"] == 15000
+        assert record[5] == now
+        assert json.loads(record[7]) == ["#AIAgents", "#MachineLearning"]
+        assert record[8] == "twitter_trend_12345"
+
+    def test_record_rejects_unknown_platform(self, sample_trend_data):
+        """Test that unknown platforms are rejected"""
+        sample_trend_data["platform"] = "myspace"
+        with pytest.raises(ValueError):
+            to_record(sample_trend_data, datetime.now(timezone.utc))
+
+
+class TestTrendIngestionService:
+    """Test batching and reporting"""
+
+    @pytest.mark.asyncio
+    async def test_batches_and_reports(self, sample_trend_data, monkeypatch):
+        """Test that each batch is merged once and reported to MCP Sense"""
+        sense_logger = RecordingSenseLogger()
+        cache = RecordingCache()
+        service = TrendIngestionService(batch_size=2, sense_logger=sense_logger, response_cache=cache)
+        merged = []
+
+        async def fake_copy_and_merge(records):
+            merged.append(len(records))
+            # Pretend one row per batch was already stored
+            return len(records) - 1, 0
+
+        monkeypatch.setattr(service, "_copy_and_merge", fake_copy_and_merge)
+
+        trends = [dict(sample_trend_data, platform_trend_id=f"t{i}") for i in range(5)]
+        summary = await service.ingest(trends, trace_id="trace-1")
+
+        assert merged == [2, 2, 1]
+        assert summary.rows_received == 5
+        assert summary.rows_inserted == 2
+        assert summary.rows_deduplicated == 3
+        assert [c["rows_deduplicated"] for c in sense_logger.calls] == [1, 1, 1]
+        assert all(c["trace_id"] == "trace-1" for c in sense_logger.calls)
+        assert cache.invalidated == [["twitter"], ["twitter"]]
+
+    @pytest.mark.asyncio
+    async def test_invalid_trends_are_dropped_and_counted(self, sample_trend_data, monkeypatch):
+        """Test that a malformed trend neither fails the batch nor advances velocity state"""
+        sense_logger = RecordingSenseLogger()
+        velocity = VelocityEngine(client=None)
+        service = TrendIngestionService(sense_logger=sense_logger, response_cache=RecordingCache(), velocity=velocity)
+        merged = []
+
+        async def fake_copy_and_merge(records):
+            merged.extend(records)
+            return len(records), 0
+
+        monkeypatch.setattr(service, "_copy_and_merge", fake_copy_and_merge)
+        broken = dict(sample_trend_data, platform_trend_id="broken", topic_name=None)
+        unknown = dict(sample_trend_data, platform_trend_id="unknown", platform="myspace")
+
+        summary = await service.ingest([sample_trend_data, broken, unknown])
+
+        assert [record[8] for record in merged] == ["twitter_trend_12345"]
+        assert summary.rows_received == 1
+        assert summary.rows_rejected == 2
+        assert sense_logger.calls[0]["rows_rejected"] == 2
+        assert len(velocity) == 1
+
+
+class TestPostgresMerge:
+    """Test the COPY, staging table and ON CONFLICT merge against a live PostgreSQL"""
+
+    @pytest.mark.asyncio
+    async def test_insert_update_and_dedup_counts(self, sample_trend_data):
+        """Test that stored rows count as updated and in-batch repeats as deduplicated"""
+        db = Database(settings.database_url, pool_size=1, max_overflow=0)
+        try:
+            async with db.get_engine().connect() as conn:
+                await conn.execute(text("SELECT 1 FROM trends LIMIT 1"))
+        except Exception:
+            await db.disconnect()
+            pytest.skip("PostgreSQL with the trends schema not available")
+
+        service = TrendIngestionService(
+            db=db, sense_logger=RecordingSenseLogger(), response_cache=RecordingCache(), velocity=None
+        )
+        prefix = f"test_merge_{time.time_ns()}"
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        trend = dict(sample_trend_data, timestamp=now, relevance_score=0.5)
+        try:
+            first = await service.ingest([dict(trend, platform_trend_id=f"{prefix}_a")])
+            second = await service.ingest([
+                dict(trend, platform_trend_id=f"{prefix}_a", engagement_metrics={"likes": 1}),
+                dict(trend, platform_trend_id=f"{prefix}_b", engagement_metrics={"likes": 2}),
+                dict(trend, platform_trend_id=f"{prefix}_b", engagement_metrics={"likes": 3}),
+            ])
+            async with db.get_engine().connect() as conn:
+                rows = (await conn.execute(
+                    text("SELECT (engagement_metrics ->> 'likes')::int AS likes FROM trends "
+                         "WHERE platform_trend_id LIKE :prefix ORDER BY platform_trend_id"),
+                    {"prefix": f"{prefix}%"}
+                )).all()
+        finally:
+            async with db.get_engine().begin() as conn:
+                await conn.execute(text("DELETE FROM trends WHERE platform_trend_id LIKE :prefix"),
+                                   {"prefix": f"{prefix}%"})
+            await db.disconnect()
+
+        assert (first.rows_inserted, first.rows_updated, first.rows_deduplicated) == (1, 0, 0)
+        assert (second.rows_inserted, second.rows_updated, second.rows_deduplicated) == (1, 1, 1)
+        assert [r.likes for r in rows] == [1, 3]
@@ -0,0 +1,122 @@
+"""Trend partition management tests"""
+
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
+
+import pytest
+
+from src.services.trend_partitions import (
+    TrendPartition,
+    TrendPartitionManager,
+    expired_partitions,
+    partitions_between,
+)
+
+
+class FakeConnection:
+    """Answers the manager's catalog and default-partition queries, recording DDL"""
+
+    def __init__(self, partitions, default_weeks):
+        self.partitions = partitions
+        self.default_weeks = default_weeks
+        self.statements = []
+
+    async def scalar(self, statement, params=None):
+        return True
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        if "pg_inherits" in sql:
+            return [(name,) for name in self.partitions]
+        if "date_trunc" in sql:
+            return [(week,) for week in self.default_weeks if week < params["horizon"].date()]
+        self.statements.append(sql)
+        return []
+
+
+class FakeDatabase:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def get_engine(self):
+        return self
+
+    @asynccontextmanager
+    async def begin(self):
+        yield self.conn
+
+
+class TestTrendPartition:
+    """Test weekly partition naming and bounds"""
+
+    def test_partition_starts_on_monday(self):
+        """Test that timestamps map to the Monday-aligned week"""
+        partition = TrendPartition.for_timestamp(datetime(2026, 2, 5, 10, tzinfo=timezone.utc))
+        assert partition.start == date(2026, 2, 2)
+        assert partition.end == date(2026, 2, 9)
+        assert partition.name == "trends_p20260202"
+
+    def test_name_round_trip(self):
+        """Test that partition names parse back and foreign tables are ignored"""
+        assert TrendPartition.from_name("trends_p20260202") == TrendPartition(date(2026, 2, 2))
+        assert TrendPartition.from_name("trends_default") is None
+
+    def test_create_sql_bounds(self):
+        """Test that partition DDL covers exactly one week"""
+        sql = TrendPartition(date(2026, 2, 2)).create_sql()
+        assert "FROM ('2026-02-02 00:00:00+00') TO ('2026-02-09 00:00:00+00')" in sql
+
+    def test_split_from_default_moves_rows_before_attaching(self):
+        """Test that a partition overlapping default-partition rows is built and attached"""
+        statements = TrendPartition(date(2026, 2, 2)).split_from_default_sql()
+        assert statements[0].startswith("CREATE TABLE trends_p20260202 (LIKE trends")
+        assert "INSERT INTO trends_p20260202 SELECT * FROM trends_default WHERE" in statements[1]
+        assert statements[2].startswith("DELETE FROM trends_default WHERE timestamp >= '2026-02-02")
+        assert statements[3].startswith("ALTER TABLE trends ATTACH PARTITION trends_p20260202 FOR VALUES")
+
+    def test_partitions_between(self):
+        """Test that consecutive weeks are generated without gaps"""
+        partitions = partitions_between(
+            datetime(2026, 2, 5, tzinfo=timezone.utc),
+            datetime(2026, 2, 20, tzinfo=timezone.utc)
+        )
+        assert [p.name for p in partitions] == [
+            "trends_p20260202", "trends_p20260209", "trends_p20260216"
+        ]
+
+
+class TestRetention:
+    """Test retention cutoff selection"""
+
+    def test_only_fully_expired_partitions_are_retired(self):
+        """Test that partitions overlapping the retention window are kept"""
+        now = datetime(2026, 5, 6, tzinfo=timezone.utc)  # cutoff 2026-02-05 at 90 days
+        names = ["trends_p20260126", "trends_p20260202", "trends_p20260209", "trends_default"]
+        expired = expired_partitions(names, now, retention_days=90)
+        assert [p.name for p in expired] == ["trends_p20260126"]
+
+
+class TestMaintenance:
+    """Test maintenance DDL with rows stranded in the default partition"""
+
+    @pytest.mark.asyncio
+    async def test_splits_stranded_weeks_and_retires_expired_ones(self):
+        """Test that default-partition weeks are split out, and expired ones retired with them"""
+        now = datetime(2026, 5, 6, tzinfo=timezone.utc)  # week of 2026-05-04, cutoff 2026-02-05
+        conn = FakeConnection(
+            partitions=["trends_default", "trends_p20260504"],
+            default_weeks=[date(2026, 1, 26), date(2026, 5, 18), date(2027, 1, 4)]
+        )
+        manager = TrendPartitionManager(db=FakeDatabase(conn), premake=2, retention_days=90)
+
+        result = await manager.run_maintenance(now=now)
+
+        assert result["created"] == ["trends_p20260126", "trends_p20260511", "trends_p20260518"]
+        assert result["retired"] == ["trends_p20260126"]
+        ddl = "\n".join(conn.statements)
+        assert "DELETE FROM trends_default WHERE timestamp >= '2026-01-26" in ddl
+        assert "DELETE FROM trends_default WHERE timestamp >= '2026-05-18" in ddl
+        assert "CREATE TABLE IF NOT EXISTS trends_p20260511 PARTITION OF trends" in ddl
+        assert "DROP TABLE trends_p20260126" in ddl
+        # Rows beyond the premake horizon wait in the default partition
+        assert "20270104" not in ddl
@@ -0,0 +1,153 @@
+"""Trend storage and historical retrieval tests"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from src.models.trend import Trend, Platform
+from src.services.trend_storage import TrendCursor, build_trend_query
+
+
+BASE_TIME = datetime(2026, 2, 5, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def make_trend(index: int, platform: Platform = Platform.TWITTER, **overrides) -> Trend:
+    """Build a Trend row offset by ``index`` hours from BASE_TIME"""
+    values = {
+        "trend_id": uuid.uuid4(),
+        "topic_name": f"Topic {index}",
+        "platform": platform,
+        "engagement_metrics": {"likes": index * 100, "shares": index, "comments": index},
+        "trend_velocity": float(index),
+        "timestamp": BASE_TIME - timedelta(hours=index),
+        "relevance_score": 0.9,
+        "related_hashtags": [f"#topic{index}"],
+        "platform_trend_id": f"{platform.value}_trend_{index}",
+    }
+    values.update(overrides)
+    return Trend(**values)
+
+
+class TestTrendCursor:
+    """Test keyset cursor encoding"""
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor survives encode/decode"""
+        cursor = TrendCursor(BASE_TIME, uuid.uuid4())
+        assert TrendCursor.decode(cursor.encode()) == cursor
+
+    def test_invalid_cursor(self):
+        """Test that malformed cursors are rejected"""
+        with pytest.raises(ValueError):
+            TrendCursor.decode("not-a-cursor")
+
+
+class TestTrendQuery:
+    """Test historical trend query construction"""
+
+    def test_keyset_pages_cover_all_rows(self, db_session):
+        """Test that paging with cursors returns every row exactly once"""
+        db_session.add_all([make_trend(i) for i in range(25)])
+        # Rows sharing a timestamp are ordered by trend_id
+        db_session.add_all([make_trend(100 + i, timestamp=BASE_TIME) for i in range(5)])
+        db_session.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            page = db_session.execute(build_trend_query(cursor=cursor, limit=7)).scalars().all()
+            if not page:
+                break
+            seen.extend(page)
+            cursor = TrendCursor.from_trend(page[-1])
+
+        assert len(seen) == 30
+        assert len({t.trend_id for t in seen}) == 30
+        keys = [(t.timestamp, t.trend_id) for t in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    def test_filters(self, db_session):
+        """Test platform, relevance and date range filters"""
+        db_session.add_all([make_trend(i) for i in range(10)])
+        db_session.add_all([make_trend(i, Platform.TIKTOK) for i in range(10)])
+        db_session.add(make_trend(3, platform_trend_id="low", relevance_score=0.2))
+        db_session.commit()
+
+        query = build_trend_query(
+            platforms=[Platform.TIKTOK],
+            min_relevance=0.7,
+            start_date=BASE_TIME - timedelta(hours=5),
+            end_date=BASE_TIME - timedelta(hours=2),
+        )
+        trends = db_session.execute(query).scalars().all()
+
+        assert [t.topic_name for t in trends] == ["Topic 2", "Topic 3", "Topic 4", "Topic 5"]
+        assert all(t.platform == Platform.TIKTOK for t in trends)
+
+
+class TestTrendsEndpointPagination:
+    """Test cursor pagination through the trends API"""
+
+    def test_paginates_with_next_cursor(self, override_db_session, api_client):
+        """Test that next_cursor walks through all stored trends"""
+        session = sessionmaker(bind=override_db_session)()
+        session.add_all([make_trend(i) for i in range(5)])
+        session.commit()
+        session.close()
+
+        topics = []
+        params = {"platforms": "twitter", "limit": 2}
+        while True:
+            response = api_client.get("/api/v1/trends/", params=params)
+            assert response.status_code == 200
+            data = response.json()
+            topics.extend(t["topic_name"] for t in data["trends"])
+            if not data["next_cursor"]:
+                break
+            params["cursor"] = data["next_cursor"]
+
+        assert topics == [f"Topic {i}" for i in range(5)]
+
+    def test_invalid_cursor_rejected(self, override_db_session, api_client):
+        """Test that a malformed cursor returns 400"""
+        response = api_client.get("/api/v1/trends/", params={"cursor": "garbage"})
+        assert response.status_code == 400
+
+    def test_niche_rejected(self, override_db_session, api_client):
+        """Test that niche is refused rather than silently ignored"""
+        response = api_client.get("/api/v1/trends/", params={"niche": "fashion"})
+        assert response.status_code == 400
+        assert "niche" in response.json()["detail"]
+
+
+class TestJSONBFilters:
+    """Test that JSONB filters compile to index-compatible SQL"""
+
+    def _compile(self, query) -> str:
+        from sqlalchemy.dialects import postgresql
+        return str(query.compile(dialect=postgresql.dialect()))
+
+    def test_hashtag_containment(self):
+        """Test that hashtags use case-insensitive @> containment against normalized tags"""
+        from src.services.trend_storage import normalize_hashtag
+
+        query = build_trend_query(hashtags=["AIArt"])
+        sql = self._compile(query)
+        assert "CAST(lower(CAST(trends.related_hashtags AS TEXT)) AS JSONB) @>" in sql
+        assert ["#aiart"] in query.compile().params.values()
+        assert normalize_hashtag("AI") == "#AI"
+
+    def test_metric_expression_matches_index(self):
+        """Test that metric filters render the indexed expression with a literal key"""
+        sql = self._compile(build_trend_query(min_likes=10_000, min_views=5))
+        assert "CAST(trends.engagement_metrics ->> 'likes' AS NUMERIC) >=" in sql
+        assert "CAST(trends.engagement_metrics ->> 'views' AS NUMERIC) >=" in sql
+
+    def test_unindexed_metric_rejected(self):
+        """Test that only indexed metrics can be filtered"""
+        from src.services.trend_storage import metric_expression
+
+        with pytest.raises(ValueError):
+            metric_expression("shares")
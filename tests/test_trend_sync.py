@@ -0,0 +1,206 @@
+"""Delta trend sync tests"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.services.trend_discovery import BATCH_TOOL, PLATFORM_TOOLS, TrendDiscoveryService
+from src.services.trend_ingestion import BatchResult, IngestionSummary
+from src.services.trend_sync import FingerprintSet, TrendSyncService, trend_fingerprints
+from src.utils.error_handler import DatabaseError
+
+TOOL_PLATFORMS = {tool: platform for platform, tool in PLATFORM_TOOLS.items()}
+
+
+class RecordingSenseLogger:
+    def __init__(self):
+        self.activities = []
+
+    def log_activity(self, activity_type, component, details=None, trace_id=None):
+        self.activities.append((activity_type, details))
+
+    def log_trend_discovery(self, platform, trends_found, trace_id=None):
+        pass
+
+
+class StaticToolClient:
+    """Serves fixed trends per platform and records tool arguments"""
+
+    def __init__(self, trends, errors=()):
+        self.trends = trends
+        self.errors = set(errors)
+        self.arguments = []
+
+    def _fetch(self, platform, arguments):
+        self.arguments.append((platform, arguments))
+        if platform in self.errors:
+            return {"status": "error", "error": f"{platform} is down"}
+        return {"status": "ok", "trends": [dict(t) for t in self.trends.get(platform, [])]}
+
+    async def call_tool(self, tool_name, arguments):
+        if tool_name == BATCH_TOOL:
+            return {"status": "ok", "results": [self._fetch(s["platform"], s) for s in arguments["requests"]]}
+        return self._fetch(TOOL_PLATFORMS[tool_name], arguments)
+
+
+class RecordingIngestion:
+    """Collects ingested trends, or fails like a database outage"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.runs = []
+
+    async def ingest(self, trends, trace_id=None):
+        trends = list(trends)
+        if self.fail:
+            raise DatabaseError("connection refused", operation="trend_ingestion")
+        self.runs.append(trends)
+        return IngestionSummary(batches=[BatchResult(len(trends), len(trends), 0)] if trends else [])
+
+
+def sample(platform, count, likes=100):
+    return [
+        {"topic_name": f"{platform} topic {i}", "platform_trend_id": f"{platform}_{i}",
+         "engagement_metrics": {"likes": likes}, "related_hashtags": [f"#{platform}{i}"]}
+        for i in range(count)
+    ]
+
+
+def make_sync(client, ingestion, markers=None, limit=10):
+    service = TrendSyncService(
+        TrendDiscoveryService(client, sense_logger=RecordingSenseLogger()),
+        ingestion=ingestion,
+        limit=limit,
+        sense_logger=RecordingSenseLogger()
+    )
+    service.markers = dict(markers or {})
+    service.advanced = []
+
+    async def load_markers(platforms):
+        return {p: m for p, m in service.markers.items() if p in platforms}
+
+    async def advance_markers(markers):
+        service.advanced.append(sorted(markers))
+        service.markers.update(markers)
+
+    service.load_markers = load_markers
+    service.advance_markers = advance_markers
+    return service
+
+
+@pytest.mark.asyncio
+async def test_skips_unchanged_trends_and_reports_them():
+    """Test that repeated trends skip scoring and storage, and changed ones go through"""
+    client = StaticToolClient({"twitter": sample("twitter", 4), "tiktok": sample("tiktok", 3)})
+    ingestion = RecordingIngestion()
+    service = make_sync(client, ingestion)
+
+    first = await service.sync(["twitter", "tiktok"])
+    client.trends["twitter"][1]["engagement_metrics"] = {"likes": 5000}
+    second = await service.sync(["twitter", "tiktok"])
+
+    assert first.committed and first.unchanged == 0
+    assert [len(run) for run in ingestion.runs] == [7, 1]
+    assert ingestion.runs[1][0]["platform_trend_id"] == "twitter_1"
+    assert ingestion.runs[1][0]["relevance_score"] is not None
+    assert second.platforms["twitter"].unchanged == 3
+    assert second.platforms["tiktok"].unchanged == 3
+    event, details = service.sense_logger.activities[-1]
+    assert event == "trend_delta_sync"
+    assert details["trends_unchanged"] == 6
+    assert details["platforms"]["twitter"]["fetched"] == 4
+
+
+@pytest.mark.asyncio
+async def test_passes_since_markers_and_advances_after_commit():
+    """Test that markers reach the tools and only successful platforms move forward"""
+    synced = datetime(2026, 10, 18, 9, 30, tzinfo=timezone.utc)
+    client = StaticToolClient({"twitter": sample("twitter", 2)}, errors={"instagram"})
+    service = make_sync(client, RecordingIngestion(), markers={"twitter": synced})
+
+    report = await service.sync(["twitter", "instagram"])
+
+    arguments = dict(client.arguments)
+    assert arguments["twitter"]["since"] == "2026-10-18T09:30:00Z"
+    assert "since" not in arguments["instagram"]
+    assert service.advanced == [["twitter"]]
+    assert service.markers["twitter"] == report.started_at
+    assert report.platforms["instagram"].error == "instagram is down"
+
+
+@pytest.mark.asyncio
+async def test_truncated_result_advances_to_newest_returned_trend():
+    """Test that a platform capped at ``limit`` only advances as far as the trends it returned"""
+    synced = datetime(2026, 10, 18, 9, 0, tzinfo=timezone.utc)
+    trends = [
+        dict(t, timestamp=(synced + timedelta(minutes=i + 1)).isoformat())
+        for i, t in enumerate(sample("twitter", 3))
+    ]
+    client = StaticToolClient({"twitter": trends, "tiktok": sample("tiktok", 1)})
+    service = make_sync(client, RecordingIngestion(), markers={"twitter": synced}, limit=3)
+
+    report = await service.sync(["twitter", "tiktok"])
+
+    assert report.platforms["twitter"].truncated
+    assert not report.platforms["tiktok"].truncated
+    assert service.markers["twitter"] == synced + timedelta(minutes=3)
+    assert service.markers["tiktok"] == report.started_at
+    assert report.to_dict()["platforms"]["twitter"]["truncated"] is True
+
+
+@pytest.mark.asyncio
+async def test_failed_commit_keeps_markers_and_fingerprints():
+    """Test that nothing is marked as synced when storage fails, so the next cycle resends"""
+    client = StaticToolClient({"twitter": sample("twitter", 3)})
+    ingestion = RecordingIngestion(fail=True)
+    service = make_sync(client, ingestion)
+
+    failed = await service.sync(["twitter"])
+    ingestion.fail = False
+    retried = await service.sync(["twitter"])
+
+    assert not failed.committed
+    assert "connection refused" in failed.error
+    assert service.advanced == [["twitter"]]
+    assert retried.platforms["twitter"].unchanged == 0
+    assert len(ingestion.runs[0]) == 3
+
+
+@pytest.mark.asyncio
+async def test_social_media_server_honours_since():
+    """Test that the sample server only returns trends updated after the marker"""
+    from mcp_servers.social_media import server
+    from src.services.mcp_client import InProcessMCPClient
+
+    client = InProcessMCPClient(server)
+    since = datetime.now(timezone.utc) - timedelta(minutes=12)
+    service = TrendDiscoveryService(client, sense_logger=RecordingSenseLogger())
+
+    discovery = await service.discover(["twitter", "tiktok"], limit=5, batch=True, since={"twitter": since})
+    await client.disconnect()
+
+    assert len(discovery.results["twitter"].trends) == 3
+    assert len(discovery.results["tiktok"].trends) == 5
+    # Delta results come oldest update first, so a capped one continues from its last trend
+    timestamps = [t["timestamp"] for t in discovery.results["twitter"].trends]
+    assert timestamps == sorted(timestamps)
+
+
+def test_fingerprints_ignore_timestamps_and_expire():
+    """Test fingerprint stability and the fingerprint set's membership and expiry"""
+    trend = sample("twitter", 1)[0]
+    moved = dict(trend, timestamp="2026-10-18T10:00:00Z", trend_id="other")
+    changed = dict(trend, related_hashtags=["#new"])
+    fingerprints = trend_fingerprints([trend, moved, changed])
+    assert fingerprints[0] == fingerprints[1] != fingerprints[2]
+
+    seen = FingerprintSet(ttl=60)
+    seen.add("twitter", fingerprints[:1], now=1000)
+    assert seen.contains("twitter", fingerprints).tolist() == [True, True, False]
+    assert not seen.contains("tiktok", fingerprints).any()
+
+    seen.add("twitter", fingerprints[2:], now=1070)
+    assert seen.contains("twitter", fingerprints).tolist() == [False, False, True]
+    assert len(seen) == 1
+    assert seen.contains("twitter", np.array([], dtype=np.uint64)).shape == (0,)
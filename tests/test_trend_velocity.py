@@ -0,0 +1,223 @@
+"""Streaming trend velocity engine tests"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.services.trend_ingestion import STAGING_COLUMNS, TrendIngestionService
+from src.services.trend_velocity import VelocityEngine
+from src.utils.error_handler import DatabaseError
+
+T0 = 1_790_000_000.0
+KEY = ("twitter", "t1")
+
+
+class FakeRedisClient:
+    """In-memory stand-in for the AsyncRedisClient helpers the engine uses"""
+
+    def __init__(self, fail=False):
+        self.hashes = {}
+        self.fail = fail
+
+    async def execute_pipeline(self, commands):
+        if self.fail:
+            raise ConnectionError("Redis unavailable")
+        for command in commands:
+            if command[0] == "hset":
+                (key,), kwargs = command[1], command[2]
+                self.hashes.setdefault(key, {}).update(kwargs["mapping"])
+            else:
+                _, key, *fields = command
+                for field in fields:
+                    self.hashes.get(key, {}).pop(field, None)
+
+    async def hgetall(self, key):
+        if self.fail:
+            raise ConnectionError("Redis unavailable")
+        return dict(self.hashes.get(key, {}))
+
+
+class NullSenseLogger:
+    def log_trend_storage(self, trends_stored, trace_id=None, **kwargs):
+        pass
+
+
+class NullCache:
+    async def invalidate_platforms(self, platforms):
+        pass
+
+
+def observe(engine, key, minutes, count):
+    rates, accels = engine.observe([key], [T0 + minutes * 60], [count])
+    return rates[0], accels[0]
+
+
+def test_windowed_rate_and_acceleration():
+    """Test posts-per-hour over the window and its change per hour"""
+    engine = VelocityEngine(window=3600, client=None)
+
+    assert np.isnan(observe(engine, KEY, 0, 0)[0])
+    assert observe(engine, KEY, 30, 500)[0] == pytest.approx(1000)
+    rate, accel = observe(engine, KEY, 60, 1500)
+
+    assert rate == pytest.approx(1500)
+    assert accel == pytest.approx(1000)
+    # The t=0 observation has left the window; the rate is measured from t=30
+    assert observe(engine, KEY, 90, 2000)[0] == pytest.approx(1500)
+    # Polled less often than the window: measured from the previous observation
+    assert observe(engine, KEY, 300, 2700)[0] == pytest.approx(200)
+
+
+def test_matches_recomputation_from_full_history():
+    """Test ring-buffer results against recomputing every rate from raw history"""
+    rng = random.Random(5)
+    engine = VelocityEngine(window=1800, capacity=4, client=None)
+    history = {}
+    for step in range(2000):
+        key = ("tiktok", f"t{rng.randrange(30)}")
+        seen = history.setdefault(key, [])
+        minute = (seen[-1][0] if seen else 0) + rng.choice([5, 10, 20, 45])
+        count = (seen[-1][1] if seen else 0) + rng.randrange(0, 400)
+        rate, _ = observe(engine, key, minute, count)
+
+        earlier = seen[-3:]
+        seen.append((minute, count))
+        if not earlier:
+            assert np.isnan(rate)
+            continue
+        window = [(m, c) for m, c in earlier if m >= minute - 30] or earlier[-1:]
+        base_minute, base_count = window[0]
+        assert rate == pytest.approx((count - base_count) / ((minute - base_minute) / 60))
+
+
+def test_stale_repeated_and_reset_observations():
+    """Test ignored stale polls, in-order duplicates in one batch, and counter resets"""
+    engine = VelocityEngine(client=None)
+    observe(engine, KEY, 0, 100)
+    observe(engine, KEY, 60, 1100)
+
+    assert observe(engine, KEY, 30, 5000)[0] == pytest.approx(1000)
+
+    keys = [("tiktok", "a"), ("tiktok", "a"), ("tiktok", "a")]
+    rates, _ = engine.observe(keys, [T0, T0 + 1800, T0 + 3600], [0, 100, 400])
+    assert np.isnan(rates[0])
+    assert rates[1:].tolist() == pytest.approx([200, 400])
+
+    assert np.isnan(observe(engine, KEY, 120, 10)[0])
+    assert observe(engine, KEY, 180, 110)[0] == pytest.approx(100)
+
+
+def test_fill_sets_engagement_velocity_and_keeps_platform_units():
+    """Test that trend_velocity stays in the platform's posts per hour on every sighting"""
+    engine = VelocityEngine(client=None)
+    first = {"platform": "twitter", "platform_trend_id": "t1", "timestamp": "2026-10-18T10:00:00Z",
+             "engagement_metrics": {"likes": 100, "shares": 10, "views": 99999}, "trend_velocity": 42.0}
+    second = dict(first, timestamp="2026-10-18T10:15:00Z", engagement_metrics={"likes": 300, "shares": 60},
+                  trend_velocity=48.0)
+
+    assert engine.fill([first]) == 0
+    assert engine.fill([second]) == 1
+
+    # Posts per hour as reported on both sightings; engagement per hour only once there is history
+    assert [first["trend_velocity"], second["trend_velocity"]] == [42.0, 48.0]
+    assert "engagement_velocity" not in first
+    assert second["engagement_velocity"] == 1000.0
+    assert engine.get("twitter", "t1")[0] == pytest.approx(1000)
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_restores_warm():
+    """Test that a restarted engine computes velocity from its first poll"""
+    redis = FakeRedisClient()
+    engine = VelocityEngine(client=redis, idle_ttl=1e12)
+    observe(engine, KEY, 0, 0)
+    observe(engine, KEY, 30, 600)
+
+    assert await engine.checkpoint() == 1
+    assert await engine.checkpoint() == 0
+
+    restarted = VelocityEngine(client=redis, idle_ttl=1e12)
+    assert await restarted.restore() == 1
+    rate, accel = observe(restarted, KEY, 60, 1500)
+    assert rate == pytest.approx(1500)
+    assert accel == pytest.approx(600)
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_survives_redis_errors_and_prunes_idle():
+    """Test that failed checkpoints retry later and idle trends leave the hash"""
+    redis = FakeRedisClient(fail=True)
+    engine = VelocityEngine(client=redis, idle_ttl=1e12)
+    engine.observe([KEY], [T0], [10])
+
+    assert await engine.checkpoint() == 0
+    assert await VelocityEngine(client=redis).restore() == 0
+    redis.fail = False
+    assert await engine.checkpoint() == 1
+
+    engine.idle_ttl = 3600
+    assert engine.prune(now=T0 + 7200) == [KEY]
+    assert len(engine) == 0
+    await engine.checkpoint()
+    assert redis.hashes["chimera:velocity"] == {}
+
+
+@pytest.mark.asyncio
+async def test_ingestion_fills_velocity_without_database_reads(sample_trend_data, monkeypatch):
+    """Test that ingested records carry engine velocities and the run is checkpointed"""
+    redis = FakeRedisClient()
+    service = TrendIngestionService(
+        sense_logger=NullSenseLogger(),
+        response_cache=NullCache(),
+        velocity=VelocityEngine(client=redis, idle_ttl=1e12)
+    )
+    written = []
+
+    async def fake_copy_and_merge(records):
+        written.extend(records)
+        return len(records), 0
+
+    monkeypatch.setattr(service, "_copy_and_merge", fake_copy_and_merge)
+    earlier = dict(sample_trend_data, timestamp="2026-10-18T10:00:00Z", engagement_metrics={"likes": 1000})
+    later = dict(sample_trend_data, timestamp="2026-10-18T10:30:00Z", engagement_metrics={"likes": 2000})
+
+    summary = await service.ingest([earlier, later])
+
+    assert summary.velocities_computed == 1
+    assert written[1][STAGING_COLUMNS.index("engagement_velocity")] == 2000.0
+    assert written[1][STAGING_COLUMNS.index("trend_velocity")] == sample_trend_data["trend_velocity"]
+    assert redis.hashes["chimera:velocity"]
+
+
+@pytest.mark.asyncio
+async def test_failed_write_rolls_back_velocity(sample_trend_data, monkeypatch):
+    """Test that a batch whose merge fails leaves the engine as it was, so the retry gets a velocity"""
+    redis = FakeRedisClient()
+    engine = VelocityEngine(client=redis, idle_ttl=1e12)
+    service = TrendIngestionService(sense_logger=NullSenseLogger(), response_cache=NullCache(), velocity=engine)
+    fail = [True]
+
+    async def flaky_copy_and_merge(records):
+        if fail[0]:
+            raise ConnectionError("connection refused")
+        return len(records), 0
+
+    monkeypatch.setattr(service, "_copy_and_merge", flaky_copy_and_merge)
+    earlier = dict(sample_trend_data, timestamp="2026-10-18T10:00:00Z", engagement_metrics={"likes": 1000})
+    later = dict(sample_trend_data, timestamp="2026-10-18T10:30:00Z", engagement_metrics={"likes": 2000})
+    new = dict(sample_trend_data, platform_trend_id="t-new", timestamp="2026-10-18T10:30:00Z")
+    fail[0] = False
+    await service.ingest([earlier])
+    fail[0] = True
+
+    with pytest.raises(DatabaseError):
+        await service.ingest_batch([dict(later), dict(new)])
+    assert engine.get("twitter", "t-new") == (None, None)
+    assert len(engine) == 1
+    assert not engine._dirty
+    fail[0] = False
+    result = await service.ingest_batch([dict(later), dict(new)])
+
+    assert result.velocities_computed == 1
+    assert engine.get("twitter", sample_trend_data["platform_trend_id"])[0] == 2000.0